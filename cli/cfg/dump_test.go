@@ -76,7 +76,22 @@ tt:
     log_maxsize: 1024
     log_maxage: 8
     log_maxbackups: 10
+    log_passthrough: false
+    log_compress: ""
+    log_compress_level: 0
+    log_compress_jobs: 1
+    log_maxtotalsize: 0
     restart_on_failure: false
+    restart_backoff_min: 1
+    restart_backoff_max: 60
+    restart_backoff_factor: 2
+    restart_min_uptime: 60
+    crash_loop_threshold: 10
+    probe_interval: 0
+    probe_timeout: 5
+    probe_max_failures: 3
+    cpuset: ""
+    numa_node: null
     wal_dir: %[1]s/var/lib
     memtx_dir: %[1]s/var/lib
     vinyl_dir: %[1]s/var/lib
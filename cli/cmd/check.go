@@ -1,6 +1,9 @@
 package cmd
 
 import (
+	"fmt"
+	"strings"
+
 	"github.com/apex/log"
 	"github.com/spf13/cobra"
 	"github.com/tarantool/tt/cli/cmdcontext"
@@ -8,6 +11,13 @@ import (
 	"github.com/tarantool/tt/cli/running"
 )
 
+var (
+	// checkJobs is the number of files checked in parallel.
+	checkJobs int
+	// checkNoCache disables the cache of the checked files.
+	checkNoCache bool
+)
+
 // NewCheckCmd creates a new check command.
 func NewCheckCmd() *cobra.Command {
 	var checkCmd = &cobra.Command{
@@ -21,6 +31,11 @@ func NewCheckCmd() *cobra.Command {
 		},
 	}
 
+	checkCmd.Flags().IntVarP(&checkJobs, "jobs", "j", 0,
+		"number of files checked in parallel, 0 - the number of CPUs")
+	checkCmd.Flags().BoolVar(&checkNoCache, "no-cache", false,
+		"check all the files, even if the files with the same content have been checked")
+
 	return checkCmd
 }
 
@@ -31,27 +46,42 @@ func internalCheckModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 		return err
 	}
 
-	// Сollect a list of instances with unique scripts.
-	uniqueInst := []running.InstanceCtx{}
+	// Сollect a list of unique scripts.
+	appPaths := []string{}
+	seen := map[string]bool{}
 	for _, inst := range runningCtx.Instances {
-		found := false
-		for _, unique := range uniqueInst {
-			if inst.AppPath == unique.AppPath {
-				found = true
-				break
-			}
+		if !seen[inst.AppPath] {
+			seen[inst.AppPath] = true
+			appPaths = append(appPaths, inst.AppPath)
 		}
+	}
 
-		if !found {
-			uniqueInst = append(uniqueInst, inst)
+	cacheFile := ""
+	if !checkNoCache {
+		var err error
+		if cacheFile, err = running.GetCheckCacheFile(); err != nil {
+			log.Debugf("The check cache is disabled: %s", err)
 		}
 	}
+	cache := running.LoadCheckCache(cacheFile, cmdCtx.Cli.TarantoolExecutable)
+
+	results := running.CheckFiles(cmdCtx, appPaths, checkJobs, cache)
+	if err := cache.Save(); err != nil {
+		log.Warnf("Failed to save the check cache: %s", err)
+	}
 
-	for _, inst := range uniqueInst {
-		if err := running.Check(cmdCtx, &inst); err != nil {
-			return err
+	failed := 0
+	for _, result := range results {
+		if result.Err != nil {
+			log.Errorf("Result of check: file '%s': %s", result.AppPath,
+				strings.TrimSpace(result.Err.Error()))
+			failed++
+			continue
 		}
-		log.Infof("Result of check: syntax of file '%s' is OK", inst.AppPath)
+		log.Infof("Result of check: syntax of file '%s' is OK", result.AppPath)
+	}
+	if failed > 0 {
+		return fmt.Errorf("the check failed for %d of %d file(s)", failed, len(results))
 	}
 
 	return nil
@@ -2,8 +2,12 @@ package cmd
 
 import (
 	"fmt"
+	"io/fs"
 	"os"
 	"path/filepath"
+	"runtime"
+	"sync"
+	"time"
 
 	"github.com/apex/log"
 	"github.com/spf13/cobra"
@@ -14,7 +18,20 @@ import (
 	"github.com/tarantool/tt/cli/util"
 )
 
-var forceRemove bool
+// minRemoveCost is the amount of data the removal of a file is accounted
+// as by the rate limit, so the removal of many small files is limited too.
+const minRemoveCost = 4096
+
+var (
+	forceRemove bool
+	// cleanJobs is the number of files removed in parallel.
+	cleanJobs int
+	// cleanRate is the maximum rate of the removed data in MiB per second.
+	cleanRate float64
+	// cleanSummary enables printing of the files count and size instead
+	// of the list of the files.
+	cleanSummary bool
+)
 
 // NewCleanCmd creates clean command.
 func NewCleanCmd() *cobra.Command {
@@ -29,19 +46,101 @@ func NewCleanCmd() *cobra.Command {
 	}
 
 	cleanCmd.Flags().BoolVarP(&forceRemove, "force", "f", false, "do not ask for confirmation")
+	cleanCmd.Flags().IntVarP(&cleanJobs, "jobs", "j", 0,
+		"number of files removed in parallel, 0 - the number of CPUs")
+	cleanCmd.Flags().Float64Var(&cleanRate, "rate", 0,
+		"maximum rate of the removed data in MiB per second, 0 - no limit")
+	cleanCmd.Flags().BoolVar(&cleanSummary, "summary", false,
+		"print the count and size of the files instead of the list of the files")
 
 	return cleanCmd
 }
 
-func collectFiles(list []string, dirname string) ([]string, error) {
-	err := filepath.Walk(dirname,
-		func(path string, info os.FileInfo, err error) error {
+// cleanFile is a file to remove.
+type cleanFile struct {
+	// path is the path to the file.
+	path string
+	// size is the size of the file in bytes.
+	size int64
+}
+
+// cleanTask describes the files of the instance to remove.
+type cleanTask struct {
+	// run is the instance to clean.
+	run *running.InstanceCtx
+	// files are the files to remove.
+	files []cleanFile
+	// size is the total size of the files.
+	size int64
+	// err is the first error of the files collection or removal.
+	err error
+	// errMutex protects err from concurrent removals.
+	errMutex sync.Mutex
+}
+
+// setErr saves the error if it is the first error of the task.
+func (task *cleanTask) setErr(err error) {
+	task.errMutex.Lock()
+	defer task.errMutex.Unlock()
+	if task.err == nil {
+		task.err = err
+	}
+}
+
+// rateLimiter limits the rate of the removed data. The removals are
+// spread over time instead of being done in bursts.
+type rateLimiter struct {
+	// rate is the limit in bytes per second.
+	rate float64
+	// next is the time the next removal is allowed at.
+	next time.Time
+	// mutex protects next from concurrent removals.
+	mutex sync.Mutex
+}
+
+// newRateLimiter creates a rate limiter, it is nil if there is no limit.
+func newRateLimiter(rate float64) *rateLimiter {
+	if rate <= 0 {
+		return nil
+	}
+	return &rateLimiter{rate: rate}
+}
+
+// wait waits for the removal of the data of the size to be allowed.
+func (limiter *rateLimiter) wait(size int64) {
+	if limiter == nil {
+		return
+	}
+	if size < minRemoveCost {
+		size = minRemoveCost
+	}
+
+	limiter.mutex.Lock()
+	now := time.Now()
+	if limiter.next.Before(now) {
+		limiter.next = now
+	}
+	start := limiter.next
+	limiter.next = start.Add(time.Duration(float64(size) / limiter.rate * float64(time.Second)))
+	limiter.mutex.Unlock()
+
+	time.Sleep(time.Until(start))
+}
+
+// collectFiles returns the files of the directory with their sizes.
+func collectFiles(list []cleanFile, dirname string) ([]cleanFile, error) {
+	err := filepath.WalkDir(dirname,
+		func(path string, entry fs.DirEntry, err error) error {
 			if err != nil {
 				return err
 			}
 
-			if !info.IsDir() {
-				list = append(list, path)
+			if !entry.IsDir() {
+				info, err := entry.Info()
+				if err != nil {
+					return err
+				}
+				list = append(list, cleanFile{path, info.Size()})
 			}
 			return nil
 		})
@@ -52,47 +151,103 @@ func collectFiles(list []string, dirname string) ([]string, error) {
 	return list, nil
 }
 
-func clean(run *running.InstanceCtx) error {
-	removeList := []string{}
-	confirm := false
-	var err error
-
+// collectTaskFiles collects the files of the instance directories. The data
+// directories are the same by default, each directory and file is collected
+// once.
+func collectTaskFiles(task *cleanTask) {
+	run := task.run
+	walkedDirs := map[string]bool{}
 	for _, dir := range [...]string{run.LogDir, run.WalDir, run.VinylDir, run.MemtxDir} {
-		removeList, err = collectFiles(removeList, dir)
-		if err != nil {
-			return err
+		dir = filepath.Clean(dir)
+		if walkedDirs[dir] {
+			continue
+		}
+		walkedDirs[dir] = true
+		var err error
+		if task.files, err = collectFiles(task.files, dir); err != nil {
+			task.err = err
+			return
 		}
 	}
 
-	if len(removeList) == 0 {
-		log.Infof("Already cleaned.\n")
-		return nil
+	// The directories could be nested.
+	collected := map[string]bool{}
+	files := task.files[:0]
+	for _, file := range task.files {
+		if !collected[file.path] {
+			collected[file.path] = true
+			files = append(files, file)
+			task.size += file.size
+		}
 	}
+	task.files = files
+}
+
+// formatSize returns the size in MiB.
+func formatSize(size int64) string {
+	return fmt.Sprintf("%.1f MiB", float64(size)/(1024*1024))
+}
 
-	log.Infof("List of files to delete:\n")
-	for _, file := range removeList {
-		log.Infof("%s", file)
+// confirmClean prints the files of the instance and asks for confirmation.
+func confirmClean(task *cleanTask) (bool, error) {
+	if len(task.files) == 0 {
+		log.Infof("Already cleaned.\n")
+		return false, nil
 	}
 
-	if !forceRemove {
-		confirm, err = util.AskConfirm(os.Stdin, "\nConfirm")
-		if err != nil {
-			return err
+	if cleanSummary {
+		log.Infof("%s: %d files to delete, %s", task.run.InstName, len(task.files),
+			formatSize(task.size))
+	} else {
+		log.Infof("List of files to delete:\n")
+		for _, file := range task.files {
+			log.Infof("%s", file.path)
 		}
 	}
 
-	if confirm || forceRemove {
-		for _, file := range removeList {
-			err = os.Remove(file)
-			if err != nil {
-				return err
-			}
-		}
+	if forceRemove {
+		return true, nil
+	}
+	confirm, err := util.AskConfirm(os.Stdin, "\nConfirm")
+	if err != nil {
+		return false, err
+	}
+	if !confirm {
+		return false, fmt.Errorf("canceled by user")
+	}
+	return true, nil
+}
 
-		return nil
+// removeFiles removes the files of the tasks by cleanJobs workers. The
+// files of different instances and directories are removed in parallel.
+func removeFiles(tasks []*cleanTask, jobs int, limiter *rateLimiter) {
+	type removal struct {
+		task *cleanTask
+		file *cleanFile
 	}
 
-	return fmt.Errorf("canceled by user")
+	removals := make(chan removal, jobs)
+	var wg sync.WaitGroup
+	for i := 0; i < jobs; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for removal := range removals {
+				limiter.wait(removal.file.size)
+				if err := os.Remove(removal.file.path); err != nil {
+					removal.task.setErr(err)
+				}
+			}
+		}()
+	}
+
+	for _, task := range tasks {
+		for i := range task.files {
+			removals <- removal{task, &task.files[i]}
+		}
+	}
+	close(removals)
+	wg.Wait()
 }
 
 // internalCleanModule is a default clean module.
@@ -102,22 +257,69 @@ func internalCleanModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 		return err
 	}
 
-	for _, run := range runningCtx.Instances {
-		status := running.Status(&run)
+	jobs := cleanJobs
+	if jobs < 1 {
+		jobs = runtime.NumCPU()
+	}
+
+	tasks := []*cleanTask{}
+	for i := range runningCtx.Instances {
+		run := &runningCtx.Instances[i]
+		status := running.Status(run)
 		if status.Code == process_utils.ProcessStoppedCode {
-			var statusMsg string
+			tasks = append(tasks, &cleanTask{run: run})
+		} else {
+			log.Infof("instance `%s` must be stopped", run.InstName)
+		}
+	}
 
-			err := clean(&run)
+	// The directories of the instances are walked in parallel.
+	var wg sync.WaitGroup
+	slots := make(chan struct{}, jobs)
+	for _, task := range tasks {
+		wg.Add(1)
+		slots <- struct{}{}
+		go func(task *cleanTask) {
+			defer func() {
+				<-slots
+				wg.Done()
+			}()
+			collectTaskFiles(task)
+		}(task)
+	}
+	wg.Wait()
+
+	// The confirmation is asked for each instance, then the files of all
+	// the confirmed instances are removed at once.
+	confirmedTasks := []*cleanTask{}
+	for _, task := range tasks {
+		if task.err == nil {
+			confirmed, err := confirmClean(task)
 			if err != nil {
-				statusMsg = "[ERR] " + err.Error()
-			} else {
-				statusMsg = "[OK]"
+				task.err = err
+			} else if confirmed {
+				confirmedTasks = append(confirmedTasks, task)
 			}
+		}
+	}
+	removeFiles(confirmedTasks, jobs, newRateLimiter(cleanRate*1024*1024))
 
-			log.Infof("%s: cleaning...\t%s", run.InstName, statusMsg)
+	var removedCount int
+	var removedSize int64
+	for _, task := range tasks {
+		var statusMsg string
+		if task.err != nil {
+			statusMsg = "[ERR] " + task.err.Error()
 		} else {
-			log.Infof("instance `%s` must be stopped", run.InstName)
+			statusMsg = "[OK]"
+			removedCount += len(task.files)
+			removedSize += task.size
 		}
+
+		log.Infof("%s: cleaning...\t%s", task.run.InstName, statusMsg)
+	}
+	if cleanSummary {
+		log.Infof("Removed %d files, %s.", removedCount, formatSize(removedSize))
 	}
 
 	return nil
@@ -0,0 +1,81 @@
+package cmd
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"github.com/tarantool/tt/cli/running"
+)
+
+func TestCleanCollectAndRemoveFiles(t *testing.T) {
+	dir := t.TempDir()
+	require.NoError(t, os.MkdirAll(filepath.Join(dir, "sub"), 0755))
+	require.NoError(t, os.WriteFile(filepath.Join(dir, "a.log"), []byte("12345"), 0644))
+	require.NoError(t, os.WriteFile(filepath.Join(dir, "sub", "b.run"), []byte("123"), 0644))
+
+	files, err := collectFiles([]cleanFile{}, dir)
+	require.NoError(t, err)
+	assert.ElementsMatch(t, []cleanFile{
+		{filepath.Join(dir, "a.log"), 5},
+		{filepath.Join(dir, "sub", "b.run"), 3},
+	}, files)
+
+	_, err = collectFiles([]cleanFile{}, filepath.Join(dir, "missing"))
+	assert.Error(t, err)
+
+	task := &cleanTask{files: files}
+	missingTask := &cleanTask{files: []cleanFile{{filepath.Join(dir, "missing"), 0}}}
+	removeFiles([]*cleanTask{task, missingTask}, 2, nil)
+	assert.NoError(t, task.err)
+	assert.Error(t, missingTask.err)
+	assert.NoFileExists(t, filepath.Join(dir, "a.log"))
+	assert.NoFileExists(t, filepath.Join(dir, "sub", "b.run"))
+}
+
+func TestCleanCollectTaskFilesSameDirs(t *testing.T) {
+	dir := t.TempDir()
+	dataDir := filepath.Join(dir, "data")
+	logDir := filepath.Join(dataDir, "log")
+	require.NoError(t, os.MkdirAll(logDir, 0755))
+	require.NoError(t, os.WriteFile(filepath.Join(logDir, "a.log"), []byte("12"), 0644))
+	require.NoError(t, os.WriteFile(filepath.Join(dataDir, "b.snap"), []byte("123"), 0644))
+	require.NoError(t, os.WriteFile(filepath.Join(dataDir, "c.xlog"), []byte("1234"), 0644))
+
+	// The data directories are the same, the log directory is nested.
+	task := &cleanTask{run: &running.InstanceCtx{
+		LogDir:   logDir,
+		WalDir:   dataDir,
+		VinylDir: dataDir + "/",
+		MemtxDir: dataDir,
+	}}
+	collectTaskFiles(task)
+	require.NoError(t, task.err)
+	assert.ElementsMatch(t, []cleanFile{
+		{filepath.Join(logDir, "a.log"), 2},
+		{filepath.Join(dataDir, "b.snap"), 3},
+		{filepath.Join(dataDir, "c.xlog"), 4},
+	}, task.files)
+	assert.Equal(t, int64(9), task.size)
+
+	removeFiles([]*cleanTask{task}, 4, nil)
+	assert.NoError(t, task.err)
+	assert.NoFileExists(t, filepath.Join(dataDir, "b.snap"))
+}
+
+func TestCleanRateLimiter(t *testing.T) {
+	assert.Nil(t, newRateLimiter(0))
+
+	// 10 removals of the minimum cost at 100 removals per second.
+	limiter := newRateLimiter(100 * minRemoveCost)
+	start := time.Now()
+	for i := 0; i < 10; i++ {
+		limiter.wait(1)
+	}
+	elapsed := time.Since(start)
+	assert.GreaterOrEqual(t, elapsed, 90*time.Millisecond)
+	assert.Less(t, elapsed, time.Second)
+}
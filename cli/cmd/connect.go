@@ -6,6 +6,7 @@ import (
 	"regexp"
 	"strings"
 	"syscall"
+	"time"
 
 	"github.com/apex/log"
 	"github.com/spf13/cobra"
@@ -34,6 +35,15 @@ var (
 	connectSslCaFile   string
 	connectSslCiphers  string
 	connectInteractive bool
+	// connectAll enables the execution on all the specified instances.
+	connectAll bool
+	// connectJobs is the maximum number of instances the script is executed
+	// on at the same time.
+	connectJobs int
+	// connectTimeout is the maximum time of the execution on an instance.
+	connectTimeout time.Duration
+	// connectArgsLenAtDash is the number of the arguments before "--".
+	connectArgsLenAtDash int
 )
 
 // NewConnectCmd creates connect command.
@@ -44,7 +54,9 @@ func NewConnectCmd() *cobra.Command {
 			"  COMMAND | tt connect (<APP_NAME> | <APP_NAME:INSTANCE_NAME> | <URI>)" +
 			" [flags]\n" +
 			"  COMMAND | tt connect (<APP_NAME> | <APP_NAME:INSTANCE_NAME> | <URI>)" +
-			" [flags] [-f-] [-- ARGS]",
+			" [flags] [-f-] [-- ARGS]\n" +
+			"  tt connect --all (<APP_NAME> | <APP_NAME:INSTANCE_NAME> | <URI>)..." +
+			" -f <FILE> [flags] [-- ARGS]",
 		Short: "Connect to the tarantool instance",
 		Long: "Connect to the tarantool instance.\n\n" +
 			"The command supports the following environment variables:\n\n" +
@@ -53,9 +65,15 @@ func NewConnectCmd() *cobra.Command {
 			"\n" +
 			"You could pass command line arguments to the interpreted SCRIPT" +
 			" or COMMAND passed via -f flag:\n\n" +
-			`echo "print(...)" | tt connect user@pass:localhost:3013 -f- 1, 2, 3`,
+			`echo "print(...)" | tt connect user@pass:localhost:3013 -f- 1, 2, 3` +
+			"\n\n" +
+			"With --all flag the SCRIPT is executed concurrently on all instances of" +
+			" the applications, the instances and the URIs, the results are tagged by" +
+			" the instance:\n\n" +
+			"tt connect --all app1 app2:router localhost:3013 -f script.lua",
 		Run: func(cmd *cobra.Command, args []string) {
 			cmdCtx.CommandName = cmd.Name()
+			connectArgsLenAtDash = cmd.ArgsLenAtDash()
 			err := modules.RunCmd(&cmdCtx, cmd.CommandPath(), &modulesInfo,
 				internalConnectModule, args)
 			handleCmdErr(cmd, err)
@@ -81,6 +99,13 @@ func NewConnectCmd() *cobra.Command {
 		`colon-separated (:) list of SSL cipher suites the connection`)
 	connectCmd.Flags().BoolVarP(&connectInteractive, "interactive", "i",
 		false, `enter interactive mode after executing 'FILE'`)
+	connectCmd.Flags().BoolVar(&connectAll, "all", false,
+		"execute 'FILE' on all the specified instances concurrently")
+	connectCmd.Flags().IntVarP(&connectJobs, "jobs", "j", 8,
+		"maximum number of instances 'FILE' is executed on at the same time"+
+			" with --all, 0 - no limit")
+	connectCmd.Flags().DurationVar(&connectTimeout, "timeout", 30*time.Second,
+		"maximum time of the execution on an instance with --all, 0 - no timeout")
 
 	return connectCmd
 }
@@ -185,6 +210,96 @@ func resolveConnectOpts(cmdCtx *cmdcontext.CmdCtx, cliOpts *config.CliOpts,
 	}
 }
 
+// resolveEvalTargets resolves the arguments to the instances to execute the
+// script on. An argument is an application, an instance or a URI.
+func resolveEvalTargets(cmdCtx *cmdcontext.CmdCtx, cliOpts *config.CliOpts,
+	connectCtx *connect.ConnectCtx, args []string) ([]connect.EvalTarget, error) {
+	targets := []connect.EvalTarget{}
+	resolved := map[string]bool{}
+	addTarget := func(name string, connString string) {
+		if !resolved[connString] {
+			resolved[connString] = true
+			targets = append(targets, connect.EvalTarget{Name: name, ConnString: connString})
+		}
+	}
+
+	for _, arg := range args {
+		var runningCtx running.RunningCtx
+		fillErr := running.FillCtx(cliOpts, cmdCtx, &runningCtx, []string{arg})
+		if fillErr == nil {
+			if connectCtx.Username != "" || connectCtx.Password != "" {
+				return nil, fmt.Errorf("username and password are not supported" +
+					" with a connection via a control socket")
+			}
+			for _, run := range runningCtx.Instances {
+				addTarget(running.GetAppInstanceName(run), run.ConsoleSocket)
+			}
+		} else if isCredentialsURI(arg) || isBaseURI(arg) {
+			uri, _, _ := parseCredentialsURI(arg)
+			addTarget(uri, arg)
+		} else {
+			return nil, fillErr
+		}
+	}
+
+	// Environment variables do not overwrite values.
+	if connectCtx.Username == "" {
+		connectCtx.Username = os.Getenv(usernameEnv)
+	}
+	if connectCtx.Password == "" {
+		connectCtx.Password = os.Getenv(passwordEnv)
+	}
+	return targets, nil
+}
+
+// evalAll executes the script on all the instances specified by the
+// arguments and prints the results tagged by the instance.
+func evalAll(cmdCtx *cmdcontext.CmdCtx, connectCtx connect.ConnectCtx, args []string) error {
+	if connectFile == "" {
+		return util.NewArgError("--all requires a script to be specified with -f")
+	}
+	if connectInteractive {
+		return util.NewArgError("--all can't be used with --interactive")
+	}
+
+	targetArgs, scriptArgs := args, []string{}
+	if connectArgsLenAtDash >= 0 {
+		targetArgs, scriptArgs = args[:connectArgsLenAtDash], args[connectArgsLenAtDash:]
+	}
+	if len(targetArgs) == 0 {
+		return util.NewArgError("specify the instances to execute the script on")
+	}
+	targets, err := resolveEvalTargets(cmdCtx, cliOpts, &connectCtx, targetArgs)
+	if err != nil {
+		return err
+	}
+
+	results, err := connect.EvalAll(connectCtx, targets, scriptArgs, connect.EvalAllOpts{
+		Jobs:    connectJobs,
+		Timeout: connectTimeout,
+	})
+	if err != nil {
+		return err
+	}
+
+	failed := 0
+	for _, result := range results {
+		if result.Err != nil {
+			log.Errorf("%s: %s", result.Name, result.Err)
+			failed++
+			continue
+		}
+		// "Printf" is used instead of "log..." to print the result without
+		// any decoration.
+		fmt.Printf("%s:\n%s\n", result.Name, result.Result)
+	}
+	if failed > 0 {
+		return fmt.Errorf("failed to execute the script on %d of %d instances",
+			failed, len(results))
+	}
+	return nil
+}
+
 // internalConnectModule is a default connect module.
 func internalConnectModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 	connectCtx := connect.ConnectCtx{
@@ -203,6 +318,10 @@ func internalConnectModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 		return util.NewArgError(fmt.Sprintf("unsupported language: %s", connectLanguage))
 	}
 
+	if connectAll {
+		return evalAll(cmdCtx, connectCtx, args)
+	}
+
 	newArgs, err := resolveConnectOpts(cmdCtx, cliOpts, &connectCtx, args)
 	if err != nil {
 		return err
@@ -0,0 +1,113 @@
+package cmd
+
+import (
+	"fmt"
+	"os"
+	"regexp"
+	"time"
+
+	"github.com/spf13/cobra"
+	"github.com/tarantool/tt/cli/cmdcontext"
+	"github.com/tarantool/tt/cli/modules"
+	"github.com/tarantool/tt/cli/running"
+	"github.com/tarantool/tt/cli/tail"
+)
+
+// tailOpts contains the options of the log command.
+var tailOpts = tail.TailOpts{
+	Lines:  10,
+	Follow: false,
+}
+
+var (
+	// grepOpts contains the options of the log grep command.
+	grepOpts tail.GrepOpts
+	// grepSince is the value of the --since option.
+	grepSince string
+	// grepUntil is the value of the --until option.
+	grepUntil string
+)
+
+// newLogGrepCmd creates log grep command.
+func newLogGrepCmd() *cobra.Command {
+	var grepCmd = &cobra.Command{
+		Use:   "grep <PATTERN> [<APP_NAME> | <APP_NAME:INSTANCE_NAME>]",
+		Short: "Search the current and rotated logs of the tarantool instance(s)",
+		Args:  cobra.MinimumNArgs(1),
+		Run: func(cmd *cobra.Command, args []string) {
+			cmdCtx.CommandName = cmd.Name()
+			err := modules.RunCmd(&cmdCtx, cmd.CommandPath(), &modulesInfo,
+				internalLogGrepModule, args)
+			handleCmdErr(cmd, err)
+		},
+	}
+
+	grepCmd.Flags().StringVar(&grepSince, "since", "",
+		`skip the lines older than the time ("2006-01-02 15:04:05") or the duration ago (1h)`)
+	grepCmd.Flags().StringVar(&grepUntil, "until", "",
+		`skip the lines newer than the time ("2006-01-02 15:04:05") or the duration ago (1h)`)
+	grepCmd.Flags().IntVarP(&grepOpts.Jobs, "jobs", "j", 0,
+		"number of the log files searched in parallel, 0 - the number of CPUs")
+
+	return grepCmd
+}
+
+// NewLogCmd creates log command.
+func NewLogCmd() *cobra.Command {
+	var logCmd = &cobra.Command{
+		Use:   "log [<APP_NAME> | <APP_NAME:INSTANCE_NAME>]",
+		Short: "Print the log of the tarantool instance(s)",
+		Run: func(cmd *cobra.Command, args []string) {
+			cmdCtx.CommandName = cmd.Name()
+			err := modules.RunCmd(&cmdCtx, cmd.CommandPath(), &modulesInfo,
+				internalLogModule, args)
+			handleCmdErr(cmd, err)
+		},
+	}
+
+	logCmd.Flags().IntVarP(&tailOpts.Lines, "lines", "n", tailOpts.Lines,
+		"number of the last lines of each log to print")
+	logCmd.Flags().BoolVarP(&tailOpts.Follow, "follow", "f", tailOpts.Follow,
+		"print the lines appended to the logs until interrupted")
+
+	logCmd.AddCommand(newLogGrepCmd())
+
+	return logCmd
+}
+
+// internalLogModule is a default log module.
+func internalLogModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
+	var runningCtx running.RunningCtx
+	if err := running.FillCtx(cliOpts, cmdCtx, &runningCtx, args); err != nil {
+		return err
+	}
+
+	return tail.Run(runningCtx.Instances, tailOpts, os.Stdout)
+}
+
+// internalLogGrepModule is a default log grep module.
+func internalLogGrepModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
+	if len(args) < 1 {
+		return fmt.Errorf("the pattern to search for is not specified")
+	}
+	pattern, err := regexp.Compile(args[0])
+	if err != nil {
+		return fmt.Errorf("invalid pattern: %s", err)
+	}
+	grepOpts.Pattern = pattern
+
+	now := time.Now()
+	if grepOpts.Since, err = tail.ParseTimeBound(grepSince, now); err != nil {
+		return err
+	}
+	if grepOpts.Until, err = tail.ParseTimeBound(grepUntil, now); err != nil {
+		return err
+	}
+
+	var runningCtx running.RunningCtx
+	if err := running.FillCtx(cliOpts, cmdCtx, &runningCtx, args[1:]); err != nil {
+		return err
+	}
+
+	return tail.Grep(runningCtx.Instances, grepOpts, os.Stdout)
+}
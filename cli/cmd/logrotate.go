@@ -1,13 +1,35 @@
 package cmd
 
 import (
+	"fmt"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"syscall"
+
 	"github.com/apex/log"
 	"github.com/spf13/cobra"
 	"github.com/tarantool/tt/cli/cmdcontext"
 	"github.com/tarantool/tt/cli/modules"
+	"github.com/tarantool/tt/cli/process_utils"
 	"github.com/tarantool/tt/cli/running"
+	"github.com/tarantool/tt/cli/ttlog"
+)
+
+const (
+	// logCompressLogFileName is the name of the log file of the rotated logs
+	// compression worker in the log directory.
+	logCompressLogFileName = "tt_logrotate.log"
+	// logCompressPIDFileName is the name of the PID file of the rotated logs
+	// compression worker in the run directory.
+	logCompressPIDFileName = "tt_logrotate.pid"
 )
 
+// logrotateCompress runs the rotated logs compression worker. The rotated
+// logs are compressed in a detached process, so tt logrotate does not wait
+// for them.
+var logrotateCompress bool
+
 // NewLogrotateCmd creates logrotate command.
 func NewLogrotateCmd() *cobra.Command {
 	var logrotateCmd = &cobra.Command{
@@ -21,9 +43,56 @@ func NewLogrotateCmd() *cobra.Command {
 		},
 	}
 
+	logrotateCmd.Flags().BoolVar(&logrotateCompress, "compress", false, "")
+	logrotateCmd.Flags().MarkHidden("compress")
+
 	return logrotateCmd
 }
 
+// launchCompressWorker starts the detached rotated logs compression worker
+// process. The worker output is appended to the log file in the log
+// directory.
+func launchCompressWorker(args []string) error {
+	ttBin, err := os.Executable()
+	if err != nil {
+		return err
+	}
+	if err = os.MkdirAll(cliOpts.App.LogDir, 0755); err != nil {
+		return err
+	}
+	logPath := filepath.Join(cliOpts.App.LogDir, logCompressLogFileName)
+	logFile, err := os.OpenFile(logPath, os.O_WRONLY|os.O_CREATE|os.O_APPEND, 0644)
+	if err != nil {
+		return err
+	}
+	defer logFile.Close()
+
+	workerCmd := exec.Command(ttBin, append([]string{"logrotate", "--compress"}, args...)...)
+	workerCmd.Stdout = logFile
+	workerCmd.Stderr = logFile
+	// The worker is not interrupted with tt by the terminal signals.
+	workerCmd.SysProcAttr = &syscall.SysProcAttr{Setsid: true}
+	if err = workerCmd.Start(); err != nil {
+		return err
+	}
+	log.Infof("The rotated logs are compressed in the background (PID = %d), see %s.",
+		workerCmd.Process.Pid, logPath)
+	return workerCmd.Process.Release()
+}
+
+// runCompressWorker compresses and removes the exceeding rotated logs of the
+// instances. Only one worker runs at a time, the next one exits if another
+// is in progress: the files left are handled on the next rotation.
+func runCompressWorker(instances []running.InstanceCtx, opts ttlog.CompressOpts) error {
+	pidFile := filepath.Join(cliOpts.App.RunDir, logCompressPIDFileName)
+	if err := process_utils.CreatePIDFile(pidFile); err != nil {
+		return fmt.Errorf("the rotated logs compression is in progress: %s", err)
+	}
+	defer os.Remove(pidFile)
+
+	return running.CompressLogs(instances, opts, int64(cliOpts.App.LogMaxTotalSize)*1024*1024)
+}
+
 // internalLogrotateModule is a default logrotate module.
 func internalLogrotateModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 	var runningCtx running.RunningCtx
@@ -31,6 +100,19 @@ func internalLogrotateModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 		return err
 	}
 
+	compressOpts := ttlog.CompressOpts{
+		Codec: cliOpts.App.LogCompress,
+		Level: cliOpts.App.LogCompressLevel,
+		Jobs:  cliOpts.App.LogCompressJobs,
+	}
+	if err := ttlog.ValidateCompressOpts(compressOpts); err != nil {
+		return err
+	}
+
+	if logrotateCompress {
+		return runCompressWorker(runningCtx.Instances, compressOpts)
+	}
+
 	for _, run := range runningCtx.Instances {
 		res, err := running.Logrotate(&run)
 		if err != nil {
@@ -39,5 +121,8 @@ func internalLogrotateModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 		log.Info(res)
 	}
 
-	return nil
+	if compressOpts.Codec == ttlog.CompressNone && cliOpts.App.LogMaxTotalSize <= 0 {
+		return nil
+	}
+	return launchCompressWorker(args)
 }
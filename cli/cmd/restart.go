@@ -3,16 +3,27 @@ package cmd
 import (
 	"fmt"
 	"os"
+	"time"
 
 	"github.com/apex/log"
 	"github.com/spf13/cobra"
 	"github.com/tarantool/tt/cli/cmdcontext"
 	"github.com/tarantool/tt/cli/modules"
+	"github.com/tarantool/tt/cli/process_utils"
+	"github.com/tarantool/tt/cli/running"
 	"github.com/tarantool/tt/cli/util"
 )
 
 var (
 	autoYes bool
+	// restartRolling enables restarting of the instances one by one.
+	restartRolling bool
+	// restartJobs is the maximum number of instances restarted at the same
+	// time in the rolling mode.
+	restartJobs int
+	// restartTimeout is the maximum time to wait for a restarted instance
+	// to become ready in the rolling mode.
+	restartTimeout time.Duration
 )
 
 // NewRestartCmd creates start command.
@@ -31,6 +42,12 @@ func NewRestartCmd() *cobra.Command {
 
 	restartCmd.Flags().BoolVarP(&autoYes, "yes", "y", false,
 		`Automatic yes to confirmation prompt`)
+	restartCmd.Flags().BoolVar(&restartRolling, "rolling", false,
+		"restart the instances one by one, waiting for each one to be running")
+	restartCmd.Flags().IntVarP(&restartJobs, "jobs", "j", 1,
+		"maximum number of instances to restart at the same time, used with --rolling")
+	restartCmd.Flags().DurationVar(&restartTimeout, "timeout", 60*time.Second,
+		"maximum time to wait for a restarted instance to be running, used with --rolling")
 
 	return restartCmd
 }
@@ -55,6 +72,21 @@ func internalRestartModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 		}
 	}
 
+	var runningCtx running.RunningCtx
+	if err := running.FillCtx(cliOpts, cmdCtx, &runningCtx, args); err != nil {
+		return err
+	}
+	// The stopped supervised instance would be started by its own watchdog.
+	for i := range runningCtx.Instances {
+		if err := running.CheckNotSupervised(&runningCtx.Instances[i]); err != nil {
+			return err
+		}
+	}
+
+	if restartRolling {
+		return rollingRestart(runningCtx.Instances)
+	}
+
 	if err := internalStopModule(cmdCtx, args); err != nil {
 		return err
 	}
@@ -65,3 +97,47 @@ func internalRestartModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 
 	return nil
 }
+
+// restartInstance restarts the instance and waits for its box.info.status
+// to be "running".
+func restartInstance(ttBin string, run *running.InstanceCtx) error {
+	appName := running.GetAppInstanceName(*run)
+
+	if running.Status(run).Code == process_utils.ProcessRunningCode {
+		if err := running.Stop(run); err != nil {
+			return fmt.Errorf("failed to stop the instance %s: %s", appName, err)
+		}
+	}
+
+	startTime := time.Now()
+	exited, err := launchWatchdog(ttBin, run)
+	if err != nil {
+		return err
+	}
+	if err = running.WaitRunning(run, restartTimeout, exited); err != nil {
+		return fmt.Errorf("failed to restart the instance %s: %s", appName, err)
+	}
+	log.Infof("The instance %s is running (%s).", appName,
+		time.Since(startTime).Round(time.Millisecond))
+
+	return nil
+}
+
+// rollingRestart restarts at most restartJobs instances at the same time. An
+// instance is restarted after the previous one is running, so the application
+// does not lose more than restartJobs instances. The restart is aborted after
+// the first instance that fails to come back.
+func rollingRestart(instances []running.InstanceCtx) error {
+	ttBin, err := os.Executable()
+	if err != nil {
+		return err
+	}
+
+	if restartJobs < 1 {
+		restartJobs = 1
+	}
+	return running.ForEachInstance(instances, restartJobs, true,
+		func(run *running.InstanceCtx) error {
+			return restartInstance(ttBin, run)
+		})
+}
@@ -128,8 +128,10 @@ func NewCmdRoot() *cobra.Command {
 		NewStartCmd(),
 		NewStopCmd(),
 		NewStatusCmd(),
+		NewTopCmd(),
 		NewRestartCmd(),
 		NewLogrotateCmd(),
+		NewLogCmd(),
 		NewCheckCmd(),
 		NewConnectCmd(),
 		NewRocksCmd(),
@@ -1,8 +1,13 @@
 package cmd
 
 import (
+	"fmt"
 	"os"
 	"os/exec"
+	"path/filepath"
+	"strings"
+	"text/tabwriter"
+	"time"
 
 	"github.com/apex/log"
 	"github.com/spf13/cobra"
@@ -11,11 +16,33 @@ import (
 	"github.com/tarantool/tt/cli/running"
 )
 
+const (
+	// supervisorLogFileName is the name of the supervisor process log file in
+	// the log directory.
+	supervisorLogFileName = "tt_supervisor.log"
+)
+
 var (
 	// "watchdog" is a hidden flag used to daemonize a process.
 	// In go, we can't just fork the process (reason - goroutines).
 	// So, for daemonize, we restarts the process with "watchdog" flag.
 	watchdog bool
+	// startJobs is the maximum number of instances started at the same time.
+	startJobs int
+	// startWait enables waiting for the started instances to become ready.
+	startWait bool
+	// startTimeout is the maximum time to wait for an instance readiness.
+	startTimeout time.Duration
+	// startSupervisor enables running all the instances under a single
+	// supervisor process.
+	startSupervisor bool
+	// startTimings enables printing of the instances startup breakdown.
+	startTimings bool
+	// ttStartTime is the start time of the tt process.
+	ttStartTime = time.Now()
+	// configTime and fillCtxTime are the end times of the configuration
+	// resolution and the instances context filling.
+	configTime, fillCtxTime time.Time
 )
 
 // NewStartCmd creates start command.
@@ -33,37 +60,203 @@ func NewStartCmd() *cobra.Command {
 
 	startCmd.Flags().BoolVar(&watchdog, "watchdog", false, "")
 	startCmd.Flags().MarkHidden("watchdog")
+	startCmd.Flags().IntVarP(&startJobs, "jobs", "j", 1,
+		"maximum number of instances to start at the same time, 0 - no limit")
+	startCmd.Flags().BoolVar(&startWait, "wait", false,
+		"wait for the instances to become ready (box.info.status is \"running\")")
+	startCmd.Flags().DurationVar(&startTimeout, "timeout", 60*time.Second,
+		"maximum time to wait for an instance to become ready, used with --wait")
+	startCmd.Flags().BoolVar(&startSupervisor, "supervisor", false,
+		"run the watchdogs of all the instances in a single supervisor process")
+	startCmd.Flags().BoolVar(&startTimings, "timings", false,
+		"wait for the instances to load the application and print the startup breakdown")
 
 	return startCmd
 }
 
+// launchWatchdog starts the watchdog process for the instance. The returned
+// channel is closed when the watchdog process is terminated.
+func launchWatchdog(ttBin string, run *running.InstanceCtx) (<-chan struct{}, error) {
+	appName := running.GetAppInstanceName(*run)
+
+	log.Infof("Starting an instance [%s]...", appName)
+
+	newArgs := []string{"start", "--watchdog", appName}
+
+	wdCmd := exec.Command(ttBin, newArgs...)
+
+	if err := wdCmd.Start(); err != nil {
+		return nil, err
+	}
+
+	exited := make(chan struct{})
+	go func() {
+		wdCmd.Wait()
+		close(exited)
+	}()
+	return exited, nil
+}
+
+// printStartupTimings prints the startup breakdown of the instance and
+// appends it to the timings history.
+func printStartupTimings(run *running.InstanceCtx, launchTime time.Time) error {
+	events, err := running.ReadTimings(run)
+	if err != nil {
+		return err
+	}
+	events = append(events,
+		running.TimingEvent{Name: running.TimingStart, Time: ttStartTime},
+		running.TimingEvent{Name: running.TimingConfig, Time: configTime},
+		running.TimingEvent{Name: running.TimingFillCtx, Time: fillCtxTime},
+		running.TimingEvent{Name: running.TimingLaunch, Time: launchTime})
+	timings := running.NewStartupTimings(running.GetAppInstanceName(*run), events)
+
+	var buf strings.Builder
+	table := tabwriter.NewWriter(&buf, 0, 0, 2, ' ', 0)
+	for _, phase := range timings.Phases {
+		fmt.Fprintf(table, "  %s\t%s\n", phase.Name,
+			phase.Duration.Round(time.Millisecond))
+	}
+	fmt.Fprintf(table, "  total\t%s\n", timings.Total.Round(time.Millisecond))
+	table.Flush()
+	log.Infof("Startup timings of the instance %s:\n%s", timings.Instance,
+		strings.TrimSuffix(buf.String(), "\n"))
+
+	return running.AppendTimingsHistory(run, &timings)
+}
+
+// waitStarted waits for the instance started at the launch time to become
+// ready if the waiting mode is enabled. In the timings mode it waits for the
+// instance to load the application and prints the startup breakdown.
+func waitStarted(run *running.InstanceCtx, exited <-chan struct{},
+	launchTime time.Time) error {
+	appName := running.GetAppInstanceName(*run)
+	if startTimings {
+		if err := running.WaitAppLoaded(run, startTimeout, exited); err != nil {
+			return fmt.Errorf("failed to start the instance %s: %s", appName, err)
+		}
+		if err := printStartupTimings(run, launchTime); err != nil {
+			log.Warnf("Failed to get the startup timings of %s: %s", appName, err)
+		}
+		return nil
+	}
+
+	if !startWait {
+		return nil
+	}
+	if err := running.WaitRunning(run, startTimeout, exited); err != nil {
+		return fmt.Errorf("failed to start the instance %s: %s", appName, err)
+	}
+	log.Infof("The instance %s is ready (%s).", appName,
+		time.Since(launchTime).Round(time.Millisecond))
+	return nil
+}
+
+// startWatchdog starts the watchdog process for the instance. If the waiting
+// mode is enabled, it waits for the instance to become ready.
+func startWatchdog(ttBin string, run *running.InstanceCtx) error {
+	if startTimings {
+		if err := running.ResetTimings(run); err != nil {
+			return err
+		}
+	}
+
+	startTime := time.Now()
+	exited, err := launchWatchdog(ttBin, run)
+	if err != nil {
+		return err
+	}
+
+	return waitStarted(run, exited, startTime)
+}
+
+// startSupervisorProcess starts the supervisor process for the instances. The
+// supervisor output is appended to the log file in the log directory. If the
+// waiting mode is enabled, it waits for all the instances to become ready.
+func startSupervisorProcess(ttBin string, instances []running.InstanceCtx,
+	args []string) error {
+	log.Infof("Starting a supervisor for %d instance(s)...", len(instances))
+
+	if err := os.MkdirAll(cliOpts.App.LogDir, 0755); err != nil {
+		return err
+	}
+	logPath := filepath.Join(cliOpts.App.LogDir, supervisorLogFileName)
+	logFile, err := os.OpenFile(logPath, os.O_WRONLY|os.O_CREATE|os.O_APPEND, 0644)
+	if err != nil {
+		return fmt.Errorf("failed to open the supervisor log file: %s", err)
+	}
+	// The supervisor gets its own descriptor of the file.
+	defer logFile.Close()
+
+	newArgs := append([]string{"start", "--watchdog", "--supervisor"}, args...)
+
+	wdCmd := exec.Command(ttBin, newArgs...)
+	wdCmd.Stdout = logFile
+	wdCmd.Stderr = logFile
+
+	if startTimings {
+		for i := range instances {
+			if err := running.ResetTimings(&instances[i]); err != nil {
+				return err
+			}
+		}
+	}
+
+	startTime := time.Now()
+	if err := wdCmd.Start(); err != nil {
+		return err
+	}
+	log.Infof("The supervisor (PID = %d) logs to %s.", wdCmd.Process.Pid, logPath)
+
+	if !startWait && !startTimings {
+		return nil
+	}
+
+	exited := make(chan struct{})
+	go func() {
+		wdCmd.Wait()
+		close(exited)
+	}()
+
+	return running.ForEachInstance(instances, 0, false,
+		func(run *running.InstanceCtx) error {
+			return waitStarted(run, exited, startTime)
+		})
+}
+
 // internalStartModule is a default start module.
 func internalStartModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
+	configTime = time.Now()
 	var runningCtx running.RunningCtx
 	if err := running.FillCtx(cliOpts, cmdCtx, &runningCtx, args); err != nil {
 		return err
 	}
+	fillCtxTime = time.Now()
 
 	if !watchdog {
+		if startTimings {
+			// The watchdogs and the instances inherit the environment.
+			os.Setenv(running.TimingsEnv, "true")
+		}
+
 		ttBin, err := os.Executable()
 		if err != nil {
 			return err
 		}
-		for _, run := range runningCtx.Instances {
-			appName := running.GetAppInstanceName(run)
 
-			log.Infof("Starting an instance [%s]...", appName)
-
-			newArgs := []string{"start", "--watchdog", appName}
-
-			wdCmd := exec.Command(ttBin, newArgs...)
-
-			if err := wdCmd.Start(); err != nil {
-				return err
-			}
+		if startSupervisor {
+			return startSupervisorProcess(ttBin, runningCtx.Instances, args)
 		}
 
-		return nil
+		// Stop starting new instances after the first failure.
+		return running.ForEachInstance(runningCtx.Instances, startJobs, true,
+			func(run *running.InstanceCtx) error {
+				return startWatchdog(ttBin, run)
+			})
+	}
+
+	if startSupervisor {
+		return running.Supervise(cmdCtx, runningCtx.Instances)
 	}
 
 	if err := running.Start(cmdCtx, &runningCtx.Instances[0]); err != nil {
@@ -1,6 +1,14 @@
 package cmd
 
 import (
+	"encoding/json"
+	"fmt"
+	"io"
+	"os"
+	"strconv"
+	"text/tabwriter"
+	"time"
+
 	"github.com/apex/log"
 	"github.com/spf13/cobra"
 	"github.com/tarantool/tt/cli/cmdcontext"
@@ -8,6 +16,13 @@ import (
 	"github.com/tarantool/tt/cli/running"
 )
 
+var (
+	// statusDetails enables the output of the instances resource usage.
+	statusDetails bool
+	// statusJson enables the output in JSON format.
+	statusJson bool
+)
+
 // NewStatusCmd creates status command.
 func NewStatusCmd() *cobra.Command {
 	var statusCmd = &cobra.Command{
@@ -21,9 +36,64 @@ func NewStatusCmd() *cobra.Command {
 		},
 	}
 
+	statusCmd.Flags().BoolVarP(&statusDetails, "details", "d", false,
+		"show PIDs, uptime and resource usage of the instances")
+	statusCmd.Flags().BoolVar(&statusJson, "json", false,
+		"print the detailed status in JSON format")
+
 	return statusCmd
 }
 
+// formatStatusValue returns the value for the status table or "-" if
+// the instance is not running.
+func formatStatusValue(status *running.InstanceStatus, value string) string {
+	if status.TarantoolPID == 0 {
+		return "-"
+	}
+	return value
+}
+
+// printStatusTable prints the detailed status of the instances as a table.
+func printStatusTable(writer io.Writer, statuses []running.InstanceStatus) error {
+	table := tabwriter.NewWriter(writer, 0, 0, 2, ' ', 0)
+	fmt.Fprintln(table, "INSTANCE\tSTATUS\tPID\tTARANTOOL PID\tUPTIME\tRSS\tCPU\tFDS\t"+
+		"THREADS\tRESTARTS\tPROBE")
+	for i := range statuses {
+		status := &statuses[i]
+		watchdogPID := "-"
+		if status.WatchdogPID != 0 {
+			watchdogPID = strconv.Itoa(status.WatchdogPID)
+		}
+		fds := "-"
+		if status.FDs >= 0 {
+			fds = strconv.Itoa(status.FDs)
+		}
+		probe := "-"
+		if status.ProbeLatency > 0 {
+			probe = status.ProbeLatency.Round(time.Microsecond).String()
+			if status.ProbeFailures > 0 {
+				probe += fmt.Sprintf(" (%d failed)", status.ProbeFailures)
+			}
+		}
+		statusText := status.Status
+		if status.Parked {
+			statusText += " (PARKED)"
+		}
+
+		fmt.Fprintf(table, "%s\t%s\t%s\t%s\t%s\t%s\t%s\t%s\t%s\t%d\t%s\n",
+			status.Name, statusText, watchdogPID,
+			formatStatusValue(status, strconv.Itoa(status.TarantoolPID)),
+			formatStatusValue(status, status.Uptime.Round(time.Second).String()),
+			formatStatusValue(status, fmt.Sprintf("%.1fMiB",
+				float64(status.RSS)/(1024*1024))),
+			formatStatusValue(status, status.CPUTime.Round(10*time.Millisecond).String()),
+			formatStatusValue(status, fds),
+			formatStatusValue(status, strconv.Itoa(status.Threads)),
+			status.Restarts, probe)
+	}
+	return table.Flush()
+}
+
 // internalStatusModule is a default status module.
 func internalStatusModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 	var runningCtx running.RunningCtx
@@ -31,6 +101,16 @@ func internalStatusModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 		return err
 	}
 
+	if statusJson || statusDetails {
+		statuses := running.CollectInstancesStatus(runningCtx.Instances)
+		if statusJson {
+			encoder := json.NewEncoder(os.Stdout)
+			encoder.SetIndent("", "  ")
+			return encoder.Encode(statuses)
+		}
+		return printStatusTable(os.Stdout, statuses)
+	}
+
 	for _, run := range runningCtx.Instances {
 		fullInstanceName := running.GetAppInstanceName(run)
 		procStatus := running.Status(&run)
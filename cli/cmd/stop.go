@@ -1,13 +1,19 @@
 package cmd
 
 import (
-	"github.com/apex/log"
+	"time"
+
 	"github.com/spf13/cobra"
 	"github.com/tarantool/tt/cli/cmdcontext"
 	"github.com/tarantool/tt/cli/modules"
 	"github.com/tarantool/tt/cli/running"
 )
 
+var (
+	// stopTimeout is the time given to all instances to stop gracefully.
+	stopTimeout time.Duration
+)
+
 // NewStopCmd creates stop command.
 func NewStopCmd() *cobra.Command {
 	var stopCmd = &cobra.Command{
@@ -21,6 +27,10 @@ func NewStopCmd() *cobra.Command {
 		},
 	}
 
+	stopCmd.Flags().DurationVar(&stopTimeout, "timeout", 30*time.Second,
+		"time given to all instances to stop, the instances that are still alive"+
+			" after the timeout are killed")
+
 	return stopCmd
 }
 
@@ -32,11 +42,7 @@ func internalStopModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 		return err
 	}
 
-	for _, run := range runningCtx.Instances {
-		if err = running.Stop(&run); err != nil {
-			log.Infof(err.Error())
-		}
-	}
+	running.StopAll(runningCtx.Instances, stopTimeout)
 
 	return nil
 }
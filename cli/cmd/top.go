@@ -0,0 +1,51 @@
+package cmd
+
+import (
+	"time"
+
+	"github.com/spf13/cobra"
+	"github.com/tarantool/tt/cli/cmdcontext"
+	"github.com/tarantool/tt/cli/modules"
+	"github.com/tarantool/tt/cli/running"
+	"github.com/tarantool/tt/cli/top"
+)
+
+// topOpts contains the options of the top command.
+var topOpts = top.TopOpts{
+	Interval:   2 * time.Second,
+	Iterations: 0,
+	SortBy:     top.SortByCPU,
+}
+
+// NewTopCmd creates top command.
+func NewTopCmd() *cobra.Command {
+	var topCmd = &cobra.Command{
+		Use:   "top [<APP_NAME> | <APP_NAME:INSTANCE_NAME>]",
+		Short: "Show the resource usage of the tarantool instance(s)",
+		Run: func(cmd *cobra.Command, args []string) {
+			cmdCtx.CommandName = cmd.Name()
+			err := modules.RunCmd(&cmdCtx, cmd.CommandPath(), &modulesInfo,
+				internalTopModule, args)
+			handleCmdErr(cmd, err)
+		},
+	}
+
+	topCmd.Flags().DurationVarP(&topOpts.Interval, "interval", "i", topOpts.Interval,
+		"refresh interval")
+	topCmd.Flags().IntVarP(&topOpts.Iterations, "iterations", "n", topOpts.Iterations,
+		"number of refreshes before exit, 0 - no limit")
+	topCmd.Flags().StringVar(&topOpts.SortBy, "sort", topOpts.SortBy,
+		"sort the instances by: cpu, rss, rps or name")
+
+	return topCmd
+}
+
+// internalTopModule is a default top module.
+func internalTopModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
+	var runningCtx running.RunningCtx
+	if err := running.FillCtx(cliOpts, cmdCtx, &runningCtx, args); err != nil {
+		return err
+	}
+
+	return top.Run(runningCtx.Instances, topOpts)
+}
@@ -37,8 +37,9 @@ var luaCodeFiles = []generateLuaCodeOpts{
 		PackageName: "connector",
 		FileName:    "cli/connector/lua_code_gen.go",
 		VariablesMap: map[string]string{
-			"callFuncTmpl": "cli/connector/lua/call_func_template.lua",
-			"evalFuncTmpl": "cli/connector/lua/eval_func_template.lua",
+			"callFuncTmpl":    "cli/connector/lua/call_func_template.lua",
+			"evalFuncTmpl":    "cli/connector/lua/eval_func_template.lua",
+			"evalRawFuncTmpl": "cli/connector/lua/eval_raw_func_template.lua",
 		},
 	},
 	{
@@ -49,6 +50,13 @@ var luaCodeFiles = []generateLuaCodeOpts{
 			"playFile": "cli/checkpoint/lua/play.lua",
 		},
 	},
+	{
+		PackageName: "top",
+		FileName:    "cli/top/lua_code_gen.go",
+		VariablesMap: map[string]string{
+			"statFuncBody": "cli/top/lua/stat_func_body.lua",
+		},
+	},
 }
 
 func generateLuaCodeVar() error {
@@ -20,7 +20,22 @@ type Config struct {
 //     log_maxsize: num (MB)
 //     log_maxage: num (Days)
 //     log_maxbackups: num
+//     log_passthrough: bool
+//     log_compress: gzip
+//     log_compress_level: num
+//     log_compress_jobs: num
+//     log_maxtotalsize: num (MB)
 //     restart_on_failure: bool
+//     restart_backoff_min: num (Seconds)
+//     restart_backoff_max: num (Seconds)
+//     restart_backoff_factor: num
+//     restart_min_uptime: num (Seconds)
+//     crash_loop_threshold: num
+//     probe_interval: num (Seconds)
+//     probe_timeout: num (Seconds)
+//     probe_max_failures: num
+//     cpuset: auto | cpu list
+//     numa_node: num
 //     bin_dir: path
 //     inc_dir: path
 //     tarantoolctl_layout: false
@@ -63,9 +78,60 @@ type AppOpts struct {
 	// The default is to retain all old log files (though LogMaxAge may
 	// still cause them to get deleted).
 	LogMaxBackups int `mapstructure:"log_maxbackups" yaml:"log_maxbackups"`
+	// LogPassthrough enables writing of the instance log directly to the log
+	// file without copying through the watchdog. The log file is rotated
+	// only by the logrotate command in this mode.
+	LogPassthrough bool `mapstructure:"log_passthrough" yaml:"log_passthrough"`
+	// LogCompress is the codec used by the logrotate command to compress
+	// rotated log files. The rotated log files are not compressed if it
+	// is empty.
+	LogCompress string `mapstructure:"log_compress" yaml:"log_compress"`
+	// LogCompressLevel is the compression level, zero means the codec
+	// default level.
+	LogCompressLevel int `mapstructure:"log_compress_level" yaml:"log_compress_level"`
+	// LogCompressJobs is the maximum number of log files compressed
+	// in parallel.
+	LogCompressJobs int `mapstructure:"log_compress_jobs" yaml:"log_compress_jobs"`
+	// LogMaxTotalSize is the maximum total size in MB of rotated log files
+	// of all the instances. The oldest files are removed by the logrotate
+	// command to fit into the limit. Zero means no limit.
+	LogMaxTotalSize int `mapstructure:"log_maxtotalsize" yaml:"log_maxtotalsize"`
 	// If the instance is started under the watchdog it should
 	// restart on if it crashes.
 	Restartable bool `mapstructure:"restart_on_failure" yaml:"restart_on_failure"`
+	// RestartBackoffMin is the delay in seconds before the first restart
+	// of a crashed instance. Zero restarts the instance immediately.
+	RestartBackoffMin *float64 `mapstructure:"restart_backoff_min" yaml:"restart_backoff_min"`
+	// RestartBackoffMax is the maximum delay in seconds between restarts
+	// of a crashed instance.
+	RestartBackoffMax float64 `mapstructure:"restart_backoff_max" yaml:"restart_backoff_max"`
+	// RestartBackoffFactor is the multiplier of the restart delay applied
+	// after each consecutive crash.
+	RestartBackoffFactor float64 `mapstructure:"restart_backoff_factor" yaml:"restart_backoff_factor"` //nolint:lll
+	// RestartMinUptime is the instance uptime in seconds after which
+	// the restart delay is reset to the minimum. Zero considers no crash
+	// consecutive.
+	RestartMinUptime *float64 `mapstructure:"restart_min_uptime" yaml:"restart_min_uptime"`
+	// CrashLoopThreshold is the number of consecutive crashes with
+	// uptime less than RestartMinUptime after which the instance is not
+	// restarted anymore. Zero disables the crash loop detection.
+	CrashLoopThreshold *int `mapstructure:"crash_loop_threshold" yaml:"crash_loop_threshold"`
+	// ProbeInterval is the period in seconds of the liveness probes of the
+	// instance. Zero disables the probes.
+	ProbeInterval float64 `mapstructure:"probe_interval" yaml:"probe_interval"`
+	// ProbeTimeout is the maximum time in seconds of a liveness probe.
+	// It must be positive.
+	ProbeTimeout *float64 `mapstructure:"probe_timeout" yaml:"probe_timeout"`
+	// ProbeMaxFailures is the number of consecutive failed liveness probes
+	// after which the instance is killed and restarted. It must be positive.
+	ProbeMaxFailures *int `mapstructure:"probe_max_failures" yaml:"probe_max_failures"`
+	// CPUSet is the list of CPUs the instances are bound to, e.g. "0-3,8".
+	// The "auto" value binds each instance to its own CPU spreading the
+	// instances evenly. The instances are not bound if it is empty.
+	CPUSet string `mapstructure:"cpuset" yaml:"cpuset"`
+	// NumaNode is the NUMA node the instances are bound to. The instances
+	// run on the CPUs of the node and allocate memory on it preferably.
+	NumaNode *int `mapstructure:"numa_node" yaml:"numa_node"`
 	// WalDir is a directory where write-ahead log (.xlog) files are stored.
 	WalDir string `mapstructure:"wal_dir" yaml:"wal_dir"`
 	// MemtxDir is a directory where memtx stores snapshot (.snap) files.
@@ -48,6 +48,17 @@ const (
 	logMaxSize    = 100
 	logMaxAge     = 8
 	logMaxBackups = 10
+	// logCompressJobs is the default number of log files compressed in parallel.
+	logCompressJobs = 1
+	// Defaults of the restart policy of a crashed instance.
+	restartBackoffMin         = 1
+	restartBackoffMax         = 60
+	restartBackoffFactor      = 2
+	restartMinUptime          = 60
+	restartCrashLoopThreshold = 10
+	// Defaults of the liveness probe of a hung instance.
+	probeTimeout     = 5
+	probeMaxFailures = 3
 )
 
 var (
@@ -62,22 +73,47 @@ var (
 	defaultConfigPath string
 )
 
+// newFloat returns a pointer to the value of an optional float option.
+func newFloat(value float64) *float64 {
+	return &value
+}
+
+// newInt returns a pointer to the value of an optional int option.
+func newInt(value int) *int {
+	return &value
+}
+
 // getDefaultAppOpts generates default app config.
 func getDefaultAppOpts() *config.AppOpts {
 	return &config.AppOpts{
-		InstancesEnabled:   ".",
-		RunDir:             varRunPath,
-		LogDir:             varLogPath,
-		LogMaxSize:         logMaxSize,
-		LogMaxAge:          logMaxAge,
-		LogMaxBackups:      logMaxBackups,
-		Restartable:        false,
-		WalDir:             varDataPath,
-		VinylDir:           varDataPath,
-		MemtxDir:           varDataPath,
-		BinDir:             binPath,
-		IncludeDir:         includePath,
-		TarantoolctlLayout: false,
+		InstancesEnabled:     ".",
+		RunDir:               varRunPath,
+		LogDir:               varLogPath,
+		LogMaxSize:           logMaxSize,
+		LogMaxAge:            logMaxAge,
+		LogMaxBackups:        logMaxBackups,
+		LogPassthrough:       false,
+		LogCompress:          "",
+		LogCompressLevel:     0,
+		LogCompressJobs:      logCompressJobs,
+		LogMaxTotalSize:      0,
+		Restartable:          false,
+		RestartBackoffMin:    newFloat(restartBackoffMin),
+		RestartBackoffMax:    restartBackoffMax,
+		RestartBackoffFactor: restartBackoffFactor,
+		RestartMinUptime:     newFloat(restartMinUptime),
+		CrashLoopThreshold:   newInt(restartCrashLoopThreshold),
+		ProbeInterval:        0,
+		ProbeTimeout:         newFloat(probeTimeout),
+		ProbeMaxFailures:     newInt(probeMaxFailures),
+		CPUSet:               "",
+		NumaNode:             nil,
+		WalDir:               varDataPath,
+		VinylDir:             varDataPath,
+		MemtxDir:             varDataPath,
+		BinDir:               binPath,
+		IncludeDir:           includePath,
+		TarantoolctlLayout:   false,
 	}
 }
 
@@ -210,6 +246,37 @@ func updateCliOpts(cliOpts *config.CliOpts, configDir string) error {
 	if cliOpts.App.LogMaxBackups == 0 {
 		cliOpts.App.LogMaxBackups = logMaxBackups
 	}
+	if cliOpts.App.LogCompressJobs == 0 {
+		cliOpts.App.LogCompressJobs = logCompressJobs
+	}
+	// The explicit zeros of the restart policy options are meaningful,
+	// so only the missing options are set to the defaults.
+	if cliOpts.App.RestartBackoffMin == nil {
+		cliOpts.App.RestartBackoffMin = newFloat(restartBackoffMin)
+	}
+	if cliOpts.App.RestartBackoffMax == 0 {
+		cliOpts.App.RestartBackoffMax = restartBackoffMax
+	}
+	if cliOpts.App.RestartBackoffFactor == 0 {
+		cliOpts.App.RestartBackoffFactor = restartBackoffFactor
+	}
+	if cliOpts.App.RestartMinUptime == nil {
+		cliOpts.App.RestartMinUptime = newFloat(restartMinUptime)
+	}
+	if cliOpts.App.CrashLoopThreshold == nil {
+		cliOpts.App.CrashLoopThreshold = newInt(restartCrashLoopThreshold)
+	}
+	if cliOpts.App.ProbeTimeout == nil {
+		cliOpts.App.ProbeTimeout = newFloat(probeTimeout)
+	} else if *cliOpts.App.ProbeTimeout <= 0 {
+		return fmt.Errorf("probe_timeout must be positive, got %v", *cliOpts.App.ProbeTimeout)
+	}
+	if cliOpts.App.ProbeMaxFailures == nil {
+		cliOpts.App.ProbeMaxFailures = newInt(probeMaxFailures)
+	} else if *cliOpts.App.ProbeMaxFailures <= 0 {
+		return fmt.Errorf("probe_max_failures must be positive, got %d",
+			*cliOpts.App.ProbeMaxFailures)
+	}
 
 	return nil
 }
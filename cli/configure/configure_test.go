@@ -1,6 +1,7 @@
 package configure
 
 import (
+	"fmt"
 	"io/ioutil"
 	"os"
 	"os/exec"
@@ -305,3 +306,53 @@ func TestUpdateCliOpts(t *testing.T) {
 	assert.Equal(t, logMaxBackups, cliOpts.App.LogMaxBackups)
 	assert.Equal(t, logMaxSize, cliOpts.App.LogMaxSize)
 }
+
+func TestUpdateCliOptsRestartPolicy(t *testing.T) {
+	zero := 0.0
+	zeroThreshold := 0
+	cliOpts := config.CliOpts{
+		App: &config.AppOpts{
+			RestartBackoffMin:  &zero,
+			CrashLoopThreshold: &zeroThreshold,
+		},
+	}
+
+	err := updateCliOpts(&cliOpts, "/etc/tarantool")
+	require.NoError(t, err)
+	// The explicit zeros are kept, the missing options are set to the defaults.
+	require.NotNil(t, cliOpts.App.RestartBackoffMin)
+	assert.Equal(t, 0.0, *cliOpts.App.RestartBackoffMin)
+	require.NotNil(t, cliOpts.App.CrashLoopThreshold)
+	assert.Equal(t, 0, *cliOpts.App.CrashLoopThreshold)
+	require.NotNil(t, cliOpts.App.RestartMinUptime)
+	assert.Equal(t, float64(restartMinUptime), *cliOpts.App.RestartMinUptime)
+}
+
+func TestUpdateCliOptsProbeTimeout(t *testing.T) {
+	for _, timeout := range []float64{0, -1} {
+		timeout := timeout
+		cliOpts := config.CliOpts{App: &config.AppOpts{ProbeTimeout: &timeout}}
+		err := updateCliOpts(&cliOpts, "/etc/tarantool")
+		assert.EqualError(t, err, fmt.Sprintf("probe_timeout must be positive, got %v", timeout))
+	}
+
+	cliOpts := config.CliOpts{App: &config.AppOpts{}}
+	require.NoError(t, updateCliOpts(&cliOpts, "/etc/tarantool"))
+	require.NotNil(t, cliOpts.App.ProbeTimeout)
+	assert.Equal(t, float64(probeTimeout), *cliOpts.App.ProbeTimeout)
+}
+
+func TestUpdateCliOptsProbeMaxFailures(t *testing.T) {
+	for _, failures := range []int{0, -1} {
+		failures := failures
+		cliOpts := config.CliOpts{App: &config.AppOpts{ProbeMaxFailures: &failures}}
+		err := updateCliOpts(&cliOpts, "/etc/tarantool")
+		assert.EqualError(t, err,
+			fmt.Sprintf("probe_max_failures must be positive, got %d", failures))
+	}
+
+	cliOpts := config.CliOpts{App: &config.AppOpts{}}
+	require.NoError(t, updateCliOpts(&cliOpts, "/etc/tarantool"))
+	require.NotNil(t, cliOpts.App.ProbeMaxFailures)
+	assert.Equal(t, probeMaxFailures, *cliOpts.App.ProbeMaxFailures)
+}
@@ -6,6 +6,7 @@ import (
 	"os"
 	"path"
 	"syscall"
+	"time"
 
 	"github.com/tarantool/tt/cli/connector"
 	"golang.org/x/crypto/ssh/terminal"
@@ -113,6 +114,13 @@ func Eval(connectCtx ConnectCtx, args []string) ([]byte, error) {
 	}
 	defer conn.Close()
 
+	return evalCmd(conn, connectCtx, command, args[1:], 0)
+}
+
+// evalCmd executes the command with the arguments on the connected instance
+// and returns the result encoded in YAML.
+func evalCmd(conn connector.Connector, connectCtx ConnectCtx, command string,
+	args []string, timeout time.Duration) ([]byte, error) {
 	var eval string
 	evalArgs := []interface{}{command}
 	if connectCtx.Language != DefaultLanguage {
@@ -123,15 +131,13 @@ func Eval(connectCtx ConnectCtx, args []string) ([]byte, error) {
 		eval = consoleEvalFuncBody
 	} else {
 		eval = evalFuncBody
-		if len(args) > 1 {
-			for i := range args[1:] {
-				evalArgs = append(evalArgs, args[i+1])
-			}
+		for _, arg := range args {
+			evalArgs = append(evalArgs, arg)
 		}
 	}
 
 	// Execution of the command.
-	response, err := conn.Eval(eval, evalArgs, connector.RequestOpts{})
+	response, err := conn.Eval(eval, evalArgs, connector.RequestOpts{ReadTimeout: timeout})
 	if err != nil {
 		return nil, err
 	}
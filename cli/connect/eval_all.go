@@ -0,0 +1,115 @@
+package connect
+
+import (
+	"fmt"
+	"sync"
+	"time"
+
+	"github.com/tarantool/tt/cli/connector"
+)
+
+// EvalTarget is an instance to execute the command on.
+type EvalTarget struct {
+	// Name is the name of the instance the result is tagged by.
+	Name string
+	// ConnString is the connection string of the instance.
+	ConnString string
+}
+
+// EvalResult is the result of the command execution on the instance.
+type EvalResult struct {
+	// Name is the name of the instance.
+	Name string
+	// Result is the result encoded in YAML.
+	Result []byte
+	// Err is the connection or execution error.
+	Err error
+}
+
+// EvalAllOpts describes the parameters of the execution on many instances.
+type EvalAllOpts struct {
+	// Jobs is the maximum number of instances the command is executed on at
+	// the same time, 0 - no limit.
+	Jobs int
+	// Timeout is the maximum time of the connection and the execution on
+	// an instance, 0 - no timeout.
+	Timeout time.Duration
+}
+
+// evalOnTarget executes the command on the instance using the connection
+// from the pool. The connection of the execution that is timed out is
+// discarded to interrupt it, the function returns after the execution is
+// finished.
+func evalOnTarget(pool *connector.Pool, connectCtx ConnectCtx, target EvalTarget,
+	command string, args []string, timeout time.Duration) ([]byte, error) {
+	type evalResult struct {
+		result []byte
+		err    error
+	}
+	connOpts := getConnOpts(target.ConnString, connectCtx)
+	done := make(chan evalResult, 1)
+	go func() {
+		conn, err := pool.Get(connOpts)
+		if err != nil {
+			done <- evalResult{nil, fmt.Errorf("unable to establish connection: %s", err)}
+			return
+		}
+		result, err := evalCmd(conn, connectCtx, command, args, timeout)
+		done <- evalResult{result, err}
+	}()
+
+	if timeout <= 0 {
+		res := <-done
+		return res.result, res.err
+	}
+	timer := time.NewTimer(timeout)
+	defer timer.Stop()
+	select {
+	case res := <-done:
+		return res.result, res.err
+	case <-timer.C:
+		// The connection is busy with the request, so it is closed and the
+		// job slot is not freed until the request is interrupted.
+		pool.Discard(connOpts)
+		<-done
+		return nil, fmt.Errorf("timed out after %s", timeout)
+	}
+}
+
+// EvalAll executes the command on the instances concurrently. The command
+// is read once, each instance is connected to once. The results are
+// returned in the order of the targets.
+func EvalAll(connectCtx ConnectCtx, targets []EvalTarget, args []string,
+	opts EvalAllOpts) ([]EvalResult, error) {
+	command, err := getEvalCmd(connectCtx)
+	if err != nil {
+		return nil, err
+	}
+
+	pool := connector.NewPool()
+	defer pool.Close()
+
+	jobs := opts.Jobs
+	if jobs < 1 || jobs > len(targets) {
+		jobs = len(targets)
+	}
+	results := make([]EvalResult, len(targets))
+	var wg sync.WaitGroup
+	slots := make(chan struct{}, jobs)
+	for i, target := range targets {
+		results[i].Name = target.Name
+		wg.Add(1)
+		slots <- struct{}{}
+		go func(i int, target EvalTarget) {
+			defer func() {
+				<-slots
+				wg.Done()
+			}()
+			results[i].Result, results[i].Err = evalOnTarget(pool, connectCtx, target,
+				command, args, opts.Timeout)
+		}(i, target)
+	}
+	wg.Wait()
+
+	return results, nil
+}
@@ -0,0 +1,57 @@
+package connector
+
+import (
+	"time"
+)
+
+// DefaultBatchWindow is the default maximum number of requests of a batch
+// that are sent without waiting for the responses.
+const DefaultBatchWindow = 128
+
+// EvalRequest is an eval request of a batch.
+type EvalRequest struct {
+	// Expr is the Lua expression for evaluation.
+	Expr string
+	// Args are the arguments of the expression.
+	Args []interface{}
+}
+
+// EvalResponse is a response to an eval request of a batch.
+type EvalResponse struct {
+	// Data is the result of the evaluation.
+	Data []interface{}
+	// Err is the error of the request.
+	Err error
+}
+
+// BatchOpts describes the parameters of a batch of requests.
+type BatchOpts struct {
+	// Window is the maximum number of requests sent without waiting for
+	// the responses, DefaultBatchWindow is used if it is not positive.
+	Window int
+	// ReadTimeout timeout for each request of the batch.
+	ReadTimeout time.Duration
+}
+
+// BatchEvaler is an interface that wraps EvalBatch method.
+type BatchEvaler interface {
+	// EvalBatch passes Lua expressions for evaluation and returns the
+	// responses in the order of the requests.
+	EvalBatch(requests []EvalRequest, opts BatchOpts) []EvalResponse
+}
+
+// EvalBatch executes the eval requests and returns the responses in the
+// order of the requests. The requests are pipelined if the evaler supports
+// it, otherwise they are executed one by one.
+func EvalBatch(evaler Evaler, requests []EvalRequest, opts BatchOpts) []EvalResponse {
+	if batchEvaler, ok := evaler.(BatchEvaler); ok {
+		return batchEvaler.EvalBatch(requests, opts)
+	}
+
+	responses := make([]EvalResponse, len(requests))
+	for i, request := range requests {
+		responses[i].Data, responses[i].Err = evaler.Eval(request.Expr, request.Args,
+			RequestOpts{ReadTimeout: opts.ReadTimeout})
+	}
+	return responses
+}
@@ -0,0 +1,52 @@
+package connector_test
+
+import (
+	"errors"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+
+	. "github.com/tarantool/tt/cli/connector"
+)
+
+// evalerStub returns the first argument of the request or an error if the
+// argument is negative.
+type evalerStub struct {
+	calls int
+}
+
+func (evaler *evalerStub) Eval(expr string, args []interface{},
+	opts RequestOpts) ([]interface{}, error) {
+	evaler.calls++
+	if args[0].(int) < 0 {
+		return nil, errors.New("negative")
+	}
+	return args, nil
+}
+
+func TestEvalBatch_sequential(t *testing.T) {
+	evaler := &evalerStub{}
+	requests := []EvalRequest{
+		{Expr: "return ...", Args: []interface{}{1}},
+		{Expr: "return ...", Args: []interface{}{-1}},
+		{Expr: "return ...", Args: []interface{}{3}},
+	}
+
+	responses := EvalBatch(evaler, requests, BatchOpts{})
+	assert.Equal(t, 3, evaler.calls)
+	assert.Equal(t, []EvalResponse{
+		{Data: []interface{}{1}},
+		{Err: errors.New("negative")},
+		{Data: []interface{}{3}},
+	}, responses)
+}
+
+func TestEvalBatch_binary(t *testing.T) {
+	stub := newBatchConnectorStub()
+	defer close(stub.pending)
+
+	responses := EvalBatch(NewBinaryConnector(stub), []EvalRequest{{Expr: "return 1"}},
+		BatchOpts{})
+	assert.Equal(t, 1, stub.sent)
+	assert.Equal(t, []EvalResponse{{Data: []interface{}{0}}}, responses)
+}
@@ -77,6 +77,56 @@ func (conn *BinaryConnector) Eval(expr string, args []interface{},
 	return response.Data, nil
 }
 
+// EvalBatch sends the eval requests without waiting for the responses to
+// the previous ones, so a batch costs about one round trip instead of a
+// round trip per request. At most opts.Window requests are in flight. The
+// responses are returned in the order of the requests.
+func (conn *BinaryConnector) EvalBatch(requests []EvalRequest,
+	opts BatchOpts) []EvalResponse {
+	window := opts.Window
+	if window < 1 {
+		window = DefaultBatchWindow
+	}
+
+	responses := make([]EvalResponse, len(requests))
+	futures := make([]*tarantool.Future, len(requests))
+	cancels := make([]context.CancelFunc, len(requests))
+	wait := func(i int) {
+		response, err := futures[i].Get()
+		if cancels[i] != nil {
+			cancels[i]()
+		}
+		if err != nil {
+			responses[i].Err = replaceContextDone(err)
+		} else {
+			responses[i].Data = response.Data
+		}
+		futures[i], cancels[i] = nil, nil
+	}
+
+	for i, request := range requests {
+		if i >= window {
+			wait(i - window)
+		}
+		evalReq := tarantool.NewEvalRequest(request.Expr).Args(request.Args)
+		if opts.ReadTimeout != 0 {
+			var ctx context.Context
+			ctx, cancels[i] = context.WithTimeout(context.Background(), opts.ReadTimeout)
+			evalReq = evalReq.Context(ctx)
+		}
+		futures[i] = conn.conn.Do(evalReq)
+	}
+	first := len(requests) - window
+	if first < 0 {
+		first = 0
+	}
+	for i := first; i < len(requests); i++ {
+		wait(i)
+	}
+
+	return responses
+}
+
 // Close closes the tarantool.Connector created from.
 func (conn *BinaryConnector) Close() error {
 	if conn.conn != nil {
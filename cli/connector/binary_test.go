@@ -2,7 +2,9 @@ package connector_test
 
 import (
 	"errors"
+	"sync"
 	"testing"
+	"time"
 
 	"github.com/stretchr/testify/assert"
 	"github.com/tarantool/go-tarantool"
@@ -53,3 +55,79 @@ func TestBinaryConnector_Close_nil(t *testing.T) {
 
 	assert.NoError(t, conn.Close())
 }
+
+// batchConnectorStub completes the requests in the order of sending with
+// a delay and tracks the maximum number of the requests in flight.
+type batchConnectorStub struct {
+	tarantool.Connector
+	pending     chan *tarantool.Future
+	sent        int
+	inFlight    int
+	maxInFlight int
+	mutex       sync.Mutex
+}
+
+func newBatchConnectorStub() *batchConnectorStub {
+	stub := &batchConnectorStub{pending: make(chan *tarantool.Future, 1024)}
+	go func() {
+		for i := 0; ; i++ {
+			future, ok := <-stub.pending
+			if !ok {
+				return
+			}
+			time.Sleep(100 * time.Microsecond)
+			stub.mutex.Lock()
+			stub.inFlight--
+			stub.mutex.Unlock()
+			if i%3 == 2 {
+				future.SetError(errors.New("any error"))
+			} else {
+				future.SetResponse(&tarantool.Response{Data: []interface{}{i}})
+			}
+		}
+	}()
+	return stub
+}
+
+func (stub *batchConnectorStub) Do(req tarantool.Request) *tarantool.Future {
+	stub.mutex.Lock()
+	stub.sent++
+	stub.inFlight++
+	if stub.inFlight > stub.maxInFlight {
+		stub.maxInFlight = stub.inFlight
+	}
+	stub.mutex.Unlock()
+
+	future := tarantool.NewFuture()
+	stub.pending <- future
+	return future
+}
+
+func TestBinaryConnector_EvalBatch(t *testing.T) {
+	for _, window := range []int{0, 1, 4, 100} {
+		stub := newBatchConnectorStub()
+		conn := NewBinaryConnector(stub)
+
+		requests := make([]EvalRequest, 20)
+		for i := range requests {
+			requests[i] = EvalRequest{Expr: "return ...", Args: []interface{}{i}}
+		}
+		responses := conn.EvalBatch(requests, BatchOpts{Window: window})
+		close(stub.pending)
+
+		assert.Equal(t, len(requests), stub.sent)
+		if window > 0 {
+			assert.LessOrEqual(t, stub.maxInFlight, window)
+		}
+		assert.Equal(t, len(requests), len(responses))
+		for i, response := range responses {
+			if i%3 == 2 {
+				assert.EqualError(t, response.Err, "any error")
+				assert.Nil(t, response.Data)
+			} else {
+				assert.NoError(t, response.Err)
+				assert.Equal(t, []interface{}{i}, response.Data)
+			}
+		}
+	}
+}
@@ -42,37 +42,54 @@ type Connector interface {
 
 // Connect connects to the tarantool instance according to options.
 func Connect(opts ConnectOpts) (Connector, error) {
-	// It became common that address is longer than 108 symbols(sun_path limit).
-	// To reduce length of address we use relative path
-	// with chdir into a directory of socket.
-	// e.g foo/bar/123.sock -> ./123.sock
-	workDir, err := os.Getwd()
-	if err != nil {
-		return nil, err
-	}
+	return ConnectWithTimeout(opts, 0)
+}
 
+// ConnectWithTimeout connects to the tarantool instance according to options.
+// The timeout bounds the connection establishment: the dial and the greeting
+// read. The greeting read is bounded by the default timeout if it is zero.
+func ConnectWithTimeout(opts ConnectOpts, timeout time.Duration) (Connector, error) {
 	maxSocketPath := maxSocketPathLinux
 	if runtime.GOOS == "darwin" {
 		maxSocketPath = maxSocketPathMac
 	}
 
-	if _, err := os.Stat(opts.Address); err == nil {
-		os.Chdir(filepath.Dir(opts.Address))
-		opts.Address = "./" + filepath.Base(opts.Address)
-		if len(opts.Address)+1 > maxSocketPath {
-			return nil, fmt.Errorf("socket name is longer than %d symbols: %s",
-				maxSocketPath-3, filepath.Base(opts.Address))
+	// It became common that address is longer than 108 symbols(sun_path limit).
+	// To reduce length of address we use a path that does not contain the
+	// directory of the socket. The working directory of the process is not
+	// changed, so connections could be established concurrently.
+	if opts.Network == UnixNetwork && len(opts.Address)+1 > maxSocketPath {
+		if _, err := os.Stat(opts.Address); err == nil {
+			address, release, err := shortenSocketPath(opts.Address)
+			if err != nil {
+				return nil, err
+			}
+			// The short path must be valid until the binary connector dials.
+			defer release()
+			if len(address)+1 > maxSocketPath {
+				return nil, fmt.Errorf("socket name is longer than %d symbols: %s",
+					maxSocketPath-len(address)+len(filepath.Base(opts.Address))-1,
+					filepath.Base(opts.Address))
+			}
+			opts.Address = address
 		}
-		defer os.Chdir(workDir)
 	}
 	// Connect to specified address.
-	greetingConn, err := net.Dial(opts.Network, opts.Address)
+	var dialer net.Dialer
+	if timeout > 0 {
+		dialer.Deadline = time.Now().Add(timeout)
+	}
+	greetingConn, err := dialer.Dial(opts.Network, opts.Address)
 	if err != nil {
 		return nil, fmt.Errorf("failed to dial: %s", err)
 	}
 
 	// Set a deadline for the greeting.
-	greetingConn.SetReadDeadline(time.Now().Add(greetingOperationTimeout))
+	greetingDeadline := time.Now().Add(greetingOperationTimeout)
+	if timeout > 0 {
+		greetingDeadline = dialer.Deadline
+	}
+	greetingConn.SetReadDeadline(greetingDeadline)
 
 	// Detect transport and protocol.
 	ssl := opts.Ssl.KeyFile != "" || opts.Ssl.CertFile != "" ||
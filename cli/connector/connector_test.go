@@ -0,0 +1,105 @@
+package connector_test
+
+import (
+	"net"
+	"os"
+	"path/filepath"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+
+	. "github.com/tarantool/tt/cli/connector"
+)
+
+// listenLongSocket creates a unix socket with a path longer than the
+// sun_path limit. The socket is created by a short path and moved.
+func listenLongSocket(t *testing.T) (net.Listener, string) {
+	tempDir := t.TempDir()
+	longDir := filepath.Join(tempDir, strings.Repeat("d", 60), strings.Repeat("d", 60))
+	require.NoError(t, os.MkdirAll(longDir, 0755))
+
+	shortPath := filepath.Join(tempDir, "s.sock")
+	listener, err := net.Listen("unix", shortPath)
+	require.NoError(t, err)
+	longPath := filepath.Join(longDir, "instance.control")
+	require.NoError(t, os.Rename(shortPath, longPath))
+	return listener, longPath
+}
+
+// serveConsole accepts the connections and sends the Lua console greeting.
+// The accepted connections are counted if accepted is not nil.
+func serveConsole(listener net.Listener, accepted *int32) {
+	for {
+		conn, err := listener.Accept()
+		if err != nil {
+			return
+		}
+		if accepted != nil {
+			atomic.AddInt32(accepted, 1)
+		}
+		greeting := "Tarantool 2.11.0 (Lua console)"
+		greeting += strings.Repeat(" ", 127-len(greeting)) + "\n"
+		conn.Write([]byte(greeting))
+	}
+}
+
+func TestConnect_longSocketPath(t *testing.T) {
+	listener, socketPath := listenLongSocket(t)
+	defer listener.Close()
+	go serveConsole(listener, nil)
+
+	workDir, err := os.Getwd()
+	require.NoError(t, err)
+
+	// The connections are established concurrently.
+	var wg sync.WaitGroup
+	errs := make([]error, 8)
+	for i := range errs {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			conn, err := Connect(ConnectOpts{Network: UnixNetwork, Address: socketPath})
+			if err == nil {
+				conn.Close()
+			}
+			errs[i] = err
+		}(i)
+	}
+	wg.Wait()
+	for _, err := range errs {
+		assert.NoError(t, err)
+	}
+
+	// The working directory is not changed.
+	currentDir, err := os.Getwd()
+	require.NoError(t, err)
+	assert.Equal(t, workDir, currentDir)
+}
+
+func TestConnect_timeout(t *testing.T) {
+	socketPath := filepath.Join(t.TempDir(), "instance.control")
+	listener, err := net.Listen("unix", socketPath)
+	require.NoError(t, err)
+	defer listener.Close()
+
+	// The connections are accepted, but the greeting is never sent.
+	conns := make(chan net.Conn, 1)
+	go func() {
+		conn, err := listener.Accept()
+		if err == nil {
+			conns <- conn
+		}
+	}()
+
+	start := time.Now()
+	_, err = ConnectWithTimeout(ConnectOpts{Network: UnixNetwork, Address: socketPath},
+		100*time.Millisecond)
+	assert.ErrorContains(t, err, "failed to get protocol")
+	assert.Less(t, time.Since(start), time.Second)
+	(<-conns).Close()
+}
@@ -0,0 +1,97 @@
+package connector
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"fmt"
+	"strings"
+	"sync"
+	"text/template"
+)
+
+const (
+	// sessionFuncsTable is the table of the session storage with the
+	// functions registered by the connector.
+	sessionFuncsTable = "box.session.storage.tt_funcs"
+	// maxSessionFuncs is the maximum number of the functions registered
+	// in a session, the other functions are sent with each request.
+	maxSessionFuncs = 256
+	// funcNotRegisteredErr is the error raised if the function called by
+	// name is not found in the session storage.
+	funcNotRegisteredErr = "tt_funcs: the function is not registered"
+)
+
+var (
+	// evalTemplates are the parsed templates by the template text.
+	evalTemplates = map[string]*template.Template{}
+	// evalTemplatesMutex protects evalTemplates.
+	evalTemplatesMutex sync.Mutex
+)
+
+// flattenLua joins the lines of the Lua code and collapses the whitespaces,
+// so the code is sent to the console as a single line.
+func flattenLua(code string) string {
+	return strings.Join(strings.Fields(code), " ")
+}
+
+// getEvalTemplate returns the template parsed from the text. The text is
+// flattened and parsed once, the result is cached.
+func getEvalTemplate(text string) (*template.Template, error) {
+	evalTemplatesMutex.Lock()
+	defer evalTemplatesMutex.Unlock()
+
+	if tmpl, found := evalTemplates[text]; found {
+		return tmpl, nil
+	}
+	tmpl, err := template.New("s").Parse(flattenLua(text))
+	if err != nil {
+		return nil, err
+	}
+	evalTemplates[text] = tmpl
+	return tmpl, nil
+}
+
+// renderEvalTemplate returns the flattened template text with the params.
+// The params values must be flattened.
+func renderEvalTemplate(text string, params map[string]string) (string, error) {
+	tmpl, err := getEvalTemplate(text)
+	if err != nil {
+		return "", err
+	}
+	builder := strings.Builder{}
+	if err = tmpl.Execute(&builder, params); err != nil {
+		return "", err
+	}
+	return builder.String(), nil
+}
+
+// getFuncName returns the name of the function with the body in the session
+// storage.
+func getFuncName(funcBody string) string {
+	hash := sha256.Sum256([]byte(funcBody))
+	return hex.EncodeToString(hash[:8])
+}
+
+// getFuncDef returns the Lua code that defines the local function func with
+// the body. If the name is not empty, the function is registered in the
+// session storage by the name, or it is taken from the storage if it has
+// been registered by the previous requests, so the body is not sent again.
+// The function missing in the storage is not called, funcNotRegisteredErr
+// is raised instead.
+func getFuncDef(funcBody string, name string, registered bool) string {
+	if name == "" {
+		return "local function func(...) " + funcBody + " end"
+	}
+	if registered {
+		return fmt.Sprintf("local func = (%s or {})['%s'] if func == nil then error('%s') end",
+			sessionFuncsTable, name, funcNotRegisteredErr)
+	}
+	return fmt.Sprintf("local function func(...) %s end %s = %s or {} %s['%s'] = func",
+		funcBody, sessionFuncsTable, sessionFuncsTable, sessionFuncsTable, name)
+}
+
+// isFuncNotRegistered returns true if the eval has failed because the function
+// called by name is not found in the session storage.
+func isFuncNotRegistered(err error) bool {
+	return err != nil && strings.Contains(err.Error(), funcNotRegisteredErr)
+}
@@ -0,0 +1,51 @@
+package connector
+
+import (
+	"fmt"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestRenderEvalTemplate(t *testing.T) {
+	text := "local function func(...)\n    {{ .FunctionBody }}\nend\n\nreturn func('{{ .Arg }}')\n"
+	rendered, err := renderEvalTemplate(text, map[string]string{
+		"FunctionBody": "return ...",
+		"Arg":          "x",
+	})
+	require.NoError(t, err)
+	assert.Equal(t, "local function func(...) return ... end return func('x')", rendered)
+
+	// The template is parsed once.
+	tmpl, err := getEvalTemplate(text)
+	require.NoError(t, err)
+	cached, err := getEvalTemplate(text)
+	require.NoError(t, err)
+	assert.Same(t, tmpl, cached)
+
+	_, err = renderEvalTemplate("{{ .Arg ", nil)
+	assert.Error(t, err)
+}
+
+func TestGetFuncDef(t *testing.T) {
+	body := "local a = ...\n return a"
+	name := getFuncName(body)
+	assert.Len(t, name, 16)
+	assert.Equal(t, name, getFuncName(body))
+	assert.NotEqual(t, name, getFuncName("return ..."))
+
+	assert.Equal(t, "local function func(...) local a = ...\n return a end",
+		getFuncDef(body, "", false))
+	assert.Equal(t, "local function func(...) local a = ...\n return a end "+
+		"box.session.storage.tt_funcs = box.session.storage.tt_funcs or {} "+
+		"box.session.storage.tt_funcs['"+name+"'] = func",
+		getFuncDef(body, name, false))
+	assert.Equal(t, "local func = (box.session.storage.tt_funcs or {})['"+name+"'] "+
+		"if func == nil then error('"+funcNotRegisteredErr+"') end",
+		getFuncDef(body, name, true))
+
+	assert.True(t, isFuncNotRegistered(fmt.Errorf("eval:1: %s", funcNotRegisteredErr)))
+	assert.False(t, isFuncNotRegistered(fmt.Errorf("eval:1: other error")))
+	assert.False(t, isFuncNotRegistered(nil))
+}
@@ -13,7 +13,6 @@ import (
 	"github.com/vmihailenco/msgpack/v5"
 	lua "github.com/yuin/gopher-lua"
 
-	"github.com/tarantool/tt/cli/util"
 	"gopkg.in/yaml.v2"
 )
 
@@ -27,14 +26,38 @@ const (
 	tagPushPrefixLua  = `-- Push`
 )
 
+// textCapabilities are the capabilities of the instance the text connection
+// is established to.
+type textCapabilities struct {
+	// rawResults is true if the results could be received as raw msgpack
+	// frames.
+	rawResults bool
+	// registerFuncs is true if the functions could be registered in the
+	// session storage.
+	registerFuncs bool
+}
+
 type EvalPlainTextOpts struct {
 	ReadTimeout  time.Duration
 	PushCallback func(interface{})
 	ResData      interface{}
+	// FuncName is the name the function is registered by in the session,
+	// the function is not registered if it is empty.
+	FuncName string
+	// FuncRegistered is true if the function has been registered by the
+	// previous requests, so only the name is sent.
+	FuncRegistered bool
+	// capabilities are set to the capabilities of the instance received
+	// with the result if it is not nil.
+	capabilities *textCapabilities
 }
 
 type PlainTextEvalRes struct {
 	DataEncBase64 string `yaml:"data_enc"`
+	// RawResults and RegisterFuncs are the capabilities of the instance,
+	// they are returned if requested.
+	RawResults    bool `yaml:"raw_results"`
+	RegisterFuncs bool `yaml:"register_funcs"`
 }
 
 // callPlainTextConnYAML calls function on Tarantool instance
@@ -42,7 +65,7 @@ type PlainTextEvalRes struct {
 // to be correctly processed.
 func callPlainTextConn(conn net.Conn, funcName string, args []interface{},
 	opts EvalPlainTextOpts) ([]interface{}, error) {
-	evalFunc, err := util.GetTextTemplatedStr(&callFuncTmpl, map[string]string{
+	evalFunc, err := renderEvalTemplate(callFuncTmpl, map[string]string{
 		"FunctionName": funcName,
 	})
 
@@ -58,12 +81,14 @@ func callPlainTextConn(conn net.Conn, funcName string, args []interface{},
 // to be correctly processed.
 func evalPlainTextConn(conn net.Conn, funcBody string, args []interface{},
 	opts EvalPlainTextOpts) ([]interface{}, error) {
-	if err := formatAndSendEvalFunc(conn, funcBody, args, evalFuncTmpl); err != nil {
+	funcDef := getFuncDef(funcBody, opts.FuncName, opts.FuncRegistered)
+	err := formatAndSendEvalFunc(conn, funcDef, args, evalFuncTmpl, opts.capabilities != nil)
+	if err != nil {
 		return nil, err
 	}
 
 	// recv from socket
-	resBytes, err := readFromPlainTextConn(conn, opts)
+	resBytes, err := readFromPlainTextConn(newPlainTextFrameReader(conn), opts)
 	if err == io.EOF {
 		return nil, err
 	}
@@ -72,16 +97,65 @@ func evalPlainTextConn(conn net.Conn, funcBody string, args []interface{},
 		return nil, fmt.Errorf("failed to check returned data: %s", err)
 	}
 
-	data, err := processEvalTarantoolRes(resBytes, opts.ResData)
+	evalRes, err := parsePlainTextEvalRes(resBytes)
 	if err != nil {
 		return nil, err
 	}
+	if opts.capabilities != nil {
+		*opts.capabilities = textCapabilities{
+			rawResults:    evalRes.RawResults,
+			registerFuncs: evalRes.RegisterFuncs,
+		}
+	}
+
+	return decodeEvalResultBase64(evalRes.DataEncBase64, opts.ResData)
+}
+
+// evalPlainTextConnRaw calls function on Tarantool instance, the result is
+// written to the connection by the instance as a raw msgpack frame, so it is
+// not encoded in base64 and YAML. The connection must support the raw
+// results, see textCapabilities.
+func evalPlainTextConnRaw(conn net.Conn, funcBody string, args []interface{},
+	opts EvalPlainTextOpts) ([]interface{}, error) {
+	funcDef := getFuncDef(funcBody, opts.FuncName, opts.FuncRegistered)
+	if err := formatAndSendEvalFunc(conn, funcDef, args, evalRawFuncTmpl, false); err != nil {
+		return nil, err
+	}
+
+	reader := newPlainTextFrameReader(conn)
+	resBytes, err := readFromPlainTextConn(reader, opts)
+	if err == io.EOF {
+		return nil, err
+	}
+	if err != nil {
+		return nil, fmt.Errorf("failed to check returned data: %s", err)
+	}
+
+	if !isRawFrame(resBytes) {
+		// The function has failed, the error is returned by the console.
+		return processEvalTarantoolRes(resBytes, opts.ResData)
+	}
 
+	data, err := decodeRawFrame(resBytes, opts.ResData)
+	if err != nil {
+		return nil, err
+	}
+
+	// Skip the console response to the eval.
+	if _, err = reader.readFrame(opts.ReadTimeout); err != nil {
+		if err == io.EOF {
+			return nil, err
+		}
+		return nil, fmt.Errorf("failed to read from instance socket: %s", err)
+	}
 	return data, nil
 }
 
-func formatAndSendEvalFunc(conn net.Conn, funcBody string, args []interface{},
-	evalFuncTmpl string) error {
+// formatAndSendEvalFunc sends the eval function template with the function
+// definition and the arguments as a single line. If probeCapabilities is
+// true, the capabilities of the instance are requested with the result.
+func formatAndSendEvalFunc(conn net.Conn, funcDef string, args []interface{},
+	evalFuncTmpl string, probeCapabilities bool) error {
 	if args == nil {
 		args = []interface{}{}
 	}
@@ -91,19 +165,19 @@ func formatAndSendEvalFunc(conn net.Conn, funcBody string, args []interface{},
 		return fmt.Errorf("failed to encode args: %s", err)
 	}
 
-	evalFunc, err := util.GetTextTemplatedStr(&evalFuncTmpl, map[string]string{
-		"FunctionBody": funcBody,
-		"ArgsEncoded":  fmt.Sprintf("%x", argsEncoded),
-	})
+	params := map[string]string{
+		"FunctionDef": flattenLua(funcDef),
+		"ArgsEncoded": base64.StdEncoding.EncodeToString(argsEncoded),
+	}
+	if probeCapabilities {
+		params["ProbeCapabilities"] = "true"
+	}
+	evalFunc, err := renderEvalTemplate(evalFuncTmpl, params)
 
 	if err != nil {
 		return fmt.Errorf("failed to instantiate eval function template: %s", err)
 	}
-
-	evalFuncFormatted := strings.Join(
-		strings.Split(strings.TrimSpace(evalFunc), "\n"), " ",
-	)
-	evalFuncFormatted = strings.Join(strings.Fields(evalFuncFormatted), " ") + "\n"
+	evalFuncFormatted := evalFunc + "\n"
 
 	// write to socket
 	if err := writeToPlainTextConn(conn, evalFuncFormatted); err != nil {
@@ -151,13 +225,12 @@ func writeToPlainTextConn(conn net.Conn, data string) error {
 // And there are some problems.
 // See https://github.com/tarantool/tarantool/issues/4603
 //
-// Code is read byte by byte to make parsing output simpler
-// (in case of box.session.push() response we need to read 2 yaml-encoded values,
-// it's not enough to catch end of output, we should be sure that only one
-// yaml-encoded value was read).
-func readFromPlainTextConn(conn net.Conn, opts EvalPlainTextOpts) ([]byte, error) {
+// The output is read by frames (in case of box.session.push() response we need
+// to read 2 yaml-encoded values, it's not enough to catch end of output, we
+// should be sure that only one yaml-encoded value was read).
+func readFromPlainTextConn(reader *plainTextFrameReader,
+	opts EvalPlainTextOpts) ([]byte, error) {
 	var dataBytes []byte
-	buffer := bytes.Buffer{}
 
 	for {
 		// data is read in cycle because of `box.session.push` command
@@ -174,7 +247,7 @@ func readFromPlainTextConn(conn net.Conn, opts EvalPlainTextOpts) ([]byte, error
 		// So, when data portion starts with a tag prefix, we have to read one more value
 		// received tag string can be handled via pushCallback function
 		//
-		dataPortionBytes, err := readDataPortionFromPlainTextConn(conn, &buffer, opts.ReadTimeout)
+		dataPortionBytes, err := reader.readFrame(opts.ReadTimeout)
 		if err == io.EOF {
 			return nil, err
 		}
@@ -183,9 +256,7 @@ func readFromPlainTextConn(conn net.Conn, opts EvalPlainTextOpts) ([]byte, error
 			return nil, fmt.Errorf("failed to read from instance socket: %s", err)
 		}
 
-		dataPortion := string(dataPortionBytes)
-
-		if !pushTagIsReceived(dataPortion) {
+		if !pushTagIsReceived(dataPortionBytes) {
 			dataBytes = dataPortionBytes
 			break
 		}
@@ -205,84 +276,12 @@ func readFromPlainTextConn(conn net.Conn, opts EvalPlainTextOpts) ([]byte, error
 	return dataBytes, nil
 }
 
-func readDataPortionFromPlainTextConn(conn net.Conn, buffer *bytes.Buffer,
-	readTimeout time.Duration) ([]byte, error) {
-	tmp := make([]byte, 256)
-	data := make([]byte, 0)
-
-	if readTimeout > 0 {
-		conn.SetReadDeadline(time.Now().Add(readTimeout))
-	} else {
-		conn.SetReadDeadline(time.Time{})
-	}
-
-	hasYAMLOutputPrefix := false
-
-	for {
-		// We have to read from socket in medium parts (not in small parts, like 1 byte),
-		// this greatly speeds up reading and responsiveness.
-		//
-		// But, due to the peculiarities of `box.session.push()`, we have to process the
-		// data byte by byte - we use HasPrefix and HasSufix merhods.
-		//
-		// In addition, when reading in portion (more than 1 byte), we need
-		// to save the read data (for this we use the bytes.Buffer), since we can read it,
-		// but not process them in this function call (see examples above).
-		// This structure allows us to save this data and process it in the next function call.
-		//
-
-		if buffer.Len() == 0 {
-			if n, err := conn.Read(tmp); err != nil && err != io.EOF {
-				return nil, fmt.Errorf("failed to read: %s", err)
-			} else if n == 0 || err == io.EOF {
-				return nil, io.EOF
-			} else {
-				buffer.Write(tmp[:n])
-			}
-		}
-
-		nextByte, err := buffer.ReadByte()
-		if err != nil {
-			return nil, fmt.Errorf("failed to get byte from buffer: %s", err)
-		}
-
-		data = append(data, nextByte)
-		dataString := string(data)
-
-		if strings.HasPrefix(endOfYAMLOutput, dataString) ||
-			strings.HasPrefix(tagPushPrefixYAML, dataString) ||
-			strings.HasPrefix(tagPushPrefixLua, dataString) {
-			continue
-		}
-
-		if !hasYAMLOutputPrefix &&
-			strings.HasPrefix(dataString, startOfYamlOutput) ||
-			strings.HasPrefix(dataString, tagPushPrefixYAML) {
-			hasYAMLOutputPrefix = true
-		}
-
-		if hasYAMLOutputPrefix && strings.HasSuffix(dataString, endOfYAMLOutput) {
-			break
-		}
-
-		if strings.HasSuffix(dataString, endOfLuaOutput) {
-			break
-		}
-	}
-
-	if len(data) == 0 {
-		return nil, fmt.Errorf("connection was closed")
-	}
-
-	return data, nil
-}
-
-func pushTagIsReceived(dataPortion string) bool {
-	if strings.HasPrefix(dataPortion, tagPushPrefixYAML) {
+func pushTagIsReceived(dataPortion []byte) bool {
+	if bytes.HasPrefix(dataPortion, []byte(tagPushPrefixYAML)) {
 		return true
 	}
 
-	if strings.HasPrefix(dataPortion, tagPushPrefixLua) {
+	if bytes.HasPrefix(dataPortion, []byte(tagPushPrefixLua)) {
 		return true
 	}
 
@@ -313,10 +312,17 @@ func getPushedData(pushedDataBytes []byte) (interface{}, error) {
 }
 
 func processEvalTarantoolRes(resBytes []byte, result interface{}) ([]interface{}, error) {
-	var err error
-	var evalResultEncBase64 string
+	evalRes, err := parsePlainTextEvalRes(resBytes)
+	if err != nil {
+		return nil, err
+	}
+
+	return decodeEvalResultBase64(evalRes.DataEncBase64, result)
+}
 
-	var getResultEncBase64Func func([]byte) (string, error)
+// parsePlainTextEvalRes parses the console response to the eval.
+func parsePlainTextEvalRes(resBytes []byte) (PlainTextEvalRes, error) {
+	var getEvalResFunc func([]byte) (PlainTextEvalRes, error)
 	// Result data is returned as a table
 	// `{ data_enc = msgpack.encode(ret):hex() }`.
 	// It can't be returned as a string because of Lua output -
@@ -340,22 +346,30 @@ func processEvalTarantoolRes(resBytes []byte, result interface{}) ([]interface{}
 	// tarantool> error('XXX')
 	// "XXX";
 
-	resString := string(resBytes)
-	if strings.HasPrefix(resString, startOfYamlOutput) {
-		getResultEncBase64Func = getPlainTextEvalResYaml
+	if bytes.HasPrefix(resBytes, []byte(startOfYamlOutput)) {
+		getEvalResFunc = getPlainTextEvalResYaml
 	} else {
-		getResultEncBase64Func = getPlainTextEvalResLua
+		getEvalResFunc = getPlainTextEvalResLua
 	}
 
-	if evalResultEncBase64, err = getResultEncBase64Func(resBytes); err != nil {
-		return nil, err
-	}
+	return getEvalResFunc(resBytes)
+}
 
+// decodeEvalResultBase64 decodes the base64 and msgpack encoded result of
+// the eval, see decodeEvalResult.
+func decodeEvalResultBase64(evalResultEncBase64 string,
+	result interface{}) ([]interface{}, error) {
 	dataEnc, err := base64.StdEncoding.DecodeString(evalResultEncBase64)
 	if err != nil {
 		return nil, fmt.Errorf("failed to decode hex value: %s", err)
 	}
 
+	return decodeEvalResult(dataEnc, result)
+}
+
+// decodeEvalResult decodes the msgpack-encoded result of the eval into the
+// result if it is not nil, otherwise the data is returned.
+func decodeEvalResult(dataEnc []byte, result interface{}) ([]interface{}, error) {
 	if result != nil {
 		if err := msgpack.Unmarshal(dataEnc, result); err != nil {
 			return nil, fmt.Errorf("failed to parse eval result: %s", err)
@@ -372,7 +386,7 @@ func processEvalTarantoolRes(resBytes []byte, result interface{}) ([]interface{}
 	return data, nil
 }
 
-func getPlainTextEvalResYaml(resBytes []byte) (string, error) {
+func getPlainTextEvalResYaml(resBytes []byte) (PlainTextEvalRes, error) {
 	evalResults := []PlainTextEvalRes{}
 	if err := yaml.UnmarshalStrict(resBytes, &evalResults); err != nil {
 		errorStrings := make([]map[string]string, 0)
@@ -380,42 +394,44 @@ func getPlainTextEvalResYaml(resBytes []byte) (string, error) {
 			if len(errorStrings) > 0 {
 				errStr, found := errorStrings[0]["error"]
 				if found {
-					return "", fmt.Errorf(errStr)
+					return PlainTextEvalRes{}, fmt.Errorf(errStr)
 				}
 			}
 
 		}
 
-		return "", fmt.Errorf("failed to parse eval result: %s", err)
+		return PlainTextEvalRes{}, fmt.Errorf("failed to parse eval result: %s", err)
 	}
 
 	if len(evalResults) != 1 {
-		return "", fmt.Errorf("expected one result, found %d", len(evalResults))
+		return PlainTextEvalRes{}, fmt.Errorf("expected one result, found %d",
+			len(evalResults))
 	}
 
-	evalResult := evalResults[0]
-	return evalResult.DataEncBase64, nil
+	return evalResults[0], nil
 }
 
-func getPlainTextEvalResLua(resBytes []byte) (string, error) {
+func getPlainTextEvalResLua(resBytes []byte) (PlainTextEvalRes, error) {
 	L := lua.NewState()
 	defer L.Close()
 
 	doString := fmt.Sprintf(`res = %s`, resBytes)
 
 	if err := L.DoString(doString); err != nil {
-		return "", err
+		return PlainTextEvalRes{}, err
 	}
 
 	luaRes := L.Env.RawGetString("res")
 
 	if luaRes.Type() == lua.LTString {
-		return "", fmt.Errorf(lua.LVAsString(luaRes))
+		return PlainTextEvalRes{}, fmt.Errorf(lua.LVAsString(luaRes))
 	}
 
 	encodedDataLV := L.GetTable(luaRes, lua.LString("data_enc"))
 
-	encodedData := lua.LVAsString(encodedDataLV)
-
-	return encodedData, nil
+	return PlainTextEvalRes{
+		DataEncBase64: lua.LVAsString(encodedDataLV),
+		RawResults:    lua.LVAsBool(L.GetTable(luaRes, lua.LString("raw_results"))),
+		RegisterFuncs: lua.LVAsBool(L.GetTable(luaRes, lua.LString("register_funcs"))),
+	}, nil
 }
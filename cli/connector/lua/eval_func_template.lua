@@ -1,7 +1,5 @@
-local function func(...)
-    {{ .FunctionBody }}
-end
-local args = require('msgpack').decode(string.fromhex('{{ .ArgsEncoded }}'))
+{{ .FunctionDef }}
+local args = require('msgpack').decode(require('digest').base64_decode('{{ .ArgsEncoded }}'))
 
 local ret = {
     load(
@@ -12,5 +10,14 @@ local ret = {
 return {
     data_enc = require('digest').base64_encode(
         require('msgpack').encode(ret)
-    )
+    ),
+{{- if .ProbeCapabilities }}
+    raw_results = select(2, pcall(function()
+        return require('ffi') ~= nil and require('socket').iowait ~= nil and
+            box.session.fd() >= 0
+    end)) == true,
+    register_funcs = select(2, pcall(function()
+        return type(box.session.storage) == 'table'
+    end)) == true,
+{{- end }}
 }
@@ -0,0 +1,31 @@
+{{ .FunctionDef }}
+local msgpack = require('msgpack')
+local args = msgpack.decode(require('digest').base64_decode('{{ .ArgsEncoded }}'))
+
+local ret = {
+    load(
+        'local func, args = ... return func(unpack(args))',
+        '@eval'
+    )(func, args)
+}
+local data = msgpack.encode(ret)
+local frame = '\0' .. string.format('%08x', #data) .. data
+
+local ffi = require('ffi')
+local errno = require('errno')
+pcall(ffi.cdef, 'ssize_t write(int fd, const void *buf, size_t count);')
+local fd = box.session.fd()
+local buf = ffi.cast('const char *', frame)
+local written = 0
+while written < #frame do
+    local n = tonumber(ffi.C.write(fd, buf + written, #frame - written))
+    local err = ffi.errno()
+    if n >= 0 then
+        written = written + n
+    elseif err == errno.EAGAIN or err == errno.EINTR then
+        require('socket').iowait(fd, 'W')
+    else
+        error('failed to write the result: ' .. errno.strerror(err))
+    end
+end
+return true
@@ -0,0 +1,168 @@
+package connector
+
+import (
+	"bytes"
+	"fmt"
+	"io"
+	"net"
+	"strconv"
+	"time"
+)
+
+// plainTextReadSize is the initial size of the read buffer of the plain text
+// frames reader, the buffer grows to fit the largest frame.
+const plainTextReadSize = 4096
+
+const (
+	// rawFrameMagic is the first byte of a frame with a raw msgpack result,
+	// it is never sent by the console.
+	rawFrameMagic = 0
+	// rawFrameHeaderLen is the length of the raw frame header: the magic
+	// byte and the length of the payload in 8 hex digits.
+	rawFrameHeaderLen = 9
+)
+
+var endOfYAMLOutputBytes = []byte(endOfYAMLOutput)
+
+// plainTextFrameReader reads the frames of the plain text console protocol
+// from the connection: YAML documents starting with `---\n` or a `%TAG`
+// push tag and ending with `\n...\n`, Lua values ending with `;` and raw
+// msgpack results written by the eval function, see isRawFrame. The
+// data is read into a buffer in big portions and each byte is scanned once,
+// so a frame is read in linear time of its size.
+type plainTextFrameReader struct {
+	// conn is the connection to read from.
+	conn net.Conn
+	// buf is the read buffer, the unprocessed data is buf[start:end].
+	buf []byte
+	// start is the beginning of the current frame in the buffer.
+	start int
+	// end is the end of the read data in the buffer.
+	end int
+	// scanned is the number of bytes of the current frame that have been
+	// scanned for a terminator.
+	scanned int
+}
+
+// newPlainTextFrameReader creates a frames reader of the connection.
+func newPlainTextFrameReader(conn net.Conn) *plainTextFrameReader {
+	return &plainTextFrameReader{conn: conn, buf: make([]byte, plainTextReadSize)}
+}
+
+// isFramePrefix returns true if the data could be the beginning of a YAML
+// frame, so the type of the frame is not known yet.
+func isFramePrefix(data []byte) bool {
+	return len(data) < len(startOfYamlOutput) &&
+		(bytes.HasPrefix([]byte(startOfYamlOutput), data) ||
+			bytes.HasPrefix([]byte(tagPushPrefixYAML), data))
+}
+
+// scanFrame returns the length of the frame at the beginning of the data or
+// -1 if the frame is incomplete. The first scanned bytes of the data have
+// been scanned by the previous calls and do not contain the terminator.
+func scanFrame(data []byte, scanned int) int {
+	if isRawFrame(data) {
+		if len(data) < rawFrameHeaderLen {
+			return -1
+		}
+		payloadLen, err := strconv.ParseUint(string(data[1:rawFrameHeaderLen]), 16, 32)
+		if err != nil {
+			// The frame is invalid, it is reported by decodeRawFrame.
+			return rawFrameHeaderLen
+		}
+		if frameLen := rawFrameHeaderLen + int(payloadLen); len(data) >= frameLen {
+			return frameLen
+		}
+		return -1
+	}
+
+	if isFramePrefix(data) {
+		return -1
+	}
+
+	if bytes.HasPrefix(data, []byte(startOfYamlOutput)) ||
+		bytes.HasPrefix(data, []byte(tagPushPrefixYAML)) {
+		// The newline of the `---\n` prefix could be the first byte of the
+		// terminator, the terminator could be split between the portions.
+		from := scanned - len(endOfYAMLOutput) + 1
+		if from < len(startOfYamlOutput)-1 {
+			from = len(startOfYamlOutput) - 1
+		}
+		if pos := bytes.Index(data[from:], endOfYAMLOutputBytes); pos >= 0 {
+			return from + pos + len(endOfYAMLOutput)
+		}
+		return -1
+	}
+
+	if pos := bytes.IndexByte(data[scanned:], endOfLuaOutput[0]); pos >= 0 {
+		return scanned + pos + 1
+	}
+	return -1
+}
+
+// fill reads the next portion of the data into the buffer. The buffer is
+// compacted or grown if it is full.
+func (reader *plainTextFrameReader) fill() error {
+	if reader.end == len(reader.buf) {
+		if reader.start > 0 {
+			reader.end = copy(reader.buf, reader.buf[reader.start:reader.end])
+			reader.start = 0
+		} else {
+			buf := make([]byte, 2*len(reader.buf))
+			copy(buf, reader.buf[:reader.end])
+			reader.buf = buf
+		}
+	}
+
+	n, err := reader.conn.Read(reader.buf[reader.end:])
+	if err != nil && err != io.EOF {
+		return fmt.Errorf("failed to read: %s", err)
+	} else if n == 0 || err == io.EOF {
+		return io.EOF
+	}
+	reader.end += n
+	return nil
+}
+
+// readFrame reads the next frame. The frame is valid until the next call.
+func (reader *plainTextFrameReader) readFrame(readTimeout time.Duration) ([]byte, error) {
+	if readTimeout > 0 {
+		reader.conn.SetReadDeadline(time.Now().Add(readTimeout))
+	} else {
+		reader.conn.SetReadDeadline(time.Time{})
+	}
+
+	for {
+		data := reader.buf[reader.start:reader.end]
+		if frameLen := scanFrame(data, reader.scanned); frameLen >= 0 {
+			reader.start += frameLen
+			reader.scanned = 0
+			return data[:frameLen], nil
+		}
+		reader.scanned = len(data)
+
+		if err := reader.fill(); err != nil {
+			return nil, err
+		}
+	}
+}
+
+// isRawFrame returns true if the frame is a raw msgpack result: the magic
+// byte, the length of the payload in 8 hex digits and the payload.
+func isRawFrame(frame []byte) bool {
+	return len(frame) > 0 && frame[0] == rawFrameMagic
+}
+
+// decodeRawFrame decodes the raw msgpack result into the result if it is
+// not nil, otherwise the data is returned.
+func decodeRawFrame(frame []byte, result interface{}) ([]interface{}, error) {
+	if len(frame) < rawFrameHeaderLen {
+		return nil, fmt.Errorf("invalid result frame: the header is too short")
+	}
+	payloadLen, err := strconv.ParseUint(string(frame[1:rawFrameHeaderLen]), 16, 32)
+	if err != nil || int(payloadLen) != len(frame)-rawFrameHeaderLen {
+		return nil, fmt.Errorf("invalid result frame: bad payload length %q",
+			frame[1:rawFrameHeaderLen])
+	}
+	return decodeEvalResult(frame[rawFrameHeaderLen:], result)
+}
@@ -0,0 +1,98 @@
+package connector
+
+import (
+	"fmt"
+	"io"
+	"net"
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"github.com/vmihailenco/msgpack/v5"
+)
+
+// writeByPortions writes the data to the connection by portions of the size
+// and closes the connection.
+func writeByPortions(conn net.Conn, data string, size int) {
+	for len(data) > 0 {
+		n := size
+		if n > len(data) {
+			n = len(data)
+		}
+		if _, err := conn.Write([]byte(data[:n])); err != nil {
+			break
+		}
+		data = data[n:]
+	}
+	conn.Close()
+}
+
+func TestPlainTextFrameReader(t *testing.T) {
+	bigValue := strings.Repeat("x", 3*plainTextReadSize+1)
+	frames := []string{
+		"---\n- 1\n...\n",
+		"---\n...\n",
+		"%TAG !push! tag:tarantool.io/push,2018\n--- xx\n...\n",
+		"---\n- true\n...\n",
+		"---\n- error: 'a; b'\n...\n",
+		"---\n- '\n\n  ...\n\n  '\n...\n",
+		"-- Push\n\"xx\";",
+		"\n\"true\";",
+		"---\n- " + bigValue + "\n...\n",
+		"\"" + bigValue + "\";",
+		"\x0000000009\x91\xa7;\n...\n\x00",
+		"---\n- true\n...\n",
+		"\x00" + fmt.Sprintf("%08x", len(bigValue)) + bigValue,
+		"true;",
+	}
+
+	for _, size := range []int{1, 3, 7, 256, 100000} {
+		client, server := net.Pipe()
+		go writeByPortions(server, strings.Join(frames, ""), size)
+
+		reader := newPlainTextFrameReader(client)
+		for _, expected := range frames {
+			frame, err := reader.readFrame(0)
+			require.NoError(t, err)
+			require.Equal(t, expected, string(frame))
+		}
+		_, err := reader.readFrame(0)
+		assert.Equal(t, io.EOF, err)
+		client.Close()
+	}
+}
+
+func TestPlainTextFrameReader_incomplete(t *testing.T) {
+	for _, data := range []string{"", "--", "---\n- 1\n..", "\"xx\"", "\x00000",
+		"\x0000000002\x91"} {
+		client, server := net.Pipe()
+		go writeByPortions(server, data, 2)
+
+		reader := newPlainTextFrameReader(client)
+		_, err := reader.readFrame(0)
+		assert.Equal(t, io.EOF, err)
+		client.Close()
+	}
+}
+
+func TestDecodeRawFrame(t *testing.T) {
+	payload, err := msgpack.Marshal([]interface{}{"a", true})
+	require.NoError(t, err)
+	frame := append([]byte(fmt.Sprintf("\x00%08x", len(payload))), payload...)
+
+	data, err := decodeRawFrame(frame, nil)
+	require.NoError(t, err)
+	assert.Equal(t, []interface{}{"a", true}, data)
+
+	var result []interface{}
+	data, err = decodeRawFrame(frame, &result)
+	require.NoError(t, err)
+	assert.Nil(t, data)
+	assert.Equal(t, []interface{}{"a", true}, result)
+
+	_, err = decodeRawFrame(frame[:len(frame)-1], nil)
+	assert.ErrorContains(t, err, "invalid result frame: bad payload length")
+	_, err = decodeRawFrame([]byte("\x00000"), nil)
+	assert.EqualError(t, err, "invalid result frame: the header is too short")
+}
@@ -0,0 +1,129 @@
+package connector
+
+import (
+	"fmt"
+	"sync"
+)
+
+// poolEntry is a connection of the pool.
+type poolEntry struct {
+	// ready is closed when the connection is established or has failed.
+	ready chan struct{}
+	// conn is the established connection.
+	conn Connector
+	// err is the connection error.
+	err error
+	// discarded is true if the connection is closed as soon as it is
+	// established.
+	discarded bool
+}
+
+// Pool is a set of connections to instances. A connection is established
+// on the first request to the instance and is reused by the next requests.
+// The pool could be used by several goroutines, but a connection obtained
+// from the pool must not be used concurrently: the text protocol does not
+// support it.
+type Pool struct {
+	// conns are the connections by the instance.
+	conns map[string]*poolEntry
+	// closed is true if the pool is closed.
+	closed bool
+	// mutex protects the pool.
+	mutex sync.Mutex
+}
+
+// NewPool creates an empty pool of connections.
+func NewPool() *Pool {
+	return &Pool{conns: map[string]*poolEntry{}}
+}
+
+// getPoolKey returns the key of the connection in the pool.
+func getPoolKey(opts ConnectOpts) string {
+	return fmt.Sprintf("%s://%s@%s", opts.Network, opts.Username, opts.Address)
+}
+
+// Get returns the connection to the instance. The connection is established
+// if there is no connection to the instance in the pool yet. A failed
+// connection is not kept in the pool, so the next request tries again.
+func (pool *Pool) Get(opts ConnectOpts) (Connector, error) {
+	key := getPoolKey(opts)
+
+	pool.mutex.Lock()
+	if pool.closed {
+		pool.mutex.Unlock()
+		return nil, fmt.Errorf("the connection pool is closed")
+	}
+	entry, found := pool.conns[key]
+	if !found {
+		entry = &poolEntry{ready: make(chan struct{})}
+		pool.conns[key] = entry
+	}
+	pool.mutex.Unlock()
+
+	if found {
+		<-entry.ready
+		return entry.conn, entry.err
+	}
+
+	conn, err := Connect(opts)
+
+	pool.mutex.Lock()
+	defer pool.mutex.Unlock()
+	if err == nil && pool.closed {
+		// The pool has been closed while connecting.
+		conn.Close()
+		conn, err = nil, fmt.Errorf("the connection pool is closed")
+	} else if err == nil && entry.discarded {
+		conn.Close()
+		conn, err = nil, fmt.Errorf("the connection is discarded")
+	}
+	if err != nil && pool.conns[key] == entry {
+		delete(pool.conns, key)
+	}
+	entry.conn, entry.err = conn, err
+	close(entry.ready)
+	return conn, err
+}
+
+// Discard closes the connection to the instance and removes it from the
+// pool, e.g. if it is busy with a timed out request. The connection that is
+// being established is closed as soon as it is ready.
+func (pool *Pool) Discard(opts ConnectOpts) error {
+	key := getPoolKey(opts)
+
+	pool.mutex.Lock()
+	defer pool.mutex.Unlock()
+	entry, found := pool.conns[key]
+	if !found {
+		return nil
+	}
+	delete(pool.conns, key)
+	select {
+	case <-entry.ready:
+		return entry.conn.Close()
+	default:
+		entry.discarded = true
+	}
+	return nil
+}
+
+// Close closes all the connections of the pool. The connections that are
+// being established are closed as soon as they are ready.
+func (pool *Pool) Close() error {
+	pool.mutex.Lock()
+	defer pool.mutex.Unlock()
+
+	pool.closed = true
+	var firstErr error
+	for key, entry := range pool.conns {
+		select {
+		case <-entry.ready:
+			if err := entry.conn.Close(); err != nil && firstErr == nil {
+				firstErr = err
+			}
+			delete(pool.conns, key)
+		default:
+		}
+	}
+	return firstErr
+}
@@ -0,0 +1,65 @@
+package connector_test
+
+import (
+	"net"
+	"path/filepath"
+	"sync"
+	"sync/atomic"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+
+	. "github.com/tarantool/tt/cli/connector"
+)
+
+func TestPool(t *testing.T) {
+	socketPath := filepath.Join(t.TempDir(), "instance.control")
+	listener, err := net.Listen("unix", socketPath)
+	require.NoError(t, err)
+	defer listener.Close()
+	var accepted int32
+	go serveConsole(listener, &accepted)
+
+	pool := NewPool()
+	opts := ConnectOpts{Network: UnixNetwork, Address: socketPath}
+
+	// The connection is established once by concurrent requests.
+	var wg sync.WaitGroup
+	conns := make([]Connector, 4)
+	for i := range conns {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			conn, err := pool.Get(opts)
+			assert.NoError(t, err)
+			conns[i] = conn
+		}(i)
+	}
+	wg.Wait()
+	for _, conn := range conns {
+		assert.Same(t, conns[0], conn)
+	}
+	assert.Equal(t, int32(1), atomic.LoadInt32(&accepted))
+
+	// A failed connection is not kept in the pool.
+	badOpts := ConnectOpts{Network: UnixNetwork, Address: socketPath + ".bad"}
+	_, err = pool.Get(badOpts)
+	assert.Error(t, err)
+	_, err = pool.Get(badOpts)
+	assert.Error(t, err)
+
+	// A discarded connection is closed, the next request connects again.
+	require.NoError(t, pool.Discard(opts))
+	_, err = conns[0].Eval("return", nil, RequestOpts{})
+	assert.Error(t, err)
+	conn, err := pool.Get(opts)
+	require.NoError(t, err)
+	assert.NotSame(t, conns[0], conn)
+	assert.Equal(t, int32(2), atomic.LoadInt32(&accepted))
+	require.NoError(t, pool.Discard(badOpts))
+
+	require.NoError(t, pool.Close())
+	_, err = pool.Get(opts)
+	assert.EqualError(t, err, "the connection pool is closed")
+}
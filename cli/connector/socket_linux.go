@@ -0,0 +1,26 @@
+//go:build linux
+
+package connector
+
+import (
+	"fmt"
+	"path/filepath"
+
+	"golang.org/x/sys/unix"
+)
+
+// shortenSocketPath returns a short path to the unix socket. The directory
+// of the socket is opened and referred to by its descriptor in /proc, so the
+// length of the path does not depend on the directory path. The returned
+// function closes the directory, it must be called after the connection.
+func shortenSocketPath(socketPath string) (string, func(), error) {
+	dirFd, err := unix.Open(filepath.Dir(socketPath),
+		unix.O_PATH|unix.O_DIRECTORY|unix.O_CLOEXEC, 0)
+	if err != nil {
+		return "", nil, fmt.Errorf("failed to open the socket directory: %s", err)
+	}
+	release := func() {
+		unix.Close(dirFd)
+	}
+	return fmt.Sprintf("/proc/self/fd/%d/%s", dirFd, filepath.Base(socketPath)), release, nil
+}
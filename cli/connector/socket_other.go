@@ -0,0 +1,32 @@
+//go:build !linux
+
+package connector
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+)
+
+// shortenSocketPath returns a short path to the unix socket. A symbolic link
+// to the socket is created in a temporary directory under /tmp. The returned
+// function removes the link, it must be called after the connection.
+func shortenSocketPath(socketPath string) (string, func(), error) {
+	absPath, err := filepath.Abs(socketPath)
+	if err != nil {
+		return "", nil, err
+	}
+	linkDir, err := os.MkdirTemp("/tmp", "tt")
+	if err != nil {
+		return "", nil, fmt.Errorf("failed to create a socket link directory: %s", err)
+	}
+	release := func() {
+		os.RemoveAll(linkDir)
+	}
+	linkPath := filepath.Join(linkDir, "sock")
+	if err = os.Symlink(absPath, linkPath); err != nil {
+		release()
+		return "", nil, fmt.Errorf("failed to create a socket link: %s", err)
+	}
+	return linkPath, release, nil
+}
@@ -8,13 +8,20 @@ import (
 // and receives data as a plain text.
 type TextConnector struct {
 	conn net.Conn
+	// capabilities are the capabilities of the instance, they are nil until
+	// the first request.
+	capabilities *textCapabilities
+	// registeredFuncs are the names of the functions registered in the
+	// session.
+	registeredFuncs map[string]bool
 }
 
 // NewTextConnector creates a new TextConnector object. The object will close
 // the net.Conn argument in Close() call.
 func NewTextConnector(conn net.Conn) *TextConnector {
 	return &TextConnector{
-		conn: conn,
+		conn:            conn,
+		registeredFuncs: map[string]bool{},
 	}
 }
 
@@ -26,7 +33,44 @@ func (conn *TextConnector) Eval(expr string, args []interface{},
 		ReadTimeout:  opts.ReadTimeout,
 		ResData:      opts.ResData,
 	}
-	return evalPlainTextConn(conn.conn, expr, args, evalOpts)
+	if conn.capabilities == nil {
+		// The capabilities are received with the result of the first
+		// successful request, it is sent as is.
+		capabilities := textCapabilities{}
+		evalOpts.capabilities = &capabilities
+		data, err := evalPlainTextConn(conn.conn, expr, args, evalOpts)
+		if err == nil {
+			conn.capabilities = &capabilities
+		}
+		return data, err
+	}
+
+	// The function is registered in the session by the first request and
+	// only its name is sent by the next ones.
+	if conn.capabilities.registerFuncs {
+		name := getFuncName(expr)
+		if conn.registeredFuncs[name] || len(conn.registeredFuncs) < maxSessionFuncs {
+			evalOpts.FuncName = name
+			evalOpts.FuncRegistered = conn.registeredFuncs[name]
+		}
+	}
+
+	evalFunc := evalPlainTextConn
+	if conn.capabilities.rawResults {
+		evalFunc = evalPlainTextConnRaw
+	}
+	data, err := evalFunc(conn.conn, expr, args, evalOpts)
+	if evalOpts.FuncRegistered && isFuncNotRegistered(err) {
+		// The session storage has been cleared, the function has not been
+		// called, so it is registered again.
+		delete(conn.registeredFuncs, evalOpts.FuncName)
+		evalOpts.FuncRegistered = false
+		data, err = evalFunc(conn.conn, expr, args, evalOpts)
+	}
+	if err == nil && evalOpts.FuncName != "" {
+		conn.registeredFuncs[evalOpts.FuncName] = true
+	}
+	return data, err
 }
 
 // Close closes the net.Conn created from.
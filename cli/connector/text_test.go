@@ -1,11 +1,17 @@
 package connector_test
 
 import (
+	"bufio"
+	"encoding/base64"
 	"errors"
+	"fmt"
 	"net"
+	"strings"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"github.com/vmihailenco/msgpack/v5"
 
 	. "github.com/tarantool/tt/cli/connector"
 )
@@ -53,3 +59,98 @@ func TestTextConnector_Close_nil(t *testing.T) {
 
 	assert.NoError(t, conn.Close())
 }
+
+// evalResultResponse returns the console response with the eval result and
+// the capabilities of an instance without the raw results support.
+func evalResultResponse(t *testing.T) string {
+	result, err := msgpack.Marshal([]interface{}{"ok"})
+	require.NoError(t, err)
+	return fmt.Sprintf("---\n- data_enc: %s\n  raw_results: false\n"+
+		"  register_funcs: true\n...\n", base64.StdEncoding.EncodeToString(result))
+}
+
+// serveEvalRequests reads the eval requests from the connection, sends them
+// to the channel and writes the responses returned by respond.
+func serveEvalRequests(conn net.Conn, requests chan<- string, respond func(string) string) {
+	defer close(requests)
+	reader := bufio.NewReader(conn)
+	for {
+		request, err := reader.ReadString('\n')
+		if err != nil {
+			return
+		}
+		requests <- request
+		if _, err = conn.Write([]byte(respond(request))); err != nil {
+			return
+		}
+	}
+}
+
+func TestTextConnector_Eval_capabilities(t *testing.T) {
+	client, server := net.Pipe()
+	requests := make(chan string, 10)
+	response := evalResultResponse(t)
+	go serveEvalRequests(server, requests, func(string) string { return response })
+	conn := NewTextConnector(client)
+	defer conn.Close()
+
+	// The capabilities are requested with the first request, so it is the
+	// only one sent.
+	data, err := conn.Eval("return 'ok'", nil, RequestOpts{})
+	require.NoError(t, err)
+	assert.Equal(t, []interface{}{"ok"}, data)
+	request := <-requests
+	assert.Contains(t, request, "raw_results")
+	assert.NotContains(t, request, "tt_funcs")
+
+	// The function is registered by the next request and called by name
+	// afterwards.
+	_, err = conn.Eval("return 'ok'", nil, RequestOpts{})
+	require.NoError(t, err)
+	request = <-requests
+	assert.NotContains(t, request, "raw_results")
+	assert.Contains(t, request, "box.session.storage.tt_funcs = ")
+	assert.Contains(t, request, "return 'ok'")
+
+	_, err = conn.Eval("return 'ok'", nil, RequestOpts{})
+	require.NoError(t, err)
+	request = <-requests
+	assert.Contains(t, request, "local func = (box.session.storage.tt_funcs or {})[")
+	assert.NotContains(t, request, "return 'ok'")
+	assert.Len(t, requests, 0)
+}
+
+func TestTextConnector_Eval_notRegistered(t *testing.T) {
+	client, server := net.Pipe()
+	requests := make(chan string, 10)
+	response := evalResultResponse(t)
+	storageCleared := true
+	go serveEvalRequests(server, requests, func(request string) string {
+		// The function called by name is not found once.
+		if strings.Contains(request, "local func = (") && storageCleared {
+			storageCleared = false
+			return "---\n- error: 'eval:1: tt_funcs: the function is not registered'\n...\n"
+		}
+		return response
+	})
+	conn := NewTextConnector(client)
+	defer conn.Close()
+
+	for i := 0; i < 2; i++ {
+		_, err := conn.Eval("return 'ok'", nil, RequestOpts{})
+		require.NoError(t, err)
+		<-requests
+	}
+
+	// The function is registered again after the failed call by name.
+	data, err := conn.Eval("return 'ok'", nil, RequestOpts{})
+	require.NoError(t, err)
+	assert.Equal(t, []interface{}{"ok"}, data)
+	assert.Contains(t, <-requests, "local func = (")
+	assert.Contains(t, <-requests, "box.session.storage.tt_funcs = ")
+
+	_, err = conn.Eval("return 'ok'", nil, RequestOpts{})
+	require.NoError(t, err)
+	assert.Contains(t, <-requests, "local func = (")
+	assert.Len(t, requests, 0)
+}
@@ -291,17 +291,32 @@ func createEnv(opts *config.CliOpts, destPath string) error {
 	log.Infof("Generating new %s for the new package", configure.ConfigName)
 
 	appOpts := config.AppOpts{
-		InstancesEnabled: instancesEnabledPath,
-		BinDir:           filepath.Join(envPath, binPath),
-		RunDir:           filepath.Join(varPath, runPath),
-		WalDir:           filepath.Join(varPath, dataPath),
-		VinylDir:         filepath.Join(varPath, dataPath),
-		MemtxDir:         filepath.Join(varPath, dataPath),
-		LogDir:           filepath.Join(varPath, logPath),
-		LogMaxSize:       opts.App.LogMaxSize,
-		LogMaxAge:        opts.App.LogMaxAge,
-		LogMaxBackups:    opts.App.LogMaxBackups,
-		Restartable:      opts.App.Restartable,
+		InstancesEnabled:     instancesEnabledPath,
+		BinDir:               filepath.Join(envPath, binPath),
+		RunDir:               filepath.Join(varPath, runPath),
+		WalDir:               filepath.Join(varPath, dataPath),
+		VinylDir:             filepath.Join(varPath, dataPath),
+		MemtxDir:             filepath.Join(varPath, dataPath),
+		LogDir:               filepath.Join(varPath, logPath),
+		LogMaxSize:           opts.App.LogMaxSize,
+		LogMaxAge:            opts.App.LogMaxAge,
+		LogMaxBackups:        opts.App.LogMaxBackups,
+		LogPassthrough:       opts.App.LogPassthrough,
+		LogCompress:          opts.App.LogCompress,
+		LogCompressLevel:     opts.App.LogCompressLevel,
+		LogCompressJobs:      opts.App.LogCompressJobs,
+		LogMaxTotalSize:      opts.App.LogMaxTotalSize,
+		Restartable:          opts.App.Restartable,
+		RestartBackoffMin:    opts.App.RestartBackoffMin,
+		RestartBackoffMax:    opts.App.RestartBackoffMax,
+		RestartBackoffFactor: opts.App.RestartBackoffFactor,
+		RestartMinUptime:     opts.App.RestartMinUptime,
+		CrashLoopThreshold:   opts.App.CrashLoopThreshold,
+		ProbeInterval:        opts.App.ProbeInterval,
+		ProbeTimeout:         opts.App.ProbeTimeout,
+		ProbeMaxFailures:     opts.App.ProbeMaxFailures,
+		CPUSet:               opts.App.CPUSet,
+		NumaNode:             opts.App.NumaNode,
 	}
 	moduleOpts := config.ModulesOpts{
 		Directory: filepath.Join(envPath, modulesPath),
@@ -0,0 +1,122 @@
+package process_utils
+
+import (
+	"fmt"
+	"io/ioutil"
+	"os"
+	"path/filepath"
+	"strconv"
+	"strings"
+	"time"
+)
+
+// clockTicks is the number of clock ticks per second used in procfs
+// (USER_HZ). It is 100 on all the architectures supported by Linux.
+const clockTicks = 100
+
+// Fields indexes of /proc/<pid>/stat counted after the command name,
+// see `man 5 proc`.
+const (
+	statUtimeIdx     = 11
+	statStimeIdx     = 12
+	statThreadsIdx   = 17
+	statStartTimeIdx = 19
+	statRssIdx       = 21
+)
+
+// ProcessStats contains the resource usage statistics of a process.
+type ProcessStats struct {
+	// Uptime is the time since the process start.
+	Uptime time.Duration
+	// RSS is the resident set size in bytes.
+	RSS int64
+	// CPUTime is the CPU time spent by the process in user and system modes.
+	CPUTime time.Duration
+	// Threads is the number of threads of the process.
+	Threads int
+	// FDs is the number of open file descriptors of the process. It is -1
+	// if the descriptors are not accessible.
+	FDs int
+}
+
+// parseProcStat returns the fields of /proc/<pid>/stat content starting
+// from the process state.
+func parseProcStat(stat string) ([]string, error) {
+	// The format is "pid (comm) state ppid ...", comm may contain
+	// spaces and brackets, so the last bracket is searched.
+	commEnd := strings.LastIndexByte(stat, ')')
+	if commEnd == -1 {
+		return nil, fmt.Errorf("unexpected format of the process stat")
+	}
+	return strings.Fields(stat[commEnd+1:]), nil
+}
+
+// readProcStat reads /proc/<pid>/stat and returns its fields starting from
+// the process state.
+func readProcStat(pid int) ([]string, error) {
+	stat, err := ioutil.ReadFile(filepath.Join("/proc", strconv.Itoa(pid), "stat"))
+	if err != nil {
+		return nil, err
+	}
+	return parseProcStat(string(stat))
+}
+
+// getSystemUptime returns the time since the system boot.
+func getSystemUptime() (time.Duration, error) {
+	data, err := ioutil.ReadFile("/proc/uptime")
+	if err != nil {
+		return 0, err
+	}
+	fields := strings.Fields(string(data))
+	if len(fields) == 0 {
+		return 0, fmt.Errorf("unexpected format of /proc/uptime")
+	}
+	uptime, err := strconv.ParseFloat(fields[0], 64)
+	if err != nil {
+		return 0, err
+	}
+	return time.Duration(uptime * float64(time.Second)), nil
+}
+
+// ticksToDuration converts the procfs clock ticks to time.Duration.
+func ticksToDuration(ticks uint64) time.Duration {
+	return time.Duration(ticks) * time.Second / clockTicks
+}
+
+// GetProcessStats returns the resource usage statistics of the process.
+// The information is collected from the procfs, so it is available on
+// Linux only.
+func GetProcessStats(pid int) (ProcessStats, error) {
+	var stats ProcessStats
+
+	fields, err := readProcStat(pid)
+	if err != nil {
+		return stats, fmt.Errorf("can't get statistics of the process %d: %s", pid, err)
+	}
+	if len(fields) <= statRssIdx {
+		return stats, fmt.Errorf("can't get statistics of the process %d: "+
+			"unexpected format of the process stat", pid)
+	}
+
+	var values [statRssIdx + 1]uint64
+	for _, idx := range []int{statUtimeIdx, statStimeIdx, statThreadsIdx,
+		statStartTimeIdx, statRssIdx} {
+		if values[idx], err = strconv.ParseUint(fields[idx], 10, 64); err != nil {
+			return stats, fmt.Errorf("can't get statistics of the process %d: %s", pid, err)
+		}
+	}
+
+	stats.CPUTime = ticksToDuration(values[statUtimeIdx] + values[statStimeIdx])
+	stats.Threads = int(values[statThreadsIdx])
+	stats.RSS = int64(values[statRssIdx]) * int64(os.Getpagesize())
+	if systemUptime, err := getSystemUptime(); err == nil {
+		stats.Uptime = systemUptime - ticksToDuration(values[statStartTimeIdx])
+	}
+
+	stats.FDs = -1
+	if fds, err := os.ReadDir(filepath.Join("/proc", strconv.Itoa(pid), "fd")); err == nil {
+		stats.FDs = len(fds)
+	}
+
+	return stats, nil
+}
@@ -0,0 +1,37 @@
+package process_utils
+
+import (
+	"os"
+	"runtime"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestParseProcStat(t *testing.T) {
+	fields, err := parseProcStat("42 (tarantool (x) y) S 1 42 42 0 -1 4194560")
+	require.NoError(t, err)
+	assert.Equal(t, []string{"S", "1", "42", "42", "0", "-1", "4194560"}, fields)
+
+	_, err = parseProcStat("42 tarantool")
+	assert.Error(t, err)
+}
+
+func TestGetProcessStats(t *testing.T) {
+	if runtime.GOOS != "linux" {
+		t.Skip("procfs is available on Linux only")
+	}
+
+	stats, err := GetProcessStats(os.Getpid())
+	require.NoError(t, err)
+	assert.Greater(t, stats.RSS, int64(0))
+	assert.GreaterOrEqual(t, stats.Threads, 1)
+	assert.Greater(t, stats.FDs, 0)
+	assert.GreaterOrEqual(t, stats.Uptime, time.Duration(0))
+	assert.GreaterOrEqual(t, stats.CPUTime, time.Duration(0))
+
+	_, err = GetProcessStats(-1)
+	assert.Error(t, err)
+}
@@ -20,6 +20,10 @@ import (
 // others: nil
 const defaultDirPerms = 0770
 
+// killGracePeriod is the time given to a process to terminate after
+// SIGKILL is sent to it or to its children.
+const killGracePeriod = 5 * time.Second
+
 type ProcessState struct {
 	Code        int
 	ColorSprint func(a ...interface{}) string
@@ -131,8 +135,9 @@ func CreatePIDFile(pidFileName string) error {
 	return nil
 }
 
-// StopProcess stops the process by pidFile.
-func StopProcess(pidFile string) (int, error) {
+// InterruptProcess sends SIGINT to the process from the pidFile.
+// Returns PID of the process.
+func InterruptProcess(pidFile string) (int, error) {
 	pid, err := GetPIDFromFile(pidFile)
 	if err != nil {
 		return 0, err
@@ -147,13 +152,81 @@ func StopProcess(pidFile string) (int, error) {
 		return 0, fmt.Errorf(`can't terminate the process. Error: "%v"`, err)
 	}
 
-	if res := waitProcessTermination(pid, 30*time.Second, 100*time.Millisecond); !res {
+	return pid, nil
+}
+
+// StopProcess stops the process by pidFile.
+func StopProcess(pidFile string) (int, error) {
+	pid, err := InterruptProcess(pidFile)
+	if err != nil {
+		return 0, err
+	}
+
+	if res := WaitProcessTermination(pid, 30*time.Second); !res {
 		return 0, fmt.Errorf("can't terminate the process")
 	}
 
 	return pid, nil
 }
 
+// KillProcess kills the process and its children by a SIGKILL signal.
+// The children are killed first, so the process could handle their
+// termination.
+func KillProcess(pid int) error {
+	children, err := GetChildPIDs(pid)
+	if err != nil {
+		return err
+	}
+	for _, child := range children {
+		syscall.Kill(child, syscall.SIGKILL)
+	}
+
+	// Give the process a chance to finish gracefully after the children
+	// termination.
+	if WaitProcessTermination(pid, killGracePeriod) {
+		return nil
+	}
+
+	if err = syscall.Kill(pid, syscall.SIGKILL); err != nil {
+		return fmt.Errorf(`can't kill the process. Error: "%v"`, err)
+	}
+	if !WaitProcessTermination(pid, killGracePeriod) {
+		return fmt.Errorf("can't kill the process")
+	}
+
+	return nil
+}
+
+// GetChildPIDs returns PIDs of the process children. The information is
+// collected from the procfs, so it is available on Linux only.
+func GetChildPIDs(pid int) ([]int, error) {
+	procEntries, err := os.ReadDir("/proc")
+	if err != nil {
+		return nil, fmt.Errorf("can't get children of the process %d: %s", pid, err)
+	}
+
+	children := []int{}
+	for _, entry := range procEntries {
+		childPid, err := strconv.Atoi(entry.Name())
+		if err != nil {
+			continue
+		}
+		fields, err := readProcStat(childPid)
+		if err != nil {
+			// The process has been terminated.
+			continue
+		}
+		if len(fields) < 2 {
+			continue
+		}
+		if ppid, err := strconv.Atoi(fields[1]); err == nil && ppid == pid {
+			children = append(children, childPid)
+		}
+	}
+
+	return children, nil
+}
+
 // ProcessStatus returns the status of the process.
 func ProcessStatus(pidFile string) ProcessState {
 	pid, err := GetPIDFromFile(pidFile)
@@ -186,31 +259,35 @@ func IsProcessAlive(pid int) (bool, error) {
 	return true, nil
 }
 
-// waitProcessTermination waits while the process will be terminated.
+// WaitProcessTermination waits while the process will be terminated.
 // Returns true if the process was terminated and false if is steel alive.
-func waitProcessTermination(pid int, timeout time.Duration,
+func WaitProcessTermination(pid int, timeout time.Duration) bool {
+	return waitProcessTermination(pid, timeout, 100*time.Millisecond)
+}
+
+// pollProcessTermination waits while the process will be terminated by
+// checking the process state every checkPeriod.
+// Returns true if the process was terminated and false if is steel alive.
+func pollProcessTermination(pid int, timeout time.Duration,
 	checkPeriod time.Duration) bool {
 	if res, _ := IsProcessAlive(pid); !res {
 		return true
 	}
 
-	result := false
 	breakTimer := time.NewTimer(timeout)
-loop:
+	defer breakTimer.Stop()
+	checkTicker := time.NewTicker(checkPeriod)
+	defer checkTicker.Stop()
+
 	for {
 		select {
 		case <-breakTimer.C:
+			res, _ := IsProcessAlive(pid)
+			return !res
+		case <-checkTicker.C:
 			if res, _ := IsProcessAlive(pid); !res {
-				result = true
-			}
-			break loop
-		case <-time.After(checkPeriod):
-			if res, _ := IsProcessAlive(pid); !res {
-				result = true
-				break loop
+				return true
 			}
 		}
 	}
-
-	return result
 }
@@ -0,0 +1,78 @@
+package process_utils
+
+import (
+	"os"
+	"os/exec"
+	"runtime"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestGetChildPIDs(t *testing.T) {
+	if runtime.GOOS != "linux" {
+		t.Skip("procfs is available on Linux only")
+	}
+
+	cmd := exec.Command("sleep", "10")
+	require.NoError(t, cmd.Start())
+	t.Cleanup(func() {
+		cmd.Process.Kill()
+		cmd.Wait()
+	})
+
+	children, err := GetChildPIDs(os.Getpid())
+	require.NoError(t, err)
+	assert.Contains(t, children, cmd.Process.Pid)
+
+	children, err = GetChildPIDs(cmd.Process.Pid)
+	require.NoError(t, err)
+	assert.Empty(t, children)
+}
+
+func TestKillProcess(t *testing.T) {
+	if runtime.GOOS != "linux" {
+		t.Skip("procfs is available on Linux only")
+	}
+
+	cmd := exec.Command("sleep", "10")
+	require.NoError(t, cmd.Start())
+	waitDone := make(chan struct{})
+	go func() {
+		cmd.Wait()
+		close(waitDone)
+	}()
+
+	require.NoError(t, KillProcess(cmd.Process.Pid))
+	<-waitDone
+	alive, _ := IsProcessAlive(cmd.Process.Pid)
+	assert.False(t, alive)
+}
+
+func TestWaitProcessTermination(t *testing.T) {
+	cmd := exec.Command("sleep", "0.2")
+	require.NoError(t, cmd.Start())
+	go cmd.Wait()
+
+	startTime := time.Now()
+	assert.True(t, WaitProcessTermination(cmd.Process.Pid, 5*time.Second))
+	assert.Less(t, time.Since(startTime), 2*time.Second)
+
+	// The process is already terminated.
+	assert.True(t, WaitProcessTermination(cmd.Process.Pid, time.Second))
+}
+
+func TestWaitProcessTerminationTimeout(t *testing.T) {
+	cmd := exec.Command("sleep", "10")
+	require.NoError(t, cmd.Start())
+	t.Cleanup(func() {
+		cmd.Process.Kill()
+		cmd.Wait()
+	})
+
+	startTime := time.Now()
+	assert.False(t, WaitProcessTermination(cmd.Process.Pid, 200*time.Millisecond))
+	assert.GreaterOrEqual(t, time.Since(startTime), 200*time.Millisecond)
+}
@@ -0,0 +1,50 @@
+//go:build linux
+
+package process_utils
+
+import (
+	"time"
+
+	"golang.org/x/sys/unix"
+)
+
+// waitProcessTermination waits while the process will be terminated.
+// A process file descriptor (pidfd, Linux 5.3+) is used to get notified
+// about the termination immediately. If pidfd is not supported, the process
+// state is checked every checkPeriod.
+// Returns true if the process was terminated and false if is steel alive.
+func waitProcessTermination(pid int, timeout time.Duration,
+	checkPeriod time.Duration) bool {
+	pidfd, err := unix.PidfdOpen(pid, 0)
+	if err == unix.ESRCH {
+		return true
+	} else if err != nil {
+		return pollProcessTermination(pid, timeout, checkPeriod)
+	}
+	defer unix.Close(pidfd)
+
+	// The pidfd becomes readable when the process terminates.
+	fds := []unix.PollFd{{Fd: int32(pidfd), Events: unix.POLLIN}}
+	deadline := time.Now().Add(timeout)
+	for {
+		remaining := time.Until(deadline)
+		if remaining < 0 {
+			remaining = 0
+		}
+		// Round up to not wake up right before the deadline.
+		timeoutMs := int((remaining + time.Millisecond - 1) / time.Millisecond)
+
+		n, err := unix.Poll(fds, timeoutMs)
+		if err == unix.EINTR {
+			continue
+		} else if err != nil {
+			return pollProcessTermination(pid, time.Until(deadline), checkPeriod)
+		}
+
+		if n > 0 {
+			return true
+		}
+		res, _ := IsProcessAlive(pid)
+		return !res
+	}
+}
@@ -0,0 +1,14 @@
+//go:build !linux
+
+package process_utils
+
+import (
+	"time"
+)
+
+// waitProcessTermination waits while the process will be terminated.
+// Returns true if the process was terminated and false if is steel alive.
+func waitProcessTermination(pid int, timeout time.Duration,
+	checkPeriod time.Duration) bool {
+	return pollProcessTermination(pid, timeout, checkPeriod)
+}
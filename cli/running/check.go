@@ -0,0 +1,223 @@
+package running
+
+import (
+	"bufio"
+	"crypto/sha256"
+	"encoding/hex"
+	"fmt"
+	"io"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"runtime"
+	"strings"
+	"sync"
+
+	"github.com/tarantool/tt/cli/cmdcontext"
+	"github.com/tarantool/tt/cli/util"
+)
+
+const (
+	// checkCacheFileName is the name of the file with the checked files
+	// hashes in the user cache directory.
+	checkCacheFileName = "check_cache"
+	// checkCacheMaxEntries is the maximum number of hashes kept in the cache.
+	checkCacheMaxEntries = 10000
+)
+
+// CheckResult is the result of the syntax check of an application file.
+type CheckResult struct {
+	// AppPath is the path to the application file.
+	AppPath string
+	// Cached is true if the file with the same content has been checked
+	// before and the check has been skipped.
+	Cached bool
+	// Err is the syntax error.
+	Err error
+}
+
+// CheckCache contains the hashes of the files that have been successfully
+// checked by the same tarantool executable.
+type CheckCache struct {
+	// path is the path to the cache file, the cache is not saved if empty.
+	path string
+	// tarantoolID identifies the tarantool executable used for the checks.
+	tarantoolID string
+	// hashes are the hashes of the checked files in the order of addition.
+	hashes []string
+	// checked is the set of the hashes.
+	checked map[string]bool
+}
+
+// getTarantoolID returns the identifier of the tarantool executable. It is
+// changed on the executable update.
+func getTarantoolID(tarantool string) string {
+	path, err := exec.LookPath(tarantool)
+	if err != nil {
+		return tarantool
+	}
+	if absPath, err := filepath.Abs(path); err == nil {
+		path = absPath
+	}
+	signature := util.GetFileSignature(path)
+	return fmt.Sprintf("%s:%d:%d:%d", path, signature.Inode, signature.ModTime, signature.Size)
+}
+
+// GetCheckCacheFile returns the path to the check cache file in the user
+// cache directory.
+func GetCheckCacheFile() (string, error) {
+	cacheDir, err := os.UserCacheDir()
+	if err != nil {
+		return "", err
+	}
+	return filepath.Join(cacheDir, "tt", checkCacheFileName), nil
+}
+
+// LoadCheckCache loads the cache of the checks done by the tarantool
+// executable. The cache is empty if the file does not exist or has been
+// created for another executable. The cache is not saved if path is empty.
+func LoadCheckCache(path string, tarantool string) *CheckCache {
+	cache := &CheckCache{
+		path:        path,
+		tarantoolID: getTarantoolID(tarantool),
+		checked:     map[string]bool{},
+	}
+	if path == "" {
+		return cache
+	}
+
+	file, err := os.Open(path)
+	if err != nil {
+		return cache
+	}
+	defer file.Close()
+
+	scanner := bufio.NewScanner(file)
+	if !scanner.Scan() || scanner.Text() != cache.tarantoolID {
+		return cache
+	}
+	for scanner.Scan() {
+		cache.add(scanner.Text())
+	}
+	return cache
+}
+
+// add adds the hash to the cache.
+func (cache *CheckCache) add(hash string) {
+	if hash == "" || cache.checked[hash] {
+		return
+	}
+	cache.checked[hash] = true
+	cache.hashes = append(cache.hashes, hash)
+}
+
+// Save writes the cache to the file. The oldest hashes are dropped if
+// there are too many of them.
+func (cache *CheckCache) Save() error {
+	if cache.path == "" {
+		return nil
+	}
+	hashes := cache.hashes
+	if len(hashes) > checkCacheMaxEntries {
+		hashes = hashes[len(hashes)-checkCacheMaxEntries:]
+	}
+
+	if err := os.MkdirAll(filepath.Dir(cache.path), defaultDirPerms); err != nil {
+		return err
+	}
+	data := cache.tarantoolID + "\n" + strings.Join(hashes, "\n") + "\n"
+	tmpFile, err := os.CreateTemp(filepath.Dir(cache.path), filepath.Base(cache.path)+".*")
+	if err != nil {
+		return err
+	}
+	defer os.Remove(tmpFile.Name())
+	if _, err = tmpFile.WriteString(data); err != nil {
+		tmpFile.Close()
+		return err
+	}
+	if err = tmpFile.Close(); err != nil {
+		return err
+	}
+	return os.Rename(tmpFile.Name(), cache.path)
+}
+
+// hashFile returns the SHA256 hash of the file content.
+func hashFile(path string) (string, error) {
+	file, err := os.Open(path)
+	if err != nil {
+		return "", err
+	}
+	defer file.Close()
+
+	hash := sha256.New()
+	if _, err := io.Copy(hash, file); err != nil {
+		return "", err
+	}
+	return hex.EncodeToString(hash.Sum(nil)), nil
+}
+
+// CheckFiles checks the syntax of the application files by jobs workers.
+// The files with the same content are checked once if the check succeeds,
+// the files found in the cache are not checked. The successfully checked
+// files are added to the cache. The results are returned in the order of
+// the paths.
+func CheckFiles(cmdCtx *cmdcontext.CmdCtx, paths []string, jobs int,
+	cache *CheckCache) []CheckResult {
+	results := make([]CheckResult, len(paths))
+	// The paths of the files to check by the content hash.
+	pathsByHash := map[string][]int{}
+	hashes := []string{}
+	for i, path := range paths {
+		results[i].AppPath = path
+		hash, err := hashFile(path)
+		if err != nil {
+			results[i].Err = err
+			continue
+		}
+		if cache.checked[hash] {
+			results[i].Cached = true
+			continue
+		}
+		if _, found := pathsByHash[hash]; !found {
+			hashes = append(hashes, hash)
+		}
+		pathsByHash[hash] = append(pathsByHash[hash], i)
+	}
+
+	if jobs < 1 {
+		jobs = runtime.NumCPU()
+	}
+	hashesCh := make(chan string)
+	var wg sync.WaitGroup
+	var cacheMutex sync.Mutex
+	for i := 0; i < jobs && i < len(hashes); i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for hash := range hashesCh {
+				indexes := pathsByHash[hash]
+				err := checkFile(cmdCtx.Cli.TarantoolExecutable, paths[indexes[0]])
+				results[indexes[0]].Err = err
+				for _, i := range indexes[1:] {
+					// The error describes the checked file, so the other
+					// files with the same content are checked on their own.
+					if err != nil {
+						results[i].Err = checkFile(cmdCtx.Cli.TarantoolExecutable, paths[i])
+					}
+				}
+				if err == nil {
+					cacheMutex.Lock()
+					cache.add(hash)
+					cacheMutex.Unlock()
+				}
+			}
+		}()
+	}
+	for _, hash := range hashes {
+		hashesCh <- hash
+	}
+	close(hashesCh)
+	wg.Wait()
+
+	return results
+}
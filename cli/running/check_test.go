@@ -0,0 +1,92 @@
+package running
+
+import (
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"github.com/tarantool/tt/cli/cmdcontext"
+)
+
+// fakeTarantoolCheck is a script that imitates the syntax check: a file
+// with the "bad" word fails the check. The checked files are counted.
+const fakeTarantoolCheck = `#!/bin/sh
+echo "$TT_CLI_INSTANCE" >> "$(dirname "$0")/checked"
+if grep -q bad "$TT_CLI_INSTANCE"; then
+    echo "$TT_CLI_INSTANCE: syntax errors detected" >&2
+    exit 1
+fi
+`
+
+func TestCheckFiles(t *testing.T) {
+	tempDir := t.TempDir()
+	tarantool := filepath.Join(tempDir, "tarantool")
+	require.NoError(t, os.WriteFile(tarantool, []byte(fakeTarantoolCheck), 0755))
+
+	files := map[string]string{"first.lua": "good", "second.lua": "good", "third.lua": "bad",
+		"fourth.lua": "bad"}
+	paths := []string{}
+	for name, content := range files {
+		path := filepath.Join(tempDir, name)
+		require.NoError(t, os.WriteFile(path, []byte(content), 0644))
+		paths = append(paths, path)
+	}
+
+	cmdCtx := cmdcontext.CmdCtx{}
+	cmdCtx.Cli.TarantoolExecutable = tarantool
+	cacheFile := filepath.Join(tempDir, "cache", "check_cache")
+	readChecked := func() []string {
+		data, err := os.ReadFile(filepath.Join(tempDir, "checked"))
+		require.NoError(t, err)
+		os.Remove(filepath.Join(tempDir, "checked"))
+		return strings.Fields(string(data))
+	}
+
+	isBad := func(path string) bool {
+		return files[filepath.Base(path)] == "bad"
+	}
+	badPaths := []string{filepath.Join(tempDir, "third.lua"), filepath.Join(tempDir, "fourth.lua")}
+
+	// The files with the same content are checked once if the check succeeds,
+	// the error of each failed file describes the file itself.
+	cache := LoadCheckCache(cacheFile, tarantool)
+	results := CheckFiles(&cmdCtx, paths, 2, cache)
+	require.Len(t, results, 4)
+	for i, result := range results {
+		assert.Equal(t, paths[i], result.AppPath)
+		assert.False(t, result.Cached)
+		if isBad(result.AppPath) {
+			assert.EqualError(t, result.Err, result.AppPath+": syntax errors detected\n")
+		} else {
+			assert.NoError(t, result.Err)
+		}
+	}
+	assert.Len(t, readChecked(), 3)
+	require.NoError(t, cache.Save())
+
+	// The successfully checked files are not checked again.
+	cache = LoadCheckCache(cacheFile, tarantool)
+	results = CheckFiles(&cmdCtx, paths, 2, cache)
+	for _, result := range results {
+		if isBad(result.AppPath) {
+			assert.False(t, result.Cached)
+			assert.Error(t, result.Err)
+		} else {
+			assert.True(t, result.Cached)
+			assert.NoError(t, result.Err)
+		}
+	}
+	assert.ElementsMatch(t, badPaths, readChecked())
+
+	// The cache is dropped if the tarantool executable is changed.
+	require.NoError(t, os.WriteFile(tarantool, []byte(fakeTarantoolCheck+"\n"), 0755))
+	cache = LoadCheckCache(cacheFile, tarantool)
+	results = CheckFiles(&cmdCtx, paths, 0, cache)
+	for _, result := range results {
+		assert.False(t, result.Cached)
+	}
+	assert.Len(t, readChecked(), 3)
+}
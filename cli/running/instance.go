@@ -47,6 +47,11 @@ type Instance struct {
 	env []string
 	// consoleSocket is a Unix domain socket to be used as "admin port".
 	consoleSocket string
+	// placement describes the CPUs and the NUMA node the instance is bound to.
+	placement Placement
+	// timingsFile is the file to record the startup events to. The events
+	// are not recorded if it is empty.
+	timingsFile string
 	// waitMutex is used to prevent several invokes of the "Wait"
 	// for the same process.
 	// https://github.com/golang/go/issues/28461
@@ -71,6 +76,11 @@ func NewInstance(tarantoolPath string, instanceCtx *InstanceCtx, env []string,
 		return nil, err
 	}
 
+	timingsFile := ""
+	if os.Getenv(TimingsEnv) != "" {
+		timingsFile = getTimingsFile(instanceCtx)
+	}
+
 	return &Instance{
 		tarantoolPath: tarantoolPath,
 		appPath:       instanceCtx.AppPath,
@@ -82,6 +92,8 @@ func NewInstance(tarantoolPath string, instanceCtx *InstanceCtx, env []string,
 		walDir:        instanceCtx.WalDir,
 		vinylDir:      instanceCtx.VinylDir,
 		memtxDir:      instanceCtx.MemtxDir,
+		placement:     instanceCtx.Placement,
+		timingsFile:   timingsFile,
 	}, nil
 }
 
@@ -118,6 +130,8 @@ func (inst *Instance) Wait() error {
 // Start starts the Instance with the specified parameters.
 func (inst *Instance) Start() error {
 	inst.Cmd = exec.Command(inst.tarantoolPath, "-")
+	// In the passthrough mode the writer is the log file, it is passed
+	// to the instance as is.
 	inst.Cmd.Stdout = inst.logger.Writer()
 	inst.Cmd.Stderr = inst.logger.Writer()
 	StdinPipe, err := inst.Cmd.StdinPipe()
@@ -172,9 +186,23 @@ func (inst *Instance) Start() error {
 			"TARANTOOL_CFG="+filepath.Dir(inst.appPath)+"/instances.yml")
 	}
 	inst.Cmd.Env = append(inst.Cmd.Env, "TARANTOOL_WORKDIR="+inst.walDir)
+	// In the passthrough mode tarantool writes to the log file by itself,
+	// so it could reopen the file on SIGHUP after the rotation.
+	if inst.logger.IsPassthrough() && os.Getenv("TT_LOG") == "" {
+		inst.Cmd.Env = append(inst.Cmd.Env, "TT_LOG="+inst.logger.GetOpts().Filename)
+	}
+
+	// The launcher appends the startup events to the file.
+	if inst.timingsFile != "" {
+		if err := startTimings(inst.timingsFile); err != nil {
+			inst.logger.Printf(`Watchdog(WARN): failed to record the startup timings: "%v".`, err)
+		} else {
+			inst.Cmd.Env = append(inst.Cmd.Env, timingsFileEnv+"="+inst.timingsFile)
+		}
+	}
 
 	// Start an Instance.
-	if err := inst.Cmd.Start(); err != nil {
+	if err := startWithPlacement(inst.Cmd, inst.placement); err != nil {
 		return err
 	}
 	StdinPipe.Write([]byte(instanceLauncher))
@@ -7,6 +7,7 @@ local console = require('console')
 local log = require('log')
 local title = require('title')
 local ffi = require('ffi')
+local clock = require('clock')
 local iter  = fun.iter
 
 --- Accumulating function for iter:reduce().
@@ -195,6 +196,43 @@ end
 
 local origin_cfg = box.cfg
 
+--- Appends the startup event to the timings file passed through
+-- "TT_CLI_TIMINGS_FILE". The events are used by "tt start --timings".
+local function record_timing(event)
+    local timings_file = os.getenv('TT_CLI_TIMINGS_FILE')
+    if timings_file == nil or timings_file == '' then
+        return
+    end
+    local file = io.open(timings_file, 'a')
+    if file == nil then
+        return
+    end
+    file:write(string.format('%s %.6f\n', event, clock.time()))
+    file:close()
+end
+
+--- Sets the hooks recording the box.cfg and recovery events.
+local function set_timing_hooks()
+    if os.getenv('TT_CLI_TIMINGS_FILE') == nil then
+        return
+    end
+    -- box.ctl.on_recovery_state is available since tarantool 2.10.
+    if box.ctl.on_recovery_state ~= nil then
+        box.ctl.on_recovery_state(function(state)
+            record_timing(state)
+        end)
+    end
+    -- box.cfg is replaced by tarantool after the first call, so only the
+    -- initial configuration is recorded.
+    local cfg = box.cfg
+    box.cfg = function(...)
+        record_timing('box_cfg')
+        local res = cfg(...)
+        record_timing('box_cfg_done')
+        return res
+    end
+end
+
 --- Wrapper for cfg to push our values over tarantool.
 local function cfg_wrapper(cfg)
     ffi.cdef([[
@@ -220,6 +258,7 @@ end
 --- Start an Instance. The "init" file of the Instance passes
 -- through "TT_CLI_INSTANCE".
 local function start_instance()
+    record_timing('launcher')
     local instance_path = os.getenv('TT_CLI_INSTANCE')
     if instance_path == nil then
         log.error('Failed to get instance path')
@@ -277,6 +316,7 @@ local function start_instance()
     if not check_version({2,8,1,0}) then
         box.cfg = cfg_wrapper
     end
+    set_timing_hooks()
     -- Preparation of the "console" socket.
     local console_sock = os.getenv('TT_CLI_CONSOLE_SOCKET')
     if console_sock ~= nil and console_sock ~= '' then
@@ -326,6 +366,7 @@ local function start_instance()
         log.error('Failed to run instance: %s, error: "%s"', instance_path, err)
         os.exit(1)
     end
+    record_timing('app_loaded')
     return 0
 end
 
@@ -0,0 +1,56 @@
+package running
+
+import (
+	"sync"
+)
+
+// ForEachInstance calls fn for every instance from the list. At most jobs
+// calls are performed at the same time. If jobs is less than 1, all instances
+// are processed concurrently. If failFast is set, no new calls are started
+// after the first failure. The first received error is returned.
+func ForEachInstance(instances []InstanceCtx, jobs int, failFast bool,
+	fn func(run *InstanceCtx) error) error {
+	if jobs < 1 || jobs > len(instances) {
+		jobs = len(instances)
+	}
+
+	var (
+		wg       sync.WaitGroup
+		errMutex sync.Mutex
+		firstErr error
+	)
+
+	failed := func() bool {
+		errMutex.Lock()
+		defer errMutex.Unlock()
+		return firstErr != nil
+	}
+
+	slots := make(chan struct{}, jobs)
+	for i := range instances {
+		slots <- struct{}{}
+		if failFast && failed() {
+			<-slots
+			break
+		}
+
+		wg.Add(1)
+		go func(run *InstanceCtx) {
+			defer func() {
+				<-slots
+				wg.Done()
+			}()
+
+			if err := fn(run); err != nil {
+				errMutex.Lock()
+				if firstErr == nil {
+					firstErr = err
+				}
+				errMutex.Unlock()
+			}
+		}(&instances[i])
+	}
+	wg.Wait()
+
+	return firstErr
+}
@@ -0,0 +1,88 @@
+package running
+
+import (
+	"fmt"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func makeTestInstances(count int) []InstanceCtx {
+	instances := make([]InstanceCtx, count)
+	for i := range instances {
+		instances[i].InstName = fmt.Sprintf("inst%d", i)
+	}
+	return instances
+}
+
+func TestForEachInstance(t *testing.T) {
+	instances := makeTestInstances(10)
+
+	var mutex sync.Mutex
+	visited := map[string]bool{}
+	err := ForEachInstance(instances, 3, false, func(run *InstanceCtx) error {
+		mutex.Lock()
+		defer mutex.Unlock()
+		visited[run.InstName] = true
+		return nil
+	})
+	require.NoError(t, err)
+	assert.Len(t, visited, len(instances))
+}
+
+func TestForEachInstanceConcurrencyLimit(t *testing.T) {
+	instances := makeTestInstances(20)
+
+	for _, jobs := range []int{1, 4, 0} {
+		t.Run(fmt.Sprintf("jobs=%d", jobs), func(t *testing.T) {
+			var active, maxActive int32
+			err := ForEachInstance(instances, jobs, false, func(run *InstanceCtx) error {
+				cur := atomic.AddInt32(&active, 1)
+				for {
+					prev := atomic.LoadInt32(&maxActive)
+					if cur <= prev || atomic.CompareAndSwapInt32(&maxActive, prev, cur) {
+						break
+					}
+				}
+				time.Sleep(10 * time.Millisecond)
+				atomic.AddInt32(&active, -1)
+				return nil
+			})
+			require.NoError(t, err)
+
+			expectedMax := int32(jobs)
+			if jobs < 1 {
+				expectedMax = int32(len(instances))
+			}
+			assert.LessOrEqual(t, maxActive, expectedMax)
+			assert.GreaterOrEqual(t, maxActive, int32(1))
+		})
+	}
+}
+
+func TestForEachInstanceFailFast(t *testing.T) {
+	instances := makeTestInstances(10)
+
+	var calls int32
+	err := ForEachInstance(instances, 1, true, func(run *InstanceCtx) error {
+		atomic.AddInt32(&calls, 1)
+		if run.InstName == "inst2" {
+			return fmt.Errorf("%s failed", run.InstName)
+		}
+		return nil
+	})
+	assert.EqualError(t, err, "inst2 failed")
+	assert.Equal(t, int32(3), calls)
+
+	calls = 0
+	err = ForEachInstance(instances, 1, false, func(run *InstanceCtx) error {
+		atomic.AddInt32(&calls, 1)
+		return fmt.Errorf("%s failed", run.InstName)
+	})
+	assert.EqualError(t, err, "inst0 failed")
+	assert.Equal(t, int32(len(instances)), calls)
+}
@@ -0,0 +1,141 @@
+package running
+
+import (
+	"fmt"
+	"sort"
+	"strconv"
+	"strings"
+)
+
+// CPUSetAuto is the cpuset value that spreads the instances evenly
+// across the available CPUs.
+const CPUSetAuto = "auto"
+
+// Placement describes the CPUs and the NUMA node the instance is bound to.
+type Placement struct {
+	// CPUs is the list of CPUs the instance is allowed to run on. The
+	// instance is not bound to CPUs if it is empty.
+	CPUs []int
+	// NumaNode is the NUMA node the instance memory is allocated on,
+	// it is nil if the memory policy is not set.
+	NumaNode *int
+}
+
+// IsEmpty returns true if the instance is not bound to CPUs or a NUMA node.
+func (placement Placement) IsEmpty() bool {
+	return len(placement.CPUs) == 0 && placement.NumaNode == nil
+}
+
+// ParseCPUList parses the list of CPUs in the format of the kernel
+// cpulist, e.g. "0-3,8,10-11". The result is sorted and deduplicated.
+func ParseCPUList(cpuList string) ([]int, error) {
+	cpuList = strings.TrimSpace(cpuList)
+	if cpuList == "" {
+		return nil, fmt.Errorf("empty CPU list")
+	}
+
+	seen := map[int]bool{}
+	cpus := []int{}
+	for _, item := range strings.Split(cpuList, ",") {
+		item = strings.TrimSpace(item)
+		first, last := item, item
+		if dashPos := strings.Index(item, "-"); dashPos >= 0 {
+			first, last = item[:dashPos], item[dashPos+1:]
+		}
+		begin, err := strconv.Atoi(first)
+		if err != nil || begin < 0 {
+			return nil, fmt.Errorf("invalid CPU list %q: bad CPU %q", cpuList, item)
+		}
+		end, err := strconv.Atoi(last)
+		if err != nil || end < begin {
+			return nil, fmt.Errorf("invalid CPU list %q: bad CPU range %q", cpuList, item)
+		}
+		for cpu := begin; cpu <= end; cpu++ {
+			if !seen[cpu] {
+				seen[cpu] = true
+				cpus = append(cpus, cpu)
+			}
+		}
+	}
+	sort.Ints(cpus)
+	return cpus, nil
+}
+
+// resolvePlacement returns the placement of the instance by the cpuset and
+// numa_node options. The available CPUs are the CPUs of the NUMA node if it
+// is set, otherwise the CPUs the tt process is allowed to run on. In the auto
+// mode the instance is bound to one of the available CPUs chosen by its
+// index, so the instances are spread evenly across the CPUs.
+func resolvePlacement(cpuSet string, numaNode *int, availableCPUs func() ([]int, error),
+	autoIndex func() (int, error)) (Placement, error) {
+	placement := Placement{NumaNode: numaNode}
+	switch cpuSet {
+	case "":
+		if numaNode == nil {
+			return placement, nil
+		}
+		cpus, err := availableCPUs()
+		if err != nil {
+			return placement, err
+		}
+		placement.CPUs = cpus
+	case CPUSetAuto:
+		cpus, err := availableCPUs()
+		if err != nil {
+			return placement, err
+		}
+		if len(cpus) == 0 {
+			return placement, fmt.Errorf("no CPUs available for the auto cpuset")
+		}
+		index, err := autoIndex()
+		if err != nil {
+			return placement, err
+		}
+		placement.CPUs = []int{cpus[index%len(cpus)]}
+	default:
+		cpus, err := ParseCPUList(cpuSet)
+		if err != nil {
+			return placement, err
+		}
+		placement.CPUs = cpus
+	}
+	return placement, nil
+}
+
+// getPlacement returns the placement of the instance by the options.
+func getPlacement(cpuSet string, numaNode *int,
+	autoIndex func() (int, error)) (Placement, error) {
+	availableCPUs := getAllowedCPUs
+	if numaNode != nil {
+		if *numaNode < 0 {
+			return Placement{}, fmt.Errorf("invalid NUMA node %d", *numaNode)
+		}
+		availableCPUs = func() ([]int, error) {
+			return getNumaNodeCPUs(*numaNode)
+		}
+	}
+	return resolvePlacement(cpuSet, numaNode, availableCPUs, autoIndex)
+}
+
+// parsePlacementParams returns the cpuset and numa_node options of the
+// instance from its instances.yml parameters.
+func parsePlacementParams(params interface{}) (string, *int, error) {
+	paramsMap, ok := params.(map[interface{}]interface{})
+	if !ok {
+		return "", nil, nil
+	}
+
+	var cpuSet string
+	if value, found := paramsMap["cpuset"]; found && value != nil {
+		cpuSet = fmt.Sprint(value)
+	}
+	var numaNode *int
+	if value, found := paramsMap["numa_node"]; found && value != nil {
+		node, ok := value.(int)
+		if !ok {
+			return "", nil, fmt.Errorf("numa_node must be a number, got %v", value)
+		}
+		numaNode = &node
+	}
+	return cpuSet, numaNode, nil
+}
@@ -0,0 +1,131 @@
+//go:build linux
+
+package running
+
+import (
+	"fmt"
+	"os"
+	"os/exec"
+	"runtime"
+	"unsafe"
+
+	"golang.org/x/sys/unix"
+)
+
+const (
+	// mpolDefault is MPOL_DEFAULT memory policy: the memory is allocated
+	// on the node of the CPU that triggers the allocation.
+	mpolDefault = 0
+	// mpolPreferred is MPOL_PREFERRED memory policy: the memory is allocated
+	// on the preferred node if it has free memory, or on other nodes otherwise.
+	mpolPreferred = 1
+	// numaNodeCPUListFmt is the path to the list of CPUs of a NUMA node.
+	numaNodeCPUListFmt = "/sys/devices/system/node/node%d/cpulist"
+)
+
+// getAllowedCPUs returns the CPUs the tt process is allowed to run on.
+func getAllowedCPUs() ([]int, error) {
+	var set unix.CPUSet
+	if err := unix.SchedGetaffinity(0, &set); err != nil {
+		return nil, fmt.Errorf("failed to get the CPU affinity: %s", err)
+	}
+	cpus := []int{}
+	for cpu := 0; cpu < len(set)*64 && len(cpus) < set.Count(); cpu++ {
+		if set.IsSet(cpu) {
+			cpus = append(cpus, cpu)
+		}
+	}
+	return cpus, nil
+}
+
+// getNumaNodeCPUs returns the CPUs of the NUMA node.
+func getNumaNodeCPUs(node int) ([]int, error) {
+	data, err := os.ReadFile(fmt.Sprintf(numaNodeCPUListFmt, node))
+	if err != nil {
+		if os.IsNotExist(err) {
+			return nil, fmt.Errorf("NUMA node %d is not found", node)
+		}
+		return nil, err
+	}
+	cpus, err := ParseCPUList(string(data))
+	if err != nil {
+		return nil, fmt.Errorf("NUMA node %d has no CPUs: %s", node, err)
+	}
+	return cpus, nil
+}
+
+// setMemPolicy sets the memory policy of the calling thread.
+func setMemPolicy(mode int, nodes []uint64) error {
+	var nodesPtr unsafe.Pointer
+	maxNode := 0
+	if len(nodes) > 0 {
+		nodesPtr = unsafe.Pointer(&nodes[0])
+		// The kernel uses maxnode - 1 bits of the mask.
+		maxNode = len(nodes)*64 + 1
+	}
+	_, _, errno := unix.Syscall(unix.SYS_SET_MEMPOLICY, uintptr(mode), uintptr(nodesPtr),
+		uintptr(maxNode))
+	if errno != 0 {
+		return errno
+	}
+	return nil
+}
+
+// startWithPlacement starts the command bound to the CPUs and the NUMA node
+// of the placement. The CPU affinity and the memory policy are set for the
+// calling thread before the fork, so the process inherits them from the very
+// start including all the threads it creates. They are restored after the
+// fork.
+func startWithPlacement(cmd *exec.Cmd, placement Placement) error {
+	if placement.IsEmpty() {
+		return cmd.Start()
+	}
+
+	runtime.LockOSThread()
+	var oldSet unix.CPUSet
+	if err := unix.SchedGetaffinity(0, &oldSet); err != nil {
+		runtime.UnlockOSThread()
+		return fmt.Errorf("failed to get the CPU affinity: %s", err)
+	}
+
+	var err error
+	var affinitySet, policySet bool
+	if len(placement.CPUs) > 0 {
+		var set unix.CPUSet
+		for _, cpu := range placement.CPUs {
+			set.Set(cpu)
+		}
+		if err = unix.SchedSetaffinity(0, &set); err != nil {
+			err = fmt.Errorf("failed to set the CPU affinity to %v: %s", placement.CPUs, err)
+		}
+		affinitySet = err == nil
+	}
+	if err == nil && placement.NumaNode != nil {
+		node := *placement.NumaNode
+		nodes := make([]uint64, node/64+1)
+		nodes[node/64] |= 1 << (node % 64)
+		if err = setMemPolicy(mpolPreferred, nodes); err != nil {
+			err = fmt.Errorf("failed to set the memory policy to NUMA node %d: %s", node, err)
+		}
+		policySet = err == nil
+	}
+	if err == nil {
+		err = cmd.Start()
+	}
+
+	var restoreErr error
+	if affinitySet {
+		restoreErr = unix.SchedSetaffinity(0, &oldSet)
+	}
+	if policySet {
+		if policyErr := setMemPolicy(mpolDefault, nil); restoreErr == nil {
+			restoreErr = policyErr
+		}
+	}
+	// The thread is not returned to the runtime if its affinity or memory
+	// policy is not restored, it is terminated after the goroutine exits.
+	if restoreErr == nil {
+		runtime.UnlockOSThread()
+	}
+	return err
+}
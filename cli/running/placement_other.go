@@ -0,0 +1,32 @@
+//go:build !linux
+
+package running
+
+import (
+	"fmt"
+	"os/exec"
+	"runtime"
+)
+
+// getAllowedCPUs returns the CPUs the tt process is allowed to run on.
+func getAllowedCPUs() ([]int, error) {
+	cpus := make([]int, runtime.NumCPU())
+	for i := range cpus {
+		cpus[i] = i
+	}
+	return cpus, nil
+}
+
+// getNumaNodeCPUs returns the CPUs of the NUMA node.
+func getNumaNodeCPUs(node int) ([]int, error) {
+	return nil, fmt.Errorf("NUMA placement is supported on Linux only")
+}
+
+// startWithPlacement starts the command, the CPU affinity is supported on
+// Linux only.
+func startWithPlacement(cmd *exec.Cmd, placement Placement) error {
+	if !placement.IsEmpty() {
+		return fmt.Errorf("CPU affinity is supported on Linux only")
+	}
+	return cmd.Start()
+}
@@ -0,0 +1,79 @@
+package running
+
+import (
+	"fmt"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestParseCPUList(t *testing.T) {
+	cpus, err := ParseCPUList("8,0-3, 2 ,10-11\n")
+	require.NoError(t, err)
+	assert.Equal(t, []int{0, 1, 2, 3, 8, 10, 11}, cpus)
+
+	for _, cpuList := range []string{"", "a", "3-1", "-1", "1-", "1,,2"} {
+		_, err := ParseCPUList(cpuList)
+		assert.Error(t, err, cpuList)
+	}
+}
+
+func TestResolvePlacement(t *testing.T) {
+	available := func() ([]int, error) { return []int{2, 3, 4}, nil }
+	index := func(i int) func() (int, error) {
+		return func() (int, error) { return i, nil }
+	}
+	node := 1
+
+	placement, err := resolvePlacement("", nil, available, index(0))
+	require.NoError(t, err)
+	assert.True(t, placement.IsEmpty())
+
+	placement, err = resolvePlacement("0-1", nil, available, index(0))
+	require.NoError(t, err)
+	assert.Equal(t, Placement{CPUs: []int{0, 1}}, placement)
+
+	placement, err = resolvePlacement("", &node, available, index(0))
+	require.NoError(t, err)
+	assert.Equal(t, Placement{CPUs: []int{2, 3, 4}, NumaNode: &node}, placement)
+
+	// The instances are spread across the available CPUs by the index.
+	for i, expected := range []int{2, 3, 4, 2} {
+		placement, err = resolvePlacement(CPUSetAuto, nil, available, index(i))
+		require.NoError(t, err)
+		assert.Equal(t, []int{expected}, placement.CPUs)
+	}
+
+	_, err = resolvePlacement(CPUSetAuto, nil, available, func() (int, error) {
+		return 0, fmt.Errorf("not found")
+	})
+	assert.EqualError(t, err, "not found")
+
+	_, err = resolvePlacement("bad", nil, available, index(0))
+	assert.Error(t, err)
+}
+
+func TestParsePlacementParams(t *testing.T) {
+	cpuSet, numaNode, err := parsePlacementParams(map[interface{}]interface{}{
+		"cpuset":    "0-3",
+		"numa_node": 1,
+	})
+	require.NoError(t, err)
+	assert.Equal(t, "0-3", cpuSet)
+	require.NotNil(t, numaNode)
+	assert.Equal(t, 1, *numaNode)
+
+	cpuSet, numaNode, err = parsePlacementParams(map[interface{}]interface{}{"cpuset": 5})
+	require.NoError(t, err)
+	assert.Equal(t, "5", cpuSet)
+	assert.Nil(t, numaNode)
+
+	cpuSet, numaNode, err = parsePlacementParams(nil)
+	require.NoError(t, err)
+	assert.Equal(t, "", cpuSet)
+	assert.Nil(t, numaNode)
+
+	_, _, err = parsePlacementParams(map[interface{}]interface{}{"numa_node": "one"})
+	assert.Error(t, err)
+}
@@ -8,7 +8,9 @@ import (
 	"os/exec"
 	"path"
 	"path/filepath"
+	"sort"
 	"strings"
+	"sync"
 	"syscall"
 	"time"
 
@@ -16,13 +18,20 @@ import (
 	"github.com/tarantool/tt/cli/cmdcontext"
 	"github.com/tarantool/tt/cli/config"
 	"github.com/tarantool/tt/cli/configure"
+	"github.com/tarantool/tt/cli/connector"
 	"github.com/tarantool/tt/cli/process_utils"
 	"github.com/tarantool/tt/cli/ttlog"
 	"github.com/tarantool/tt/cli/util"
 	"gopkg.in/yaml.v2"
 )
 
-const defaultDirPerms = 0770
+const (
+	defaultDirPerms = 0770
+	// readyCheckPeriod is a period of the instance readiness checks.
+	readyCheckPeriod = 100 * time.Millisecond
+	// statusRequestTimeout is the timeout of the box.info.status request.
+	statusRequestTimeout = 3 * time.Second
+)
 
 var (
 	instStateStopped = process_utils.ProcStateStopped
@@ -69,14 +78,29 @@ type InstanceCtx struct {
 	// calendar days due to daylight savings, leap seconds, etc. The
 	// default is not to remove old log files based on age.
 	LogMaxAge int
+	// LogPassthrough enables writing of the instance log directly to the
+	// log file.
+	LogPassthrough bool
 	// The name of the file with the watchdog PID under which the
 	// instance was started.
 	PIDFile string
 	// If the instance is started under the watchdog it should
 	// restart on if it crashes.
 	Restartable bool
+	// RestartPolicy describes how the watchdog restarts the crashed instance.
+	RestartPolicy RestartPolicy
+	// LivenessProbe describes how the watchdog detects the hung instance.
+	LivenessProbe LivenessProbe
 	// Control UNIX socket for started instance.
 	ConsoleSocket string
+	// CPUSet is the list of CPUs the instance is bound to or "auto" to
+	// spread the instances evenly across the CPUs.
+	CPUSet string
+	// NumaNode is the NUMA node the instance is bound to, nil if not set.
+	NumaNode *int
+	// Placement is the resolved CPU and NUMA placement of the instance,
+	// it is filled for the start and restart commands.
+	Placement Placement
 	// True if this is a single instance application (no instances.yml).
 	SingleApp bool
 }
@@ -109,10 +133,30 @@ type providerImpl struct {
 	cmdCtx *cmdcontext.CmdCtx
 	// instanceCtx is a pointer to the specific data of the instanceCtx to work with.
 	instanceCtx *InstanceCtx
+	// ctxSources are the files the instanceCtx is built from.
+	ctxSources []string
+	// ctxSignatures are the signatures of ctxSources at the moment
+	// of the instanceCtx update.
+	ctxSignatures []util.FileSignature
+}
+
+// getCtxSources returns the files the instance context is built from:
+// the configuration file, the application file, its directory and
+// instances.yml in it.
+func getCtxSources(cmdCtx *cmdcontext.CmdCtx, run *InstanceCtx) []string {
+	appDir := filepath.Dir(run.AppPath)
+	return []string{cmdCtx.Cli.ConfigPath, run.AppPath, appDir,
+		filepath.Join(appDir, "instances.yml")}
 }
 
 // updateCtx updates cmdCtx according to the current contents of the cfg file.
+// The context is not updated if the files it is built from are not changed.
 func (provider *providerImpl) updateCtx() error {
+	if provider.ctxSignatures != nil && util.FileSignaturesEqual(provider.ctxSignatures,
+		util.GetFileSignatures(provider.ctxSources)) {
+		return nil
+	}
+
 	cliOpts, _, err := configure.GetCliOpts(provider.cmdCtx.Cli.ConfigPath)
 	if err != nil {
 		return err
@@ -130,6 +174,8 @@ func (provider *providerImpl) updateCtx() error {
 		return err
 	}
 	provider.instanceCtx = &runningCtx.Instances[0]
+	provider.ctxSources = getCtxSources(provider.cmdCtx, provider.instanceCtx)
+	provider.ctxSignatures = util.GetFileSignatures(provider.ctxSources)
 	return nil
 }
 
@@ -171,6 +217,9 @@ func isLoggerChanged(logger *ttlog.Logger, runningCtx *InstanceCtx) (bool, error
 	if loggerOpts.MaxSize != runningCtx.LogMaxSize {
 		return true, nil
 	}
+	if loggerOpts.Passthrough != runningCtx.LogPassthrough {
+		return true, nil
+	}
 	return false, nil
 }
 
@@ -269,6 +318,11 @@ func getInstancesFromYML(dirPath string, selectedInstName string) ([]InstanceCtx
 			instance.AppPath = script
 		}
 
+		if instance.CPUSet, instance.NumaNode, err =
+			parsePlacementParams(instParams[inst]); err != nil {
+			return nil, fmt.Errorf("%s: %s", instance.InstName, err)
+		}
+
 		instances = append(instances, instance)
 	}
 
@@ -347,20 +401,46 @@ func cleanup(run *InstanceCtx) {
 	if _, err := os.Stat(run.ConsoleSocket); err == nil {
 		os.Remove(run.ConsoleSocket)
 	}
+
+	if _, err := os.Stat(getSupervisedFile(run)); err == nil {
+		os.Remove(getSupervisedFile(run))
+	}
+
+	if _, err := os.Stat(getStopRequestFile(run)); err == nil {
+		os.Remove(getStopRequestFile(run))
+	}
+
+	if _, err := os.Stat(getStateFile(run)); err == nil {
+		os.Remove(getStateFile(run))
+	}
 }
 
 // createLogger prepares a logger for the watchdog and instance.
 func createLogger(run *InstanceCtx) *ttlog.Logger {
 	opts := ttlog.LoggerOpts{
-		Filename:   run.Log,
-		MaxSize:    run.LogMaxSize,
-		MaxBackups: run.LogMaxBackups,
-		MaxAge:     run.LogMaxAge,
+		Filename:    run.Log,
+		MaxSize:     run.LogMaxSize,
+		MaxBackups:  run.LogMaxBackups,
+		MaxAge:      run.LogMaxAge,
+		Passthrough: run.LogPassthrough,
 	}
 
 	return ttlog.NewLogger(&opts)
 }
 
+// collectAllInstanceNames returns the sorted full names of all the instances
+// of the environment.
+func collectAllInstanceNames(apps []indexedApp) []string {
+	names := []string{}
+	for _, app := range apps {
+		for _, instance := range app.getInstances() {
+			names = append(names, GetAppInstanceName(instance))
+		}
+	}
+	sort.Strings(names)
+	return names
+}
+
 // FillCtx fills the RunningCtx context.
 func FillCtx(cliOpts *config.CliOpts, cmdCtx *cmdcontext.CmdCtx,
 	runningCtx *RunningCtx, args []string) error {
@@ -381,28 +461,52 @@ func FillCtx(cliOpts *config.CliOpts, cmdCtx *cmdcontext.CmdCtx,
 		instEnabledPath = cmdCtx.Cli.ConfigDir
 	}
 
-	var appList []util.AppListEntry
+	collectAll := func(verbose bool) ([]indexedApp, error) {
+		return collectTopology(cmdCtx.Cli.ConfigDir, cliOpts.App.InstancesEnabled,
+			instEnabledPath, cliOpts.App.RunDir, verbose)
+	}
+
+	var apps []indexedApp
 	if len(args) == 0 {
-		appList, err = util.CollectAppList(cmdCtx.Cli.ConfigDir, cliOpts.App.InstancesEnabled,
-			true)
-		if err != nil {
-			return fmt.Errorf("can't collect an application list "+
-				"from instances enabled path %s: %s", instEnabledPath, err)
+		if apps, err = collectAll(true); err != nil {
+			return err
 		}
 	} else {
-		appList = append(appList, util.AppListEntry{Name: args[0], Location: ""})
-	}
-
-	// Cleanup instances list.
-	runningCtx.Instances = nil
-	for _, appInfo := range appList {
-		appName := strings.TrimSuffix(appInfo.Name, ".lua")
+		appName := strings.TrimSuffix(args[0], ".lua")
 		instances, err := CollectInstances(appName, instEnabledPath)
 		if err != nil {
 			return fmt.Errorf("%s: can't find an application init file: %s", appName, err)
 		}
+		apps = []indexedApp{newIndexedApp(args[0], instances)}
+	}
+
+	// The index of the instance among all the instances of the environment
+	// used for the auto cpuset. It does not depend on the instances passed
+	// to the command, so the CPUs are the same for separate starts.
+	var allInstances []string
+	autoIndex := func(instance *InstanceCtx) func() (int, error) {
+		return func() (int, error) {
+			if allInstances == nil {
+				allApps, err := collectAll(false)
+				if err != nil {
+					return 0, err
+				}
+				allInstances = collectAllInstanceNames(allApps)
+			}
+			name := GetAppInstanceName(*instance)
+			index := sort.SearchStrings(allInstances, name)
+			if index == len(allInstances) || allInstances[index] != name {
+				return 0, fmt.Errorf("instance %s is not found in %s", name,
+					instEnabledPath)
+			}
+			return index, nil
+		}
+	}
 
-		for _, inst := range instances {
+	// Cleanup instances list.
+	runningCtx.Instances = nil
+	for _, app := range apps {
+		for _, inst := range app.getInstances() {
 			var instance InstanceCtx
 			var runDir string
 			var logDir string
@@ -422,7 +526,41 @@ func FillCtx(cliOpts *config.CliOpts, cmdCtx *cmdcontext.CmdCtx,
 				instance.LogMaxSize = cliOpts.App.LogMaxSize
 				instance.LogMaxAge = cliOpts.App.LogMaxAge
 				instance.LogMaxBackups = cliOpts.App.LogMaxBackups
+				instance.LogPassthrough = cliOpts.App.LogPassthrough
 				instance.Restartable = cliOpts.App.Restartable
+				instance.RestartPolicy = RestartPolicy{
+					BackoffMax:    secondsToDuration(cliOpts.App.RestartBackoffMax),
+					BackoffFactor: cliOpts.App.RestartBackoffFactor,
+				}
+				if cliOpts.App.RestartBackoffMin != nil {
+					instance.RestartPolicy.BackoffMin =
+						secondsToDuration(*cliOpts.App.RestartBackoffMin)
+				}
+				if cliOpts.App.RestartMinUptime != nil {
+					instance.RestartPolicy.MinUptime =
+						secondsToDuration(*cliOpts.App.RestartMinUptime)
+				}
+				if cliOpts.App.CrashLoopThreshold != nil {
+					instance.RestartPolicy.CrashLoopThreshold = *cliOpts.App.CrashLoopThreshold
+				}
+				instance.LivenessProbe = LivenessProbe{
+					Interval: secondsToDuration(cliOpts.App.ProbeInterval),
+				}
+				if cliOpts.App.ProbeMaxFailures != nil {
+					instance.LivenessProbe.FailureThreshold = *cliOpts.App.ProbeMaxFailures
+				}
+				if cliOpts.App.ProbeTimeout != nil {
+					instance.LivenessProbe.Timeout = secondsToDuration(*cliOpts.App.ProbeTimeout)
+				}
+				instance.CPUSet = cliOpts.App.CPUSet
+				instance.NumaNode = cliOpts.App.NumaNode
+			}
+			// The options of instances.yml override the application ones.
+			if inst.CPUSet != "" {
+				instance.CPUSet = inst.CPUSet
+			}
+			if inst.NumaNode != nil {
+				instance.NumaNode = inst.NumaNode
 			}
 
 			instance.RunDir = pathBuilder.WithPath(runDir).Make()
@@ -443,6 +581,11 @@ func FillCtx(cliOpts *config.CliOpts, cmdCtx *cmdcontext.CmdCtx,
 						return err
 					}
 				}
+				if instance.Placement, err = getPlacement(instance.CPUSet, instance.NumaNode,
+					autoIndex(&instance)); err != nil {
+					return fmt.Errorf("%s: invalid placement: %s",
+						GetAppInstanceName(instance), err)
+				}
 			}
 
 			runningCtx.Instances = append(runningCtx.Instances, instance)
@@ -458,17 +601,33 @@ func FillCtx(cliOpts *config.CliOpts, cmdCtx *cmdcontext.CmdCtx,
 	return nil
 }
 
-// Start an Instance.
-func Start(cmdCtx *cmdcontext.CmdCtx, run *InstanceCtx) error {
+// newInstanceWatchdog creates a watchdog for the instance.
+func newInstanceWatchdog(cmdCtx *cmdcontext.CmdCtx, run *InstanceCtx,
+	preStartAction func() error) *Watchdog {
 	logger := createLogger(run)
 	provider := providerImpl{cmdCtx: cmdCtx, instanceCtx: run}
+	wd := NewWatchdog(run.Restartable, run.RestartPolicy, logger, &provider, preStartAction)
+	wd.stateFile = getStateFile(run)
+	// The hung instance is killed to be restarted, so it is not probed if
+	// it is not restartable.
+	if run.Restartable {
+		wd.livenessProbe = run.LivenessProbe
+		wd.probeCheck = func(timeout time.Duration) error {
+			return probeInstance(run, timeout)
+		}
+	}
+	return wd
+}
+
+// Start an Instance.
+func Start(cmdCtx *cmdcontext.CmdCtx, run *InstanceCtx) error {
 	preStartAction := func() error {
 		if err := process_utils.CreatePIDFile(run.PIDFile); err != nil {
 			return err
 		}
 		return nil
 	}
-	wd := NewWatchdog(run.Restartable, 5*time.Second, logger, &provider, preStartAction)
+	wd := newInstanceWatchdog(cmdCtx, run, preStartAction)
 
 	defer func() {
 		cleanup(run)
@@ -478,19 +637,126 @@ func Start(cmdCtx *cmdcontext.CmdCtx, run *InstanceCtx) error {
 	return nil
 }
 
-// Stop the Instance.
-func Stop(run *InstanceCtx) error {
-	pid, err := process_utils.StopProcess(run.PIDFile)
+// checkRunning checks that box.info.status of the instance is "running".
+func checkRunning(run *InstanceCtx) error {
+	if _, err := os.Stat(run.ConsoleSocket); err != nil {
+		return fmt.Errorf("control socket is not created yet")
+	}
+
+	conn, err := connector.Connect(connector.ConnectOpts{
+		Network: connector.UnixNetwork,
+		Address: run.ConsoleSocket,
+	})
 	if err != nil {
 		return err
 	}
+	defer conn.Close()
+
+	var res []string
+	_, err = conn.Eval("return box.info.status", []interface{}{},
+		connector.RequestOpts{ReadTimeout: statusRequestTimeout, ResData: &res})
+	if err != nil {
+		return err
+	}
+	if len(res) == 0 || res[0] != "running" {
+		return fmt.Errorf("box.info.status is %q", strings.Join(res, ""))
+	}
+
+	return nil
+}
+
+// probeInstance checks that the instance responds to a request on its
+// control socket within the timeout. The timeout bounds the whole probe, the
+// connection establishment included.
+func probeInstance(run *InstanceCtx, timeout time.Duration) error {
+	deadline := time.Now().Add(timeout)
+	conn, err := connector.ConnectWithTimeout(connector.ConnectOpts{
+		Network: connector.UnixNetwork,
+		Address: run.ConsoleSocket,
+	}, timeout)
+	if err != nil {
+		return err
+	}
+	defer conn.Close()
+
+	readTimeout := time.Until(deadline)
+	if readTimeout <= 0 {
+		return fmt.Errorf("the probe timed out after %s", timeout)
+	}
+	_, err = conn.Eval("return true", []interface{}{},
+		connector.RequestOpts{ReadTimeout: readTimeout})
+	return err
+}
+
+// waitCheck waits until the check of the instance succeeds.
+func waitCheck(run *InstanceCtx, timeout time.Duration, exited <-chan struct{},
+	check func(run *InstanceCtx) error) error {
+	timeoutTimer := time.NewTimer(timeout)
+	defer timeoutTimer.Stop()
+	checkTicker := time.NewTicker(readyCheckPeriod)
+	defer checkTicker.Stop()
+
+	for {
+		err := check(run)
+		if err == nil {
+			return nil
+		}
+
+		select {
+		case <-exited:
+			return fmt.Errorf("the instance has terminated, see the log file %s", run.Log)
+		case <-timeoutTimer.C:
+			return fmt.Errorf("the instance is not ready after %s: %s", timeout, err)
+		case <-checkTicker.C:
+		}
+	}
+}
+
+// WaitRunning waits until box.info.status of the instance is "running".
+// The exited channel must be closed when the process that runs the instance
+// is terminated: the instance will never become ready in this case.
+func WaitRunning(run *InstanceCtx, timeout time.Duration, exited <-chan struct{}) error {
+	return waitCheck(run, timeout, exited, checkRunning)
+}
 
+// removeConsoleSocket removes the console socket of the terminated instance.
+func removeConsoleSocket(run *InstanceCtx) {
 	// tarantool 1.10 does not have a trigger on terminate a process.
 	// So the socket will be closed automatically on termination and
 	// we need to delete the file.
 	if _, err := os.Stat(run.ConsoleSocket); err == nil {
 		os.Remove(run.ConsoleSocket)
 	}
+}
+
+// interruptInstance asks the instance to stop. Returns the PID from the
+// instance PID file and whether the instance is running under a supervisor.
+func interruptInstance(run *InstanceCtx) (int, bool, error) {
+	if isSupervised(run) {
+		pid, err := requestSupervisedStop(run)
+		return pid, true, err
+	}
+
+	pid, err := process_utils.InterruptProcess(run.PIDFile)
+	return pid, false, err
+}
+
+// Stop the Instance.
+func Stop(run *InstanceCtx) error {
+	if isSupervised(run) {
+		pid, _, err := interruptInstance(run)
+		if err != nil {
+			return err
+		}
+		return waitStop(run, pid, true, time.Now().Add(30*time.Second))
+	}
+
+	pid, err := process_utils.StopProcess(run.PIDFile)
+	if err != nil {
+		return err
+	}
+
+	removeConsoleSocket(run)
 
 	fullInstanceName := GetAppInstanceName(*run)
 	log.Infof("The Instance %s (PID = %v) has been terminated.", fullInstanceName, pid)
@@ -498,6 +764,70 @@ func Stop(run *InstanceCtx) error {
 	return nil
 }
 
+// waitStop waits for the interrupted instance termination until the deadline.
+// The instance that is still alive after the deadline is killed. The instance
+// running under a supervisor is not killed: the supervisor is shared with
+// other instances and terminates the instance by itself.
+func waitStop(run *InstanceCtx, pid int, supervised bool, deadline time.Time) error {
+	fullInstanceName := GetAppInstanceName(*run)
+
+	if supervised {
+		if !waitSupervisedStop(run, pid, time.Until(deadline)) {
+			return fmt.Errorf("%s: can't terminate the instance running under"+
+				" the supervisor (PID = %v)", fullInstanceName, pid)
+		}
+	} else if !process_utils.WaitProcessTermination(pid, time.Until(deadline)) {
+		log.Warnf("The Instance %s (PID = %v) is not terminated in time, killing it.",
+			fullInstanceName, pid)
+		if err := process_utils.KillProcess(pid); err != nil {
+			return fmt.Errorf("%s: %s", fullInstanceName, err)
+		}
+		// The watchdog could be killed before the cleanup.
+		cleanup(run)
+	}
+
+	removeConsoleSocket(run)
+
+	log.Infof("The Instance %s (PID = %v) has been terminated.", fullInstanceName, pid)
+
+	return nil
+}
+
+// StopAll stops the instances concurrently: SIGINT is sent to all the
+// instances at once, then their termination is waited in parallel. The
+// instances that are still alive after the timeout are killed by SIGKILL.
+// Errors are logged and do not interrupt stopping of other instances.
+func StopAll(instances []InstanceCtx, timeout time.Duration) {
+	deadline := time.Now().Add(timeout)
+
+	pids := make([]int, len(instances))
+	supervised := make([]bool, len(instances))
+	for i := range instances {
+		pid, isSupervised, err := interruptInstance(&instances[i])
+		if err != nil {
+			log.Infof(err.Error())
+			continue
+		}
+		pids[i] = pid
+		supervised[i] = isSupervised
+	}
+
+	var wg sync.WaitGroup
+	for i := range instances {
+		if pids[i] == 0 {
+			continue
+		}
+		wg.Add(1)
+		go func(run *InstanceCtx, pid int, supervised bool) {
+			defer wg.Done()
+			if err := waitStop(run, pid, supervised, deadline); err != nil {
+				log.Infof(err.Error())
+			}
+		}(&instances[i], pids[i], supervised[i])
+	}
+	wg.Wait()
+}
+
 // Run runs an Instance.
 func Run(runOpts *RunOpts, scriptPath string) error {
 	inst := Instance{tarantoolPath: runOpts.CmdCtx.Cli.TarantoolExecutable,
@@ -509,7 +839,30 @@ func Run(runOpts *RunOpts, scriptPath string) error {
 
 // Status returns the status of the Instance.
 func Status(run *InstanceCtx) process_utils.ProcessState {
-	return process_utils.ProcessStatus(run.PIDFile)
+	procState := process_utils.ProcessStatus(run.PIDFile)
+	if procState.Code != process_utils.ProcessRunningCode {
+		return procState
+	}
+
+	// Add the restarts information of the watchdog.
+	state, err := ReadWatchdogState(run)
+	if err != nil {
+		return procState
+	}
+	if state.Parked {
+		procState.ColorSprint = instStateDead.ColorSprint
+		procState.Text += fmt.Sprintf(" The instance is not restarted after a crash loop."+
+			" Restarts: %d.", state.Restarts)
+	} else if state.Restarts > 0 {
+		procState.Text += fmt.Sprintf(" Restarts: %d. Backoff: %s.", state.Restarts,
+			state.Backoff)
+	}
+	return procState
+}
+
+// secondsToDuration converts seconds to time.Duration.
+func secondsToDuration(seconds float64) time.Duration {
+	return time.Duration(seconds * float64(time.Second))
 }
 
 // Logrotate rotates logs of a started tarantool instance.
@@ -533,12 +886,70 @@ func Logrotate(run *InstanceCtx) (string, error) {
 	return fmt.Sprintf("%s: logs has been rotated. PID: %v.", fullInstanceName, pid), nil
 }
 
+// CompressLogs compresses the rotated logs of the instances. The newest
+// rotated log of an instance is not compressed, because the instance could
+// still write to it until the log file is reopened. It is compressed on the
+// next rotation, like with the logrotate delaycompress option. After that the
+// oldest rotated logs are removed until the total size of the rotated logs
+// of all the instances is not greater than maxTotalSize bytes.
+func CompressLogs(instances []InstanceCtx, opts ttlog.CompressOpts, maxTotalSize int64) error {
+	paths := []string{}
+	seen := map[string]bool{}
+	for _, run := range instances {
+		if seen[run.Log] {
+			continue
+		}
+		seen[run.Log] = true
+		backups, err := ttlog.ListBackups(run.Log)
+		if err != nil {
+			if os.IsNotExist(err) {
+				continue
+			}
+			return fmt.Errorf("can't get rotated logs of %s: %s", GetAppInstanceName(run), err)
+		}
+		for i := 1; i < len(backups); i++ {
+			if !backups[i].Compressed {
+				paths = append(paths, backups[i].Path)
+			}
+		}
+	}
+
+	errs := ttlog.CompressFiles(paths, opts)
+	for _, err := range errs {
+		log.Warn(err.Error())
+	}
+
+	allBackups := []ttlog.Backup{}
+	for logFile := range seen {
+		backups, err := ttlog.ListBackups(logFile)
+		if err != nil {
+			continue
+		}
+		allBackups = append(allBackups, backups...)
+	}
+	if _, err := ttlog.RemoveExceedingBackups(allBackups, maxTotalSize); err != nil {
+		return fmt.Errorf("can't remove old rotated logs: %s", err)
+	}
+
+	if len(errs) > 0 {
+		return fmt.Errorf("failed to compress %d of %d rotated logs", len(errs), len(paths))
+	}
+	return nil
+}
+
 // Check returns the result of checking the syntax of the application file.
 func Check(cmdCtx *cmdcontext.CmdCtx, run *InstanceCtx) error {
+	return checkFile(cmdCtx.Cli.TarantoolExecutable, run.AppPath)
+}
+
+// checkFile checks the syntax of the file. The path is passed to the
+// tarantool process through its own environment, so the checks could be
+// run concurrently.
+func checkFile(tarantool string, path string) error {
 	var errbuff bytes.Buffer
-	os.Setenv("TT_CLI_INSTANCE", run.AppPath)
 
-	cmd := exec.Command(cmdCtx.Cli.TarantoolExecutable, "-e", checkSyntax)
+	cmd := exec.Command(tarantool, "-e", checkSyntax)
+	cmd.Env = append(os.Environ(), "TT_CLI_INSTANCE="+path)
 	cmd.Stderr = &errbuff
 	if err := cmd.Run(); err != nil {
 		return fmt.Errorf(errbuff.String())
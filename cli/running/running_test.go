@@ -0,0 +1,42 @@
+package running
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"github.com/tarantool/tt/cli/cmdcontext"
+)
+
+func TestProviderUpdateCtxCache(t *testing.T) {
+	tempDir := t.TempDir()
+	configPath := filepath.Join(tempDir, "tt.yaml")
+	require.NoError(t, os.WriteFile(configPath,
+		[]byte("tt:\n  app:\n    restart_on_failure: true\n"), 0644))
+	require.NoError(t, os.WriteFile(filepath.Join(tempDir, "app.lua"), []byte(""), 0644))
+
+	cmdCtx := cmdcontext.CmdCtx{CommandName: "status"}
+	cmdCtx.Cli.ConfigPath = configPath
+	cmdCtx.Cli.ConfigDir = tempDir
+	cmdCtx.Cli.TarantoolExecutable = "tarantool"
+
+	provider := providerImpl{cmdCtx: &cmdCtx,
+		instanceCtx: &InstanceCtx{AppName: "app", InstName: "app", SingleApp: true}}
+	require.NoError(t, provider.updateCtx())
+	assert.True(t, provider.instanceCtx.Restartable)
+	assert.Equal(t, filepath.Join(tempDir, "app.lua"), provider.instanceCtx.AppPath)
+
+	// The context is not rebuilt if the files are not changed.
+	provider.instanceCtx.Restartable = false
+	require.NoError(t, provider.updateCtx())
+	assert.False(t, provider.instanceCtx.Restartable)
+
+	// The context is rebuilt after the configuration change.
+	modTime := time.Now().Add(time.Hour)
+	require.NoError(t, os.Chtimes(configPath, modTime, modTime))
+	require.NoError(t, provider.updateCtx())
+	assert.True(t, provider.instanceCtx.Restartable)
+}
@@ -0,0 +1,140 @@
+package running
+
+import (
+	"sync"
+	"time"
+
+	"github.com/tarantool/tt/cli/process_utils"
+)
+
+// Instance status names.
+const (
+	statusRunning    = "RUNNING"
+	statusNotRunning = "NOT RUNNING"
+	statusError      = "ERROR"
+)
+
+// InstanceStatus contains the detailed status of the instance.
+type InstanceStatus struct {
+	// Name is the full name of the instance.
+	Name string `json:"name"`
+	// Status is the instance status: RUNNING, NOT RUNNING or ERROR.
+	Status string `json:"status"`
+	// WatchdogPID is the PID of the watchdog process from the PID file.
+	WatchdogPID int `json:"watchdog_pid,omitempty"`
+	// TarantoolPID is the PID of the tarantool process.
+	TarantoolPID int `json:"tarantool_pid,omitempty"`
+	// Uptime is the time since the tarantool process start.
+	Uptime time.Duration `json:"-"`
+	// UptimeSeconds is Uptime in seconds, used for the JSON output.
+	UptimeSeconds float64 `json:"uptime"`
+	// RSS is the resident set size of the tarantool process in bytes.
+	RSS int64 `json:"rss"`
+	// CPUTime is the CPU time spent by the tarantool process.
+	CPUTime time.Duration `json:"-"`
+	// CPUSeconds is CPUTime in seconds, used for the JSON output.
+	CPUSeconds float64 `json:"cpu_time"`
+	// FDs is the number of open file descriptors of the tarantool process,
+	// -1 if unknown.
+	FDs int `json:"fds"`
+	// Threads is the number of threads of the tarantool process.
+	Threads int `json:"threads"`
+	// Restarts is the number of restarts of the instance by the watchdog.
+	Restarts int `json:"restarts"`
+	// Parked is true if the instance is not restarted because of a crash loop.
+	Parked bool `json:"parked"`
+	// ProbeLatency is the duration of the last liveness probe, zero if the
+	// instance is not probed.
+	ProbeLatency time.Duration `json:"-"`
+	// ProbeLatencySeconds is ProbeLatency in seconds, used for the JSON output.
+	ProbeLatencySeconds float64 `json:"probe_latency"`
+	// ProbeFailures is the number of consecutive failed liveness probes.
+	ProbeFailures int `json:"probe_failures"`
+}
+
+// getTarantoolPID returns the PID of the tarantool process controlled by
+// the watchdog.
+func getTarantoolPID(run *InstanceCtx, watchdogPID int,
+	state *WatchdogState) (int, error) {
+	if state != nil && state.InstancePID != 0 {
+		if alive, _ := process_utils.IsProcessAlive(state.InstancePID); alive {
+			return state.InstancePID, nil
+		}
+	}
+	if isSupervised(run) {
+		// The supervisor controls several tarantool processes, the instance
+		// process is known from the state only.
+		return 0, nil
+	}
+
+	children, err := process_utils.GetChildPIDs(watchdogPID)
+	if err != nil || len(children) == 0 {
+		return 0, err
+	}
+	return children[0], nil
+}
+
+// GetInstanceStatus returns the detailed status of the instance.
+func GetInstanceStatus(run *InstanceCtx) InstanceStatus {
+	status := InstanceStatus{Name: GetAppInstanceName(*run), FDs: -1}
+
+	procState := process_utils.ProcessStatus(run.PIDFile)
+	switch procState.Code {
+	case process_utils.ProcessStoppedCode:
+		status.Status = statusNotRunning
+		return status
+	case process_utils.ProcessDeadCode:
+		status.Status = statusError
+		return status
+	}
+	status.Status = statusRunning
+
+	status.WatchdogPID, _ = process_utils.GetPIDFromFile(run.PIDFile)
+	state, err := ReadWatchdogState(run)
+	if err == nil {
+		status.Restarts = state.Restarts
+		status.Parked = state.Parked
+		status.ProbeLatency = state.ProbeLatency
+		status.ProbeLatencySeconds = state.ProbeLatency.Seconds()
+		status.ProbeFailures = state.ProbeFailures
+	} else {
+		state = nil
+	}
+
+	status.TarantoolPID, _ = getTarantoolPID(run, status.WatchdogPID, state)
+	if status.TarantoolPID == 0 {
+		return status
+	}
+
+	stats, err := process_utils.GetProcessStats(status.TarantoolPID)
+	if err != nil {
+		return status
+	}
+	status.Uptime = stats.Uptime
+	status.UptimeSeconds = stats.Uptime.Seconds()
+	status.RSS = stats.RSS
+	status.CPUTime = stats.CPUTime
+	status.CPUSeconds = stats.CPUTime.Seconds()
+	status.FDs = stats.FDs
+	status.Threads = stats.Threads
+
+	return status
+}
+
+// CollectInstancesStatus collects the detailed status of the instances
+// concurrently. The statuses are returned in the order of the instances.
+func CollectInstancesStatus(instances []InstanceCtx) []InstanceStatus {
+	statuses := make([]InstanceStatus, len(instances))
+
+	var wg sync.WaitGroup
+	for i := range instances {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			statuses[i] = GetInstanceStatus(&instances[i])
+		}(i)
+	}
+	wg.Wait()
+
+	return statuses
+}
@@ -0,0 +1,237 @@
+package running
+
+import (
+	"fmt"
+	"os"
+	"os/signal"
+	"path/filepath"
+	"sync"
+	"syscall"
+	"time"
+
+	"github.com/apex/log"
+	"github.com/tarantool/tt/cli/cmdcontext"
+	"github.com/tarantool/tt/cli/process_utils"
+)
+
+const (
+	// supervisedFileExt is an extension of the file that marks an instance
+	// as running under a supervisor.
+	supervisedFileExt = ".supervised"
+	// stopRequestFileExt is an extension of the file that requests the
+	// supervisor to stop the instance.
+	stopRequestFileExt = ".stop_request"
+)
+
+// stopRequestSignal is the signal that makes the supervisor stop the
+// instances with the stop request files. It is not passed to the instances.
+const stopRequestSignal = syscall.SIGUSR2
+
+// supervisedInstance describes an instance running under the supervisor.
+type supervisedInstance struct {
+	// run is the instance context.
+	run *InstanceCtx
+	// signals is used to pass signals to the instance watchdog.
+	signals chan os.Signal
+	// done is closed when the instance watchdog is finished.
+	done chan struct{}
+}
+
+// getSupervisedFile returns the path of the file that marks the instance as
+// running under a supervisor.
+func getSupervisedFile(run *InstanceCtx) string {
+	return filepath.Join(run.RunDir, run.InstName+supervisedFileExt)
+}
+
+// getStopRequestFile returns the path of the file that requests the
+// supervisor to stop the instance. The supervisor process PID is written to
+// the instance PID file, so the file is created before sending
+// stopRequestSignal to the supervisor to stop the specific instance.
+func getStopRequestFile(run *InstanceCtx) string {
+	return filepath.Join(run.RunDir, run.InstName+stopRequestFileExt)
+}
+
+// requestSupervisedStop asks the supervisor to stop the instance. Returns
+// the supervisor PID.
+func requestSupervisedStop(run *InstanceCtx) (int, error) {
+	pid, err := process_utils.GetPIDFromFile(run.PIDFile)
+	if err != nil {
+		return 0, err
+	}
+	requestFile, err := os.Create(getStopRequestFile(run))
+	if err != nil {
+		return 0, err
+	}
+	requestFile.Close()
+	if err = syscall.Kill(pid, stopRequestSignal); err != nil {
+		os.Remove(getStopRequestFile(run))
+		return 0, fmt.Errorf(`can't terminate the process. Error: "%v"`, err)
+	}
+	return pid, nil
+}
+
+// consumeStopRequest returns true if the stop of the instance has been
+// requested. The request is removed.
+func consumeStopRequest(run *InstanceCtx) bool {
+	return os.Remove(getStopRequestFile(run)) == nil
+}
+
+// isSupervised returns true if the instance is running under a supervisor.
+func isSupervised(run *InstanceCtx) bool {
+	_, err := os.Stat(getSupervisedFile(run))
+	return err == nil
+}
+
+// startSupervised creates the PID file of the instance and marks it as
+// running under the supervisor.
+func startSupervised(run *InstanceCtx) error {
+	if err := process_utils.CreatePIDFile(run.PIDFile); err != nil {
+		return err
+	}
+	// The request left by a previous supervisor is stale.
+	os.Remove(getStopRequestFile(run))
+	supervisedFile, err := os.Create(getSupervisedFile(run))
+	if err != nil {
+		os.Remove(run.PIDFile)
+		return err
+	}
+	return supervisedFile.Close()
+}
+
+// CheckNotSupervised returns an error if the instance is running under
+// a supervisor. The supervisor does not start a stopped instance again, so
+// such an instance is restarted with the supervisor only.
+func CheckNotSupervised(run *InstanceCtx) error {
+	if !isSupervised(run) {
+		return nil
+	}
+	pid, _ := process_utils.GetPIDFromFile(run.PIDFile)
+	return fmt.Errorf("the instance %s is running under the supervisor (PID = %v),"+
+		" restart it with tt stop and tt start --supervisor", GetAppInstanceName(*run), pid)
+}
+
+// waitSupervisedStop waits until the supervisor stops the instance: it
+// removes the instance PID file on the instance termination. Returns false
+// if the instance is still running after the timeout.
+func waitSupervisedStop(run *InstanceCtx, pid int, timeout time.Duration) bool {
+	timeoutTimer := time.NewTimer(timeout)
+	defer timeoutTimer.Stop()
+	checkTicker := time.NewTicker(readyCheckPeriod)
+	defer checkTicker.Stop()
+
+	for {
+		if _, err := os.Stat(run.PIDFile); os.IsNotExist(err) {
+			return true
+		}
+		if alive, _ := process_utils.IsProcessAlive(pid); !alive {
+			return true
+		}
+
+		select {
+		case <-timeoutTimer.C:
+			return false
+		case <-checkTicker.C:
+		}
+	}
+}
+
+// forwardSignal passes the signal to the instance watchdog, if it is still
+// running.
+func (inst *supervisedInstance) forwardSignal(sig os.Signal) {
+	go func() {
+		select {
+		case inst.signals <- sig:
+		case <-inst.done:
+		}
+	}()
+}
+
+// isRunning returns true if the instance watchdog is not finished.
+func (inst *supervisedInstance) isRunning() bool {
+	select {
+	case <-inst.done:
+		return false
+	default:
+		return true
+	}
+}
+
+// dispatchSignal passes the signal received by the supervisor to the
+// instance watchdogs. stopRequestSignal stops only the running instances
+// requested to stop (see getStopRequestFile), it is ignored if there are no
+// such instances: the requested ones could have been stopped already by
+// the previous signal. The other signals are passed to all the instances.
+func dispatchSignal(instances []*supervisedInstance, sig os.Signal) {
+	switch sig {
+	case syscall.SIGCHLD:
+		// Instances termination is handled by the watchdogs.
+		return
+	case stopRequestSignal:
+		for _, inst := range instances {
+			if consumeStopRequest(inst.run) && inst.isRunning() {
+				inst.forwardSignal(syscall.SIGINT)
+			}
+		}
+		return
+	}
+
+	for _, inst := range instances {
+		if inst.isRunning() {
+			inst.forwardSignal(sig)
+		}
+	}
+}
+
+// Supervise starts the instances and runs their watchdogs in the current
+// process. The function returns when all the instances are stopped.
+func Supervise(cmdCtx *cmdcontext.CmdCtx, instances []InstanceCtx) error {
+	sigChan := notifyAllSignals()
+	defer signal.Reset()
+
+	var wg sync.WaitGroup
+	supervised := make([]*supervisedInstance, 0, len(instances))
+	for i := range instances {
+		inst := &supervisedInstance{
+			run:     &instances[i],
+			signals: make(chan os.Signal, 1),
+			done:    make(chan struct{}),
+		}
+		supervised = append(supervised, inst)
+
+		// The instance is marked once on start: the marker removed by
+		// tt stop must not be restored by the watchdog.
+		if err := startSupervised(inst.run); err != nil {
+			log.Errorf("%s: %s", GetAppInstanceName(*inst.run), err)
+			close(inst.done)
+			continue
+		}
+		wd := newInstanceWatchdog(cmdCtx, inst.run, func() error { return nil })
+		wd.signals = inst.signals
+
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			defer close(inst.done)
+
+			if err := wd.Start(); err != nil {
+				log.Errorf("%s: %s", GetAppInstanceName(*inst.run), err)
+			}
+			cleanup(inst.run)
+		}()
+	}
+
+	allDone := make(chan struct{})
+	go func() {
+		wg.Wait()
+		close(allDone)
+	}()
+
+	for {
+		select {
+		case sig := <-sigChan:
+			dispatchSignal(supervised, sig)
+		case <-allDone:
+			return nil
+		}
+	}
+}
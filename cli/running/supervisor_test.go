@@ -0,0 +1,124 @@
+package running
+
+import (
+	"os"
+	"path/filepath"
+	"syscall"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+// createSupervisedInstances creates the supervised instances descriptions
+// with the markers in the temporary directory.
+func createSupervisedInstances(t *testing.T, names ...string) []*supervisedInstance {
+	runDir := t.TempDir()
+	instances := make([]*supervisedInstance, 0, len(names))
+	for _, name := range names {
+		inst := &supervisedInstance{
+			run:     &InstanceCtx{RunDir: runDir, InstName: name},
+			signals: make(chan os.Signal, 1),
+			done:    make(chan struct{}),
+		}
+		marker, err := os.Create(getSupervisedFile(inst.run))
+		require.NoError(t, err)
+		marker.Close()
+		instances = append(instances, inst)
+	}
+	return instances
+}
+
+// receiveSignal returns the signal passed to the instance or nil.
+func receiveSignal(inst *supervisedInstance) os.Signal {
+	select {
+	case sig := <-inst.signals:
+		return sig
+	case <-time.After(100 * time.Millisecond):
+		return nil
+	}
+}
+
+// requestStop creates the stop request file of the instance.
+func requestStop(t *testing.T, inst *supervisedInstance) {
+	requestFile, err := os.Create(getStopRequestFile(inst.run))
+	require.NoError(t, err)
+	requestFile.Close()
+}
+
+func TestDispatchSignalStopRequested(t *testing.T) {
+	instances := createSupervisedInstances(t, "master", "replica")
+	requestStop(t, instances[1])
+
+	dispatchSignal(instances, stopRequestSignal)
+	assert.Nil(t, receiveSignal(instances[0]))
+	assert.Equal(t, syscall.SIGINT, receiveSignal(instances[1]))
+	assert.NoFileExists(t, getStopRequestFile(instances[1].run))
+	assert.True(t, isSupervised(instances[1].run))
+
+	// A late stop request signal does not stop the other instances.
+	close(instances[1].done)
+	dispatchSignal(instances, stopRequestSignal)
+	assert.Nil(t, receiveSignal(instances[0]))
+
+	// The request of the finished instance is ignored.
+	requestStop(t, instances[1])
+	dispatchSignal(instances, stopRequestSignal)
+	assert.Nil(t, receiveSignal(instances[0]))
+	assert.Nil(t, receiveSignal(instances[1]))
+}
+
+func TestDispatchSignalAll(t *testing.T) {
+	instances := createSupervisedInstances(t, "master", "replica")
+
+	dispatchSignal(instances, syscall.SIGINT)
+	for _, inst := range instances {
+		assert.Equal(t, syscall.SIGINT, receiveSignal(inst))
+	}
+
+	// The stop requests do not limit the stop of all the instances.
+	requestStop(t, instances[0])
+	dispatchSignal(instances, syscall.SIGTERM)
+	for _, inst := range instances {
+		assert.Equal(t, syscall.SIGTERM, receiveSignal(inst))
+	}
+
+	dispatchSignal(instances, syscall.SIGHUP)
+	for _, inst := range instances {
+		assert.Equal(t, syscall.SIGHUP, receiveSignal(inst))
+	}
+
+	dispatchSignal(instances, syscall.SIGCHLD)
+	for _, inst := range instances {
+		assert.Nil(t, receiveSignal(inst))
+	}
+}
+
+func TestDispatchSignalFinished(t *testing.T) {
+	instances := createSupervisedInstances(t, "master", "replica")
+	close(instances[0].done)
+
+	dispatchSignal(instances, syscall.SIGINT)
+	assert.Nil(t, receiveSignal(instances[0]))
+	assert.Equal(t, syscall.SIGINT, receiveSignal(instances[1]))
+}
+
+func TestStartSupervised(t *testing.T) {
+	runDir := t.TempDir()
+	run := &InstanceCtx{RunDir: runDir, AppName: "app", InstName: "master",
+		PIDFile: filepath.Join(runDir, "master.pid")}
+	require.NoError(t, CheckNotSupervised(run))
+
+	require.NoError(t, startSupervised(run))
+	assert.FileExists(t, run.PIDFile)
+	assert.True(t, isSupervised(run))
+	assert.ErrorContains(t, CheckNotSupervised(run),
+		"the instance app:master is running under the supervisor")
+
+	// The instance owned by the running process is not marked again.
+	require.NoError(t, os.Remove(getSupervisedFile(run)))
+	assert.Error(t, startSupervised(run))
+	assert.False(t, isSupervised(run))
+	assert.NoError(t, CheckNotSupervised(run))
+}
@@ -0,0 +1,231 @@
+package running
+
+import (
+	"bufio"
+	"encoding/json"
+	"fmt"
+	"os"
+	"path/filepath"
+	"sort"
+	"strconv"
+	"strings"
+	"time"
+)
+
+const (
+	// TimingsEnv is the environment variable that enables recording of the
+	// instances startup timings by the watchdog and the launcher.
+	TimingsEnv = "TT_CLI_TIMINGS"
+	// timingsFileEnv passes the path of the timings file to the launcher.
+	timingsFileEnv = "TT_CLI_TIMINGS_FILE"
+	// timingsFileExt is an extension of the file with the startup events.
+	timingsFileExt = ".timings"
+	// timingsHistoryExt is an extension of the file with the history of
+	// the startup timings.
+	timingsHistoryExt = ".timings.jsonl"
+)
+
+// Startup events recorded by tt, the watchdog and the launcher.
+const (
+	// TimingStart is the start of the tt process.
+	TimingStart = "start"
+	// TimingConfig is the end of the tt configuration resolution.
+	TimingConfig = "config"
+	// TimingFillCtx is the end of the instances context filling.
+	TimingFillCtx = "fill_ctx"
+	// TimingLaunch is the launch of the watchdog process.
+	TimingLaunch = "launch"
+	// timingExec is the fork of the tarantool process by the watchdog.
+	timingExec = "exec"
+	// timingBoxCfgDone is the end of the initial box.cfg call.
+	timingBoxCfgDone = "box_cfg_done"
+	// timingAppLoaded is the end of the application init file execution
+	// by the launcher, the last event of the startup.
+	timingAppLoaded = "app_loaded"
+)
+
+// appLoadGrace is the time the application init file is waited to finish
+// after box.cfg. Some applications never return from the init file, their
+// startup is considered finished after box.cfg.
+const appLoadGrace = time.Second
+
+// timingPhases are the names of the startup phases ending with the events.
+var timingPhases = map[string]string{
+	TimingConfig:         "tt config",
+	TimingFillCtx:        "fill ctx",
+	TimingLaunch:         "queue",
+	timingExec:           "watchdog start",
+	"launcher":           "tarantool start",
+	"box_cfg":            "app init",
+	"snapshot_recovered": "snapshot recovery",
+	"wal_recovered":      "xlog replay",
+	"indexes_built":      "index build",
+	"synced":             "replication sync",
+	timingBoxCfgDone:     "box.cfg finish",
+	timingAppLoaded:      "app load",
+}
+
+// TimingEvent is a startup event of the instance.
+type TimingEvent struct {
+	// Name is the name of the event.
+	Name string
+	// Time is the time of the event.
+	Time time.Time
+}
+
+// PhaseTiming is the duration of a startup phase.
+type PhaseTiming struct {
+	// Name is the name of the phase.
+	Name string `json:"name"`
+	// Duration is the duration of the phase.
+	Duration time.Duration `json:"-"`
+	// Seconds is Duration in seconds, used for the JSON output.
+	Seconds float64 `json:"seconds"`
+}
+
+// StartupTimings is the breakdown of the instance startup.
+type StartupTimings struct {
+	// Instance is the full name of the instance.
+	Instance string `json:"instance"`
+	// Start is the start time of the startup.
+	Start time.Time `json:"start"`
+	// Phases are the phases of the startup in the order of execution.
+	Phases []PhaseTiming `json:"phases"`
+	// Total is the total duration of the startup.
+	Total time.Duration `json:"-"`
+	// TotalSeconds is Total in seconds, used for the JSON output.
+	TotalSeconds float64 `json:"total"`
+}
+
+// getTimingsFile returns the path of the file with the startup events.
+func getTimingsFile(run *InstanceCtx) string {
+	return filepath.Join(run.RunDir, run.InstName+timingsFileExt)
+}
+
+// formatTimingEvent returns the line of the event in the timings file.
+func formatTimingEvent(name string, eventTime time.Time) string {
+	return fmt.Sprintf("%s %.6f\n", name, float64(eventTime.UnixNano())/float64(time.Second))
+}
+
+// ResetTimings removes the startup events of the previous start.
+func ResetTimings(run *InstanceCtx) error {
+	if err := os.Remove(getTimingsFile(run)); err != nil && !os.IsNotExist(err) {
+		return err
+	}
+	return nil
+}
+
+// startTimings creates the timings file with the exec event. The events of
+// a restart replace the events of the previous start.
+func startTimings(path string) error {
+	return os.WriteFile(path, []byte(formatTimingEvent(timingExec, time.Now())), 0640)
+}
+
+// ReadTimings reads the startup events recorded by the watchdog and the
+// launcher.
+func ReadTimings(run *InstanceCtx) ([]TimingEvent, error) {
+	file, err := os.Open(getTimingsFile(run))
+	if err != nil {
+		return nil, err
+	}
+	defer file.Close()
+
+	events := []TimingEvent{}
+	scanner := bufio.NewScanner(file)
+	for scanner.Scan() {
+		fields := strings.Fields(scanner.Text())
+		if len(fields) != 2 {
+			continue
+		}
+		seconds, err := strconv.ParseFloat(fields[1], 64)
+		if err != nil {
+			continue
+		}
+		events = append(events, TimingEvent{
+			Name: fields[0],
+			Time: time.Unix(0, int64(seconds*float64(time.Second))),
+		})
+	}
+	return events, scanner.Err()
+}
+
+// checkAppLoaded checks that the launcher has recorded the end of the
+// application loading or the application has not returned from the init
+// file for appLoadGrace after box.cfg.
+func checkAppLoaded(run *InstanceCtx) error {
+	events, err := ReadTimings(run)
+	if err != nil {
+		return fmt.Errorf("the startup timings are not recorded yet")
+	}
+	for _, event := range events {
+		if event.Name == timingAppLoaded {
+			return nil
+		}
+		if event.Name == timingBoxCfgDone && time.Since(event.Time) > appLoadGrace {
+			return nil
+		}
+	}
+	return fmt.Errorf("the application is not loaded yet")
+}
+
+// WaitAppLoaded waits until the application init file of the instance is
+// executed. The exited channel must be closed when the process that runs
+// the instance is terminated.
+func WaitAppLoaded(run *InstanceCtx, timeout time.Duration, exited <-chan struct{}) error {
+	return waitCheck(run, timeout, exited, checkAppLoaded)
+}
+
+// NewStartupTimings returns the breakdown of the startup by the events. The
+// events are ordered by time, each phase lasts from the previous event to
+// the event the phase ends with. The phases of the events that are not
+// recorded, e.g. by old tarantool versions, are included into the next ones.
+func NewStartupTimings(instance string, events []TimingEvent) StartupTimings {
+	timings := StartupTimings{Instance: instance, Phases: []PhaseTiming{}}
+	if len(events) == 0 {
+		return timings
+	}
+
+	sorted := make([]TimingEvent, len(events))
+	copy(sorted, events)
+	sort.SliceStable(sorted, func(i, j int) bool {
+		return sorted[i].Time.Before(sorted[j].Time)
+	})
+
+	timings.Start = sorted[0].Time
+	for i := 1; i < len(sorted); i++ {
+		name, found := timingPhases[sorted[i].Name]
+		if !found {
+			name = sorted[i].Name
+		}
+		duration := sorted[i].Time.Sub(sorted[i-1].Time)
+		timings.Phases = append(timings.Phases, PhaseTiming{
+			Name:     name,
+			Duration: duration,
+			Seconds:  duration.Seconds(),
+		})
+	}
+	timings.Total = sorted[len(sorted)-1].Time.Sub(timings.Start)
+	timings.TotalSeconds = timings.Total.Seconds()
+	return timings
+}
+
+// AppendTimingsHistory appends the startup timings to the history file in
+// the log directory of the instance, so the startups could be compared over
+// time.
+func AppendTimingsHistory(run *InstanceCtx, timings *StartupTimings) error {
+	data, err := json.Marshal(timings)
+	if err != nil {
+		return err
+	}
+	if err := os.MkdirAll(run.LogDir, defaultDirPerms); err != nil {
+		return err
+	}
+	file, err := os.OpenFile(filepath.Join(run.LogDir, run.InstName+timingsHistoryExt),
+		os.O_WRONLY|os.O_CREATE|os.O_APPEND, 0640)
+	if err != nil {
+		return err
+	}
+	defer file.Close()
+	_, err = file.Write(append(data, '\n'))
+	return err
+}
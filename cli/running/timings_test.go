@@ -0,0 +1,80 @@
+package running
+
+import (
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestNewStartupTimings(t *testing.T) {
+	start := time.Date(2023, 4, 1, 12, 0, 0, 0, time.Local)
+	events := []TimingEvent{
+		{Name: timingExec, Time: start.Add(100 * time.Millisecond)},
+		{Name: "box_cfg", Time: start.Add(300 * time.Millisecond)},
+		{Name: TimingStart, Time: start},
+		{Name: "custom", Time: start.Add(350 * time.Millisecond)},
+		{Name: timingAppLoaded, Time: start.Add(time.Second)},
+	}
+
+	timings := NewStartupTimings("app:inst", events)
+	assert.Equal(t, "app:inst", timings.Instance)
+	assert.Equal(t, start, timings.Start)
+	assert.Equal(t, time.Second, timings.Total)
+	assert.Equal(t, 1.0, timings.TotalSeconds)
+	assert.Equal(t, []PhaseTiming{
+		{Name: "watchdog start", Duration: 100 * time.Millisecond, Seconds: 0.1},
+		{Name: "app init", Duration: 200 * time.Millisecond, Seconds: 0.2},
+		{Name: "custom", Duration: 50 * time.Millisecond, Seconds: 0.05},
+		{Name: "app load", Duration: 650 * time.Millisecond, Seconds: 0.65},
+	}, timings.Phases)
+
+	timings = NewStartupTimings("app:inst", nil)
+	assert.Empty(t, timings.Phases)
+}
+
+func TestReadTimings(t *testing.T) {
+	run := InstanceCtx{RunDir: t.TempDir(), LogDir: t.TempDir(), InstName: "inst"}
+	timingsFile := getTimingsFile(&run)
+
+	_, err := ReadTimings(&run)
+	assert.True(t, os.IsNotExist(err))
+	assert.Error(t, checkAppLoaded(&run))
+
+	require.NoError(t, startTimings(timingsFile))
+	assert.Error(t, checkAppLoaded(&run))
+
+	// The launcher appends the events to the file.
+	file, err := os.OpenFile(timingsFile, os.O_WRONLY|os.O_APPEND, 0)
+	require.NoError(t, err)
+	boxCfgTime := time.Now().Add(-2 * appLoadGrace)
+	_, err = file.WriteString("box_cfg " + "bad\n" +
+		formatTimingEvent(timingBoxCfgDone, boxCfgTime))
+	require.NoError(t, err)
+	require.NoError(t, file.Close())
+
+	events, err := ReadTimings(&run)
+	require.NoError(t, err)
+	require.Len(t, events, 2)
+	assert.Equal(t, timingExec, events[0].Name)
+	assert.Equal(t, timingBoxCfgDone, events[1].Name)
+	assert.InDelta(t, boxCfgTime.UnixNano(), events[1].Time.UnixNano(),
+		float64(time.Microsecond))
+	// The application has not returned from the init file after box.cfg.
+	assert.NoError(t, checkAppLoaded(&run))
+
+	timings := NewStartupTimings("app:inst", events)
+	require.NoError(t, AppendTimingsHistory(&run, &timings))
+	require.NoError(t, AppendTimingsHistory(&run, &timings))
+	data, err := os.ReadFile(filepath.Join(run.LogDir, "inst"+timingsHistoryExt))
+	require.NoError(t, err)
+	assert.Len(t, strings.Split(strings.TrimSpace(string(data)), "\n"), 2)
+
+	require.NoError(t, ResetTimings(&run))
+	require.NoError(t, ResetTimings(&run))
+	assert.NoFileExists(t, timingsFile)
+}
@@ -0,0 +1,250 @@
+package running
+
+import (
+	"encoding/json"
+	"fmt"
+	"os"
+	"path/filepath"
+	"strings"
+	"time"
+
+	"github.com/apex/log"
+	"github.com/tarantool/tt/cli/util"
+)
+
+const (
+	// topologyIndexFileName is the name of the topology index file in the
+	// run directory.
+	topologyIndexFileName = "instances.index"
+	// topologyIndexVersion is the version of the index format.
+	topologyIndexVersion = 1
+	// topologyRacyInterval is the period after a change of a source during
+	// which the index is not saved: a change made within the same
+	// modification time tick could be missed by the validation.
+	topologyRacyInterval = time.Second
+)
+
+// indexedInstance is an instance of the topology index.
+type indexedInstance struct {
+	AppPath   string `json:"app_path"`
+	AppName   string `json:"app_name"`
+	InstName  string `json:"inst_name"`
+	SingleApp bool   `json:"single_app"`
+	CPUSet    string `json:"cpuset,omitempty"`
+	NumaNode  *int   `json:"numa_node,omitempty"`
+}
+
+// indexedApp is an application of the topology index.
+type indexedApp struct {
+	// Name is the name of the application entry in the instances enabled
+	// directory.
+	Name string `json:"name"`
+	// Instances are the instances of the application.
+	Instances []indexedInstance `json:"instances"`
+}
+
+// topologyIndex is the cached list of the applications and their instances
+// of the instances enabled directory. It is valid while the signatures of
+// the sources are not changed: the instances enabled directory, the
+// applications directories, instances.yml files and the skipped directories.
+// Adding or removing of an application or an instance init file changes the
+// directory modification time.
+type topologyIndex struct {
+	// Version is the version of the index format.
+	Version int `json:"version"`
+	// InstancesEnabled is the instances enabled directory.
+	InstancesEnabled string `json:"instances_enabled"`
+	// Sources are the files the index is built from.
+	Sources []string `json:"sources"`
+	// Signatures are the signatures of the sources.
+	Signatures []util.FileSignature `json:"signatures"`
+	// Skipped are the entries of the instances enabled directory that are
+	// not applications.
+	Skipped []string `json:"skipped"`
+	// Apps are the applications.
+	Apps []indexedApp `json:"apps"`
+}
+
+// newIndexedApp creates an indexed application from the collected instances.
+func newIndexedApp(name string, instances []InstanceCtx) indexedApp {
+	app := indexedApp{Name: name, Instances: make([]indexedInstance, 0, len(instances))}
+	for _, inst := range instances {
+		app.Instances = append(app.Instances, indexedInstance{
+			AppPath:   inst.AppPath,
+			AppName:   inst.AppName,
+			InstName:  inst.InstName,
+			SingleApp: inst.SingleApp,
+			CPUSet:    inst.CPUSet,
+			NumaNode:  inst.NumaNode,
+		})
+	}
+	return app
+}
+
+// getInstances returns the instances of the indexed application.
+func (app *indexedApp) getInstances() []InstanceCtx {
+	instances := make([]InstanceCtx, 0, len(app.Instances))
+	for _, inst := range app.Instances {
+		instances = append(instances, InstanceCtx{
+			AppPath:   inst.AppPath,
+			AppName:   inst.AppName,
+			InstName:  inst.InstName,
+			SingleApp: inst.SingleApp,
+			CPUSet:    inst.CPUSet,
+			NumaNode:  inst.NumaNode,
+		})
+	}
+	return instances
+}
+
+// getTopologyIndexFile returns the path to the topology index file.
+func getTopologyIndexFile(configDir string, runDir string) string {
+	if !filepath.IsAbs(runDir) {
+		runDir = filepath.Join(configDir, runDir)
+	}
+	return filepath.Join(runDir, topologyIndexFileName)
+}
+
+// loadTopologyIndex loads the topology index of the instances enabled
+// directory. It returns nil if the index does not exist or is outdated.
+func loadTopologyIndex(indexPath string, instEnabledPath string) *topologyIndex {
+	data, err := os.ReadFile(indexPath)
+	if err != nil {
+		return nil
+	}
+	var index topologyIndex
+	if err = json.Unmarshal(data, &index); err != nil {
+		log.Debugf("Failed to parse the topology index %s: %s", indexPath, err)
+		return nil
+	}
+	if index.Version != topologyIndexVersion || index.InstancesEnabled != instEnabledPath {
+		return nil
+	}
+	if !util.FileSignaturesEqual(index.Signatures, util.GetFileSignatures(index.Sources)) {
+		return nil
+	}
+	return &index
+}
+
+// isRacy returns true if one of the sources has been changed too recently
+// for the index to be saved.
+func (index *topologyIndex) isRacy() bool {
+	now := time.Now().UnixNano()
+	for _, signature := range index.Signatures {
+		if now-signature.ModTime < int64(topologyRacyInterval) {
+			return true
+		}
+	}
+	return false
+}
+
+// save writes the index to the file atomically. The index is not saved if
+// the run directory does not exist.
+func (index *topologyIndex) save(indexPath string) error {
+	if _, err := os.Stat(filepath.Dir(indexPath)); err != nil {
+		return nil
+	}
+	data, err := json.Marshal(index)
+	if err != nil {
+		return err
+	}
+	tmpFile, err := os.CreateTemp(filepath.Dir(indexPath), topologyIndexFileName+".*")
+	if err != nil {
+		return err
+	}
+	defer os.Remove(tmpFile.Name())
+	if _, err = tmpFile.Write(data); err != nil {
+		tmpFile.Close()
+		return err
+	}
+	if err = tmpFile.Close(); err != nil {
+		return err
+	}
+	return os.Rename(tmpFile.Name(), indexPath)
+}
+
+// buildTopologyIndex collects the applications and their instances of the
+// instances enabled directory.
+func buildTopologyIndex(configDir string, instancesEnabled string,
+	instEnabledPath string) (*topologyIndex, error) {
+	appList, err := util.CollectAppList(configDir, instancesEnabled, false)
+	if err != nil {
+		return nil, fmt.Errorf("can't collect an application list "+
+			"from instances enabled path %s: %s", instEnabledPath, err)
+	}
+
+	index := topologyIndex{
+		Version:          topologyIndexVersion,
+		InstancesEnabled: instEnabledPath,
+		Sources:          []string{instEnabledPath},
+		Skipped:          []string{},
+		Apps:             make([]indexedApp, 0, len(appList)),
+	}
+	isApp := map[string]bool{}
+	for _, appInfo := range appList {
+		isApp[appInfo.Name] = true
+		appName := strings.TrimSuffix(appInfo.Name, ".lua")
+		instances, err := CollectInstances(appName, instEnabledPath)
+		if err != nil {
+			return nil, fmt.Errorf("%s: can't find an application init file: %s", appName, err)
+		}
+		index.Apps = append(index.Apps, newIndexedApp(appInfo.Name, instances))
+		if !strings.HasSuffix(appInfo.Location, ".lua") {
+			index.Sources = append(index.Sources, appInfo.Location,
+				filepath.Join(appInfo.Location, "instances.yml"))
+		}
+	}
+
+	// The base directory is not scanned if it is an application.
+	if len(appList) != 1 || appList[0].Location != instEnabledPath {
+		entries, err := os.ReadDir(instEnabledPath)
+		if err != nil {
+			return nil, err
+		}
+		for _, entry := range entries {
+			if isApp[entry.Name()] {
+				continue
+			}
+			index.Skipped = append(index.Skipped, entry.Name())
+			// A skipped directory becomes an application when an init file
+			// is added to it. The signature of a symlink is the signature
+			// of its target.
+			if entry.IsDir() || entry.Type()&os.ModeSymlink != 0 {
+				index.Sources = append(index.Sources,
+					filepath.Join(instEnabledPath, entry.Name()))
+			}
+		}
+	}
+
+	index.Signatures = util.GetFileSignatures(index.Sources)
+	return &index, nil
+}
+
+// collectTopology returns the applications and their instances of the
+// instances enabled directory. The topology is loaded from the index in the
+// run directory if it is up to date, otherwise it is collected from the file
+// system and the index is updated.
+func collectTopology(configDir string, instancesEnabled string, instEnabledPath string,
+	runDir string, verbose bool) ([]indexedApp, error) {
+	indexPath := getTopologyIndexFile(configDir, runDir)
+	index := loadTopologyIndex(indexPath, instEnabledPath)
+	if index == nil {
+		var err error
+		if index, err = buildTopologyIndex(configDir, instancesEnabled,
+			instEnabledPath); err != nil {
+			return nil, err
+		}
+		if !index.isRacy() {
+			if err = index.save(indexPath); err != nil {
+				log.Debugf("Failed to save the topology index %s: %s", indexPath, err)
+			}
+		}
+	}
+
+	if verbose {
+		for _, name := range index.Skipped {
+			log.Warnf("Skipping %s: the source is not an application.", name)
+		}
+	}
+	return index.Apps, nil
+}
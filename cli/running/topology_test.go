@@ -0,0 +1,127 @@
+package running
+
+import (
+	"os"
+	"path/filepath"
+	"sort"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+// setOldMtime sets the modification time of the files in the past, so the
+// topology index is not considered racy.
+func setOldMtime(t *testing.T, paths ...string) {
+	oldTime := time.Now().Add(-time.Hour)
+	for _, path := range paths {
+		require.NoError(t, os.Chtimes(path, oldTime, oldTime))
+	}
+}
+
+// getInstanceNames returns the sorted full names of the instances of the apps.
+func getInstanceNames(apps []indexedApp) []string {
+	names := []string{}
+	for _, app := range apps {
+		for _, inst := range app.getInstances() {
+			names = append(names, GetAppInstanceName(inst))
+		}
+	}
+	sort.Strings(names)
+	return names
+}
+
+func TestCollectTopology(t *testing.T) {
+	configDir := t.TempDir()
+	appsDir := filepath.Join(configDir, "instances.enabled")
+	runDir := filepath.Join(configDir, "run")
+	require.NoError(t, os.MkdirAll(filepath.Join(appsDir, "multi"), 0755))
+	require.NoError(t, os.MkdirAll(filepath.Join(appsDir, "single"), 0755))
+	require.NoError(t, os.MkdirAll(runDir, 0755))
+	for _, file := range []string{"script.lua", "single/init.lua", "multi/init.lua",
+		"readme.txt"} {
+		require.NoError(t, os.WriteFile(filepath.Join(appsDir, file), []byte{}, 0644))
+	}
+	instancesYml := filepath.Join(appsDir, "multi", "instances.yml")
+	require.NoError(t, os.WriteFile(instancesYml, []byte("master:\nreplica:\n"), 0644))
+	setOldMtime(t, appsDir, filepath.Join(appsDir, "multi"), filepath.Join(appsDir, "single"),
+		instancesYml)
+
+	expected := []string{"multi:master", "multi:replica", "script", "single"}
+	apps, err := collectTopology(configDir, appsDir, appsDir, runDir, false)
+	require.NoError(t, err)
+	assert.Equal(t, expected, getInstanceNames(apps))
+
+	// The index is saved and used while the sources are not changed.
+	indexPath := filepath.Join(runDir, topologyIndexFileName)
+	index := loadTopologyIndex(indexPath, appsDir)
+	require.NotNil(t, index)
+	assert.Equal(t, []string{"readme.txt"}, index.Skipped)
+	assert.Nil(t, loadTopologyIndex(indexPath, configDir))
+
+	apps, err = collectTopology(configDir, appsDir, appsDir, runDir, false)
+	require.NoError(t, err)
+	assert.Equal(t, expected, getInstanceNames(apps))
+
+	// A new instance in instances.yml invalidates the index.
+	require.NoError(t, os.WriteFile(instancesYml, []byte("master:\nreplica:\nrouter:\n"),
+		0644))
+	assert.Nil(t, loadTopologyIndex(indexPath, appsDir))
+	apps, err = collectTopology(configDir, appsDir, appsDir, runDir, false)
+	require.NoError(t, err)
+	assert.Equal(t, []string{"multi:master", "multi:replica", "multi:router", "script",
+		"single"}, getInstanceNames(apps))
+	// The index is not saved right after the change.
+	assert.Nil(t, loadTopologyIndex(indexPath, appsDir))
+
+	// A removed application invalidates the index.
+	setOldMtime(t, instancesYml)
+	_, err = collectTopology(configDir, appsDir, appsDir, runDir, false)
+	require.NoError(t, err)
+	require.NotNil(t, loadTopologyIndex(indexPath, appsDir))
+	require.NoError(t, os.Remove(filepath.Join(appsDir, "script.lua")))
+	apps, err = collectTopology(configDir, appsDir, appsDir, runDir, false)
+	require.NoError(t, err)
+	assert.Equal(t, []string{"multi:master", "multi:replica", "multi:router", "single"},
+		getInstanceNames(apps))
+}
+
+func TestCollectTopologySkippedDirBecomesApp(t *testing.T) {
+	configDir := t.TempDir()
+	appsDir := filepath.Join(configDir, "instances.enabled")
+	runDir := filepath.Join(configDir, "run")
+	draftDir := filepath.Join(appsDir, "draft")
+	linkedDir := filepath.Join(configDir, "linked")
+	require.NoError(t, os.MkdirAll(draftDir, 0755))
+	require.NoError(t, os.MkdirAll(linkedDir, 0755))
+	require.NoError(t, os.MkdirAll(runDir, 0755))
+	require.NoError(t, os.Symlink(linkedDir, filepath.Join(appsDir, "linked")))
+	require.NoError(t, os.WriteFile(filepath.Join(appsDir, "script.lua"), []byte{}, 0644))
+	setOldMtime(t, appsDir, draftDir, linkedDir)
+
+	apps, err := collectTopology(configDir, appsDir, appsDir, runDir, false)
+	require.NoError(t, err)
+	assert.Equal(t, []string{"script"}, getInstanceNames(apps))
+	indexPath := filepath.Join(runDir, topologyIndexFileName)
+	index := loadTopologyIndex(indexPath, appsDir)
+	require.NotNil(t, index)
+	assert.ElementsMatch(t, []string{"draft", "linked"}, index.Skipped)
+
+	// The skipped directory with a new init file is an application.
+	require.NoError(t, os.WriteFile(filepath.Join(draftDir, "init.lua"), []byte{}, 0644))
+	assert.Nil(t, loadTopologyIndex(indexPath, appsDir))
+	apps, err = collectTopology(configDir, appsDir, appsDir, runDir, false)
+	require.NoError(t, err)
+	assert.Equal(t, []string{"draft", "script"}, getInstanceNames(apps))
+
+	// The same for the target of a skipped symlink.
+	setOldMtime(t, draftDir)
+	_, err = collectTopology(configDir, appsDir, appsDir, runDir, false)
+	require.NoError(t, err)
+	require.NotNil(t, loadTopologyIndex(indexPath, appsDir))
+	require.NoError(t, os.WriteFile(filepath.Join(linkedDir, "init.lua"), []byte{}, 0644))
+	apps, err = collectTopology(configDir, appsDir, appsDir, runDir, false)
+	require.NoError(t, err)
+	assert.Equal(t, []string{"draft", "linked", "script"}, getInstanceNames(apps))
+}
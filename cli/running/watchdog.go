@@ -23,6 +23,34 @@ type Provider interface {
 	IsRestartable() (bool, error)
 }
 
+// RestartPolicy describes how the watchdog restarts a crashed Instance.
+type RestartPolicy struct {
+	// BackoffMin is the delay before the first restart.
+	BackoffMin time.Duration
+	// BackoffMax is the maximum delay between restarts.
+	BackoffMax time.Duration
+	// BackoffFactor is the multiplier of the delay applied after each
+	// consecutive crash.
+	BackoffFactor float64
+	// MinUptime is the Instance uptime after which the crash is not considered
+	// consecutive: the delay is reset to the minimum.
+	MinUptime time.Duration
+	// CrashLoopThreshold is the number of consecutive crashes after which
+	// the Instance is not restarted anymore. Zero disables the detection.
+	CrashLoopThreshold int
+}
+
+// LivenessProbe describes the periodic check that the Instance is not hung.
+type LivenessProbe struct {
+	// Interval is the period of the checks. Zero disables the probe.
+	Interval time.Duration
+	// Timeout is the maximum time of a check.
+	Timeout time.Duration
+	// FailureThreshold is the number of consecutive failed checks after
+	// which the Instance is killed.
+	FailureThreshold int
+}
+
 // Watchdog is a process that controls an Instance process.
 type Watchdog struct {
 	// Instance describes the controlled Instance.
@@ -32,9 +60,14 @@ type Watchdog struct {
 	// doneBarrier used to indicate the completion of the
 	// signal handling goroutine.
 	doneBarrier sync.WaitGroup
-	// restartTimeout describes the timeout between
-	// restarting the Instance.
-	restartTimeout time.Duration
+	// restartPolicy describes how to restart the crashed Instance.
+	restartPolicy RestartPolicy
+	// restarts is the number of the Instance restarts.
+	restarts int
+	// crashes is the number of consecutive crashes of the Instance.
+	crashes int
+	// backoff is the current delay before the Instance restart.
+	backoff time.Duration
 	// done channel used to inform the signal handle goroutine
 	// about termination of the Instance.
 	done chan bool
@@ -48,12 +81,27 @@ type Watchdog struct {
 	shouldStop bool
 	// preStartAction is a hook that is to be run before the start of a new Instance.
 	preStartAction func() error
+	// signals is a source of signals to handle. If it is nil, the signals
+	// received by the process are handled.
+	signals <-chan os.Signal
+	// stateFile is a file to store the watchdog state. If it is empty,
+	// the state is not stored.
+	stateFile string
+	// livenessProbe describes the checks of the hung Instance.
+	livenessProbe LivenessProbe
+	// probeCheck checks that the Instance responds within the timeout. The
+	// Instance is not checked if it is nil.
+	probeCheck func(timeout time.Duration) error
+	// probeLatency is the duration of the last check.
+	probeLatency time.Duration
+	// probeFailures is the number of consecutive failed checks.
+	probeFailures int
 }
 
 // NewWatchdog creates a new instance of Watchdog.
-func NewWatchdog(restartable bool, restartTimeout time.Duration, logger *ttlog.Logger,
+func NewWatchdog(restartable bool, restartPolicy RestartPolicy, logger *ttlog.Logger,
 	provider Provider, preStartAction func() error) *Watchdog {
-	wd := Watchdog{Instance: nil, logger: logger, restartTimeout: restartTimeout,
+	wd := Watchdog{Instance: nil, logger: logger, restartPolicy: restartPolicy,
 		provider: provider, preStartAction: preStartAction}
 
 	wd.done = make(chan bool, 1)
@@ -95,17 +143,24 @@ func (wd *Watchdog) Start() error {
 			return nil
 		}
 		// Start the Instance.
+		startTime := time.Now()
 		if err := wd.Instance.Start(); err != nil {
 			wd.logger.Printf(`Watchdog(ERROR): "%v".`, err)
 			wd.stopMutex.Unlock()
 			break
 		}
 		wd.stopMutex.Unlock()
+		wd.probeLatency = 0
+		wd.probeFailures = 0
+		wd.writeState(false)
+		stopProbe, probeDone := wd.startLivenessProbe()
 
 		// Wait while the Instance will be terminated.
 		if err := wd.Instance.Wait(); err != nil {
 			wd.logger.Printf(`Watchdog(WARN): "%v".`, err)
 		}
+		close(stopProbe)
+		<-probeDone
 
 		// Set Instance process completion indication.
 		wd.done <- true
@@ -129,7 +184,21 @@ func (wd *Watchdog) Start() error {
 		} else {
 			wd.logger = logger
 		}
-		time.Sleep(wd.restartTimeout)
+
+		delay, parked := wd.nextRestart(time.Since(startTime))
+		if parked {
+			wd.logger.Printf("Watchdog(ERROR): the Instance has crashed %d times in a row"+
+				" with uptime less than %s, it will not be restarted.",
+				wd.crashes, wd.restartPolicy.MinUptime)
+		} else {
+			wd.logger.Printf("Watchdog(INFO): the Instance will be restarted in %s.", delay)
+		}
+		wd.writeState(parked)
+		if !wd.waitRestart(delay, parked) {
+			wd.logger.Println("Watchdog(INFO): the Instance has shutdown.")
+			break
+		}
+		wd.restarts++
 
 		wd.shouldStop = false
 
@@ -145,8 +214,9 @@ func (wd *Watchdog) Start() error {
 	return nil
 }
 
-// startSignalHandling starts signal handling in a separate goroutine.
-func (wd *Watchdog) startSignalHandling() {
+// notifyAllSignals resets the signal mask and returns a channel to receive
+// all the signals of the process.
+func notifyAllSignals() <-chan os.Signal {
 	sigChan := make(chan os.Signal, 1)
 	// Reset the signal mask before starting of the new loop.
 	signal.Reset()
@@ -159,6 +229,153 @@ func (wd *Watchdog) startSignalHandling() {
 	// https://github.com/golang/go/issues/37942.
 	signal.Ignore(syscall.SIGURG)
 
+	return sigChan
+}
+
+// nextRestart returns the delay before the restart of the Instance
+// terminated after the uptime. Returns true if a crash loop is detected
+// and the Instance should not be restarted.
+func (wd *Watchdog) nextRestart(uptime time.Duration) (time.Duration, bool) {
+	policy := wd.restartPolicy
+	if uptime >= policy.MinUptime {
+		wd.crashes = 0
+		wd.backoff = 0
+	} else {
+		wd.crashes++
+	}
+
+	if policy.CrashLoopThreshold > 0 && wd.crashes >= policy.CrashLoopThreshold {
+		return 0, true
+	}
+
+	if wd.backoff == 0 {
+		wd.backoff = policy.BackoffMin
+	} else {
+		wd.backoff = time.Duration(float64(wd.backoff) * policy.BackoffFactor)
+	}
+	if wd.backoff > policy.BackoffMax {
+		wd.backoff = policy.BackoffMax
+	}
+	return wd.backoff, false
+}
+
+// waitRestart waits for the delay before the Instance restart. The parked
+// Instance is waited until the stop. Returns false if the Watchdog should
+// be stopped.
+func (wd *Watchdog) waitRestart(delay time.Duration, parked bool) bool {
+	var timerChan <-chan time.Time
+	if !parked {
+		timer := time.NewTimer(delay)
+		defer timer.Stop()
+		timerChan = timer.C
+	}
+
+	for {
+		select {
+		case <-timerChan:
+			return true
+		case sig := <-wd.signals:
+			switch sig {
+			case syscall.SIGINT, syscall.SIGTERM:
+				return false
+			case syscall.SIGHUP:
+				// Rotate the log files.
+				wd.logger.Rotate()
+			}
+		}
+	}
+}
+
+// startLivenessProbe starts the periodic checks of the Instance in a separate
+// goroutine. The checks are stopped by closing the returned stop channel, the
+// returned done channel is closed after the goroutine exits.
+func (wd *Watchdog) startLivenessProbe() (chan<- struct{}, <-chan struct{}) {
+	stop := make(chan struct{})
+	done := make(chan struct{})
+	if wd.probeCheck == nil || wd.livenessProbe.Interval <= 0 {
+		close(done)
+		return stop, done
+	}
+
+	go func() {
+		defer close(done)
+		wd.runLivenessProbe(stop)
+	}()
+	return stop, done
+}
+
+// runLivenessProbe checks the Instance until the stop channel is closed. The
+// failures are counted after the first successful check only, so a slow
+// start of the Instance is not considered a hang. The Instance is killed after
+// FailureThreshold consecutive failures to be restarted as a crashed one.
+func (wd *Watchdog) runLivenessProbe(stop <-chan struct{}) {
+	probe := wd.livenessProbe
+	ticker := time.NewTicker(probe.Interval)
+	defer ticker.Stop()
+
+	responded := false
+	for {
+		select {
+		case <-stop:
+			return
+		case <-ticker.C:
+		}
+
+		startTime := time.Now()
+		err := wd.probeCheck(probe.Timeout)
+		latency := time.Since(startTime)
+		if err == nil {
+			responded = true
+			wd.probeFailures = 0
+		} else if responded {
+			wd.probeFailures++
+			wd.logger.Printf(`Watchdog(WARN): liveness probe failed (%d of %d): "%v".`,
+				wd.probeFailures, probe.FailureThreshold, err)
+		} else {
+			continue
+		}
+		wd.probeLatency = latency
+		wd.writeState(false)
+
+		if probe.FailureThreshold > 0 && wd.probeFailures >= probe.FailureThreshold {
+			wd.stopMutex.Lock()
+			stopping := wd.shouldStop
+			wd.stopMutex.Unlock()
+			if !stopping {
+				wd.logger.Printf("Watchdog(ERROR): the Instance does not respond for %d "+
+					"liveness probes, it is killed.", wd.probeFailures)
+				wd.Instance.SendSignal(syscall.SIGKILL)
+			}
+			return
+		}
+	}
+}
+
+// writeState stores the current state of the Watchdog.
+func (wd *Watchdog) writeState(parked bool) {
+	if wd.stateFile == "" {
+		return
+	}
+
+	state := WatchdogState{Restarts: wd.restarts, Backoff: wd.backoff, Parked: parked,
+		ProbeLatency: wd.probeLatency, ProbeFailures: wd.probeFailures}
+	if !parked && wd.Instance.Cmd != nil && wd.Instance.Cmd.Process != nil {
+		state.InstancePID = wd.Instance.Cmd.Process.Pid
+	}
+	if err := writeWatchdogState(wd.stateFile, &state); err != nil {
+		wd.logger.Printf(`Watchdog(WARN): can't write the state: "%v".`, err)
+	}
+}
+
+// startSignalHandling starts signal handling in a separate goroutine.
+func (wd *Watchdog) startSignalHandling() {
+	// The signals are received to the same channel during the Watchdog
+	// lifetime, so they are not lost between the Instance restarts.
+	if wd.signals == nil {
+		wd.signals = notifyAllSignals()
+	}
+	sigChan := wd.signals
+
 	// Set barrier to synchronize with the main loop when the Instance stops.
 	wd.doneBarrier.Add(1)
 
@@ -183,6 +400,11 @@ func (wd *Watchdog) startSignalHandling() {
 				case syscall.SIGHUP:
 					// Rotate the log files.
 					wd.logger.Rotate()
+					// In the passthrough mode the Instance writes to the log
+					// file by itself, so it has to reopen the file.
+					if wd.logger.IsPassthrough() && wd.Instance.IsAlive() {
+						wd.Instance.SendSignal(sig)
+					}
 				default:
 					if wd.Instance.IsAlive() {
 						wd.Instance.SendSignal(sig)
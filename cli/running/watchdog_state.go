@@ -0,0 +1,70 @@
+package running
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"time"
+
+	"gopkg.in/yaml.v2"
+)
+
+// stateFileExt is an extension of the file with the watchdog state.
+const stateFileExt = ".state"
+
+// WatchdogState describes the state of the watchdog and its instance. It is
+// stored in the run directory of the instance to be shown by other commands.
+type WatchdogState struct {
+	// InstancePID is the PID of the tarantool process.
+	InstancePID int `yaml:"instance_pid"`
+	// Restarts is the number of restarts of the instance.
+	Restarts int `yaml:"restarts"`
+	// Backoff is the current delay before the restart of the instance.
+	Backoff time.Duration `yaml:"backoff"`
+	// Parked is true if the instance is not restarted anymore because
+	// of a crash loop.
+	Parked bool `yaml:"parked"`
+	// ProbeLatency is the duration of the last liveness probe of the
+	// instance, zero if the instance is not probed.
+	ProbeLatency time.Duration `yaml:"probe_latency"`
+	// ProbeFailures is the number of consecutive failed liveness probes.
+	ProbeFailures int `yaml:"probe_failures"`
+}
+
+// getStateFile returns the path of the file with the watchdog state.
+func getStateFile(run *InstanceCtx) string {
+	return filepath.Join(run.RunDir, run.InstName+stateFileExt)
+}
+
+// writeWatchdogState writes the watchdog state to the file. The file is
+// replaced atomically, so readers never see a partially written state.
+func writeWatchdogState(stateFile string, state *WatchdogState) error {
+	data, err := yaml.Marshal(state)
+	if err != nil {
+		return err
+	}
+
+	tmpFile := stateFile + ".tmp"
+	if err := os.WriteFile(tmpFile, data, 0640); err != nil {
+		return err
+	}
+	if err := os.Rename(tmpFile, stateFile); err != nil {
+		os.Remove(tmpFile)
+		return err
+	}
+	return nil
+}
+
+// ReadWatchdogState reads the watchdog state of the instance.
+func ReadWatchdogState(run *InstanceCtx) (*WatchdogState, error) {
+	data, err := os.ReadFile(getStateFile(run))
+	if err != nil {
+		return nil, err
+	}
+
+	var state WatchdogState
+	if err := yaml.Unmarshal(data, &state); err != nil {
+		return nil, fmt.Errorf("failed to parse the watchdog state: %s", err)
+	}
+	return &state, nil
+}
@@ -1,6 +1,7 @@
 package running
 
 import (
+	"fmt"
 	"io"
 	"io/ioutil"
 	"os"
@@ -11,6 +12,7 @@ import (
 	"time"
 
 	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
 	"github.com/tarantool/tt/cli/ttlog"
 )
 
@@ -78,7 +80,9 @@ func createTestWatchdog(t *testing.T, restartable bool) *Watchdog {
 	provider := providerTestImpl{tarantool: tarantoolBin, appPath: appPath, logger: logger,
 		dataDir: dataDir, restartable: restartable}
 	testPreAction := func() error { return nil }
-	wd := NewWatchdog(restartable, wdTestRestartTimeout, logger, &provider, testPreAction)
+	restartPolicy := RestartPolicy{BackoffMin: wdTestRestartTimeout,
+		BackoffMax: wdTestRestartTimeout, BackoffFactor: 1}
+	wd := NewWatchdog(restartable, restartPolicy, logger, &provider, testPreAction)
 
 	return wd
 }
@@ -159,3 +163,106 @@ func TestWatchdogNotRestartable(t *testing.T) {
 	case <-wdDoneChan:
 	}
 }
+
+func TestWatchdogNextRestart(t *testing.T) {
+	assert := assert.New(t)
+
+	wd := NewWatchdog(true, RestartPolicy{
+		BackoffMin:         time.Second,
+		BackoffMax:         5 * time.Second,
+		BackoffFactor:      2,
+		MinUptime:          time.Minute,
+		CrashLoopThreshold: 5,
+	}, nil, nil, nil)
+
+	// The delay grows after each consecutive crash up to the maximum.
+	for _, expected := range []time.Duration{time.Second, 2 * time.Second,
+		4 * time.Second, 5 * time.Second} {
+		delay, parked := wd.nextRestart(time.Second)
+		assert.False(parked)
+		assert.Equal(expected, delay)
+	}
+
+	// The delay is reset after the instance has worked long enough.
+	delay, parked := wd.nextRestart(2 * time.Minute)
+	assert.False(parked)
+	assert.Equal(time.Second, delay)
+
+	// The crash loop is detected after the threshold.
+	for i := 1; i < 5; i++ {
+		_, parked = wd.nextRestart(time.Second)
+		assert.False(parked)
+	}
+	_, parked = wd.nextRestart(time.Second)
+	assert.True(parked)
+}
+
+func TestWatchdogNextRestartZeroPolicy(t *testing.T) {
+	assert := assert.New(t)
+
+	// Zero minimum delay restarts immediately, zero threshold never parks.
+	wd := NewWatchdog(true, RestartPolicy{
+		BackoffMax:    5 * time.Second,
+		BackoffFactor: 2,
+		MinUptime:     time.Minute,
+	}, nil, nil, nil)
+	for i := 0; i < 20; i++ {
+		delay, parked := wd.nextRestart(time.Second)
+		assert.False(parked)
+		assert.Equal(time.Duration(0), delay)
+	}
+}
+
+func TestWatchdogState(t *testing.T) {
+	run := InstanceCtx{RunDir: t.TempDir(), InstName: "inst"}
+	state := WatchdogState{InstancePID: 42, Restarts: 3, Backoff: 4 * time.Second}
+	require.NoError(t, writeWatchdogState(getStateFile(&run), &state))
+
+	readState, err := ReadWatchdogState(&run)
+	require.NoError(t, err)
+	assert.Equal(t, state, *readState)
+}
+
+func TestWatchdogLivenessProbe(t *testing.T) {
+	cmd := exec.Command("sleep", "10")
+	require.NoError(t, cmd.Start())
+	t.Cleanup(func() { cmd.Process.Kill() })
+
+	wd := NewWatchdog(true, RestartPolicy{}, ttlog.NewCustomLogger(io.Discard, "", 0),
+		nil, nil)
+	wd.Instance = &Instance{Cmd: cmd}
+	wd.livenessProbe = LivenessProbe{
+		Interval:         10 * time.Millisecond,
+		Timeout:          time.Second,
+		FailureThreshold: 3,
+	}
+	// The instance responds after the start and hangs later.
+	checks := 0
+	wd.probeCheck = func(timeout time.Duration) error {
+		checks++
+		if checks == 1 || checks == 3 {
+			return fmt.Errorf("timeout")
+		}
+		if checks == 2 {
+			return nil
+		}
+		assert.Equal(t, time.Second, timeout)
+		return fmt.Errorf("timeout")
+	}
+
+	stop, done := wd.startLivenessProbe()
+	select {
+	case <-done:
+	case <-time.After(wdTestStopTimeout):
+		close(stop)
+		require.Fail(t, "The hung instance is not killed.")
+	}
+
+	// The failure before the first response is ignored.
+	assert.Equal(t, 5, checks)
+	assert.Equal(t, 3, wd.probeFailures)
+	assert.Greater(t, wd.probeLatency, time.Duration(0))
+	err := cmd.Wait()
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "killed")
+}
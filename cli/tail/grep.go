@@ -0,0 +1,250 @@
+package tail
+
+import (
+	"bufio"
+	"compress/gzip"
+	"fmt"
+	"io"
+	"os"
+	"regexp"
+	"runtime"
+	"strings"
+	"sync"
+	"time"
+
+	"github.com/tarantool/tt/cli/running"
+	"github.com/tarantool/tt/cli/ttlog"
+)
+
+// maxLineSize is the maximum size of a log line to search in.
+const maxLineSize = 1024 * 1024
+
+// Time formats of the --since and --until options.
+var boundTimeFormats = []string{
+	time.RFC3339,
+	"2006-01-02 15:04:05.000",
+	"2006-01-02 15:04:05",
+	"2006-01-02 15:04",
+	"2006-01-02",
+}
+
+// GrepOpts describes the options of the log search.
+type GrepOpts struct {
+	// Pattern is the regular expression to search for.
+	Pattern *regexp.Regexp
+	// Since skips the lines older than the time if it is not zero.
+	Since time.Time
+	// Until skips the lines newer than the time if it is not zero.
+	Until time.Time
+	// Jobs is the number of the files searched in parallel.
+	Jobs int
+}
+
+// grepFile is a current or rotated log file to search in.
+type grepFile struct {
+	// instance is the full name of the instance.
+	instance string
+	// path is the path to the file.
+	path string
+	// compressed is true if the file is compressed with gzip.
+	compressed bool
+	// from is the time the file could contain lines since, zero if unknown.
+	from time.Time
+	// to is the time the file could contain lines until, zero if unknown.
+	to time.Time
+}
+
+// ParseTimeBound parses the value of --since or --until option. It is
+// either a time in one of the supported formats or a duration before now.
+func ParseTimeBound(value string, now time.Time) (time.Time, error) {
+	if value == "" {
+		return time.Time{}, nil
+	}
+	if duration, err := time.ParseDuration(value); err == nil {
+		return now.Add(-duration), nil
+	}
+	for _, format := range boundTimeFormats {
+		if boundTime, err := time.ParseInLocation(format, value, time.Local); err == nil {
+			return boundTime, nil
+		}
+	}
+	return time.Time{}, fmt.Errorf("invalid time %q, expected a duration like 1h30m or "+
+		"a time like \"2006-01-02 15:04:05\"", value)
+}
+
+// getGrepFiles returns the current and rotated logs of the instance. The
+// time range of a rotated log is between the previous rotation and its own
+// rotation.
+func getGrepFiles(instance string, logPath string) ([]grepFile, error) {
+	backups, err := ttlog.ListBackups(logPath)
+	if err != nil {
+		if os.IsNotExist(err) {
+			return nil, nil
+		}
+		return nil, err
+	}
+
+	files := []grepFile{}
+	if _, err := os.Stat(logPath); err == nil {
+		current := grepFile{instance: instance, path: logPath}
+		if len(backups) > 0 {
+			current.from = backups[0].RotationTime
+		}
+		files = append(files, current)
+	}
+	for i, backup := range backups {
+		file := grepFile{
+			instance:   instance,
+			path:       backup.Path,
+			compressed: backup.Compressed,
+			to:         backup.RotationTime,
+		}
+		if i+1 < len(backups) {
+			file.from = backups[i+1].RotationTime
+		}
+		files = append(files, file)
+	}
+	return files, nil
+}
+
+// isInRange returns true if the file could contain lines of the time range.
+func (file *grepFile) isInRange(opts *GrepOpts) bool {
+	if !opts.Since.IsZero() && !file.to.IsZero() && file.to.Before(opts.Since) {
+		return false
+	}
+	if !opts.Until.IsZero() && !file.from.IsZero() && file.from.After(opts.Until) {
+		return false
+	}
+	return true
+}
+
+// grep sends the lines of the file matching the options to the matches
+// channel prefixed with the instance name.
+func (file *grepFile) grep(opts *GrepOpts, matches chan<- string) error {
+	osFile, err := os.Open(file.path)
+	if err != nil {
+		return err
+	}
+	defer osFile.Close()
+
+	var reader io.Reader = osFile
+	if file.compressed {
+		gzReader, err := gzip.NewReader(osFile)
+		if err != nil {
+			return err
+		}
+		defer gzReader.Close()
+		reader = gzReader
+	}
+
+	checkTime := !opts.Since.IsZero() || !opts.Until.IsZero()
+	var lineTime time.Time
+	scanner := bufio.NewScanner(reader)
+	scanner.Buffer(make([]byte, 0, readBufSize), maxLineSize)
+	for scanner.Scan() {
+		line := scanner.Bytes()
+		if checkTime {
+			if len(line) > 0 && line[0] >= '0' && line[0] <= '9' {
+				// The time is at the beginning of the line.
+				timePrefix := line
+				if len(timePrefix) > 32 {
+					timePrefix = timePrefix[:32]
+				}
+				if parsedTime, ok := parseLogTime(string(timePrefix)); ok {
+					lineTime = parsedTime
+				}
+			}
+			if !opts.Until.IsZero() && lineTime.After(opts.Until) {
+				// The log lines are written in the time order.
+				break
+			}
+			if !opts.Since.IsZero() && lineTime.Before(opts.Since) {
+				continue
+			}
+		}
+		if opts.Pattern.Match(line) {
+			matches <- file.instance + ": " + string(line)
+		}
+	}
+	return scanner.Err()
+}
+
+// Grep searches the pattern in the current and rotated logs of the
+// instances. The files are searched in parallel, the files out of the
+// time range are skipped. The matching lines are written as they are
+// found, so the lines of different files could be interleaved.
+func Grep(instances []running.InstanceCtx, opts GrepOpts, writer io.Writer) error {
+	files := []grepFile{}
+	for _, run := range instances {
+		instFiles, err := getGrepFiles(running.GetAppInstanceName(run), run.Log)
+		if err != nil {
+			return fmt.Errorf("failed to get the logs of %s: %s",
+				running.GetAppInstanceName(run), err)
+		}
+		for _, file := range instFiles {
+			if file.isInRange(&opts) {
+				files = append(files, file)
+			}
+		}
+	}
+
+	jobs := opts.Jobs
+	if jobs < 1 {
+		jobs = runtime.NumCPU()
+	}
+	if jobs > len(files) {
+		jobs = len(files)
+	}
+
+	filesCh := make(chan *grepFile)
+	matches := make(chan string, 1024)
+	errs := []string{}
+	var errsMutex sync.Mutex
+	var wg sync.WaitGroup
+	for i := 0; i < jobs; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for file := range filesCh {
+				if err := file.grep(&opts, matches); err != nil {
+					errsMutex.Lock()
+					errs = append(errs, fmt.Sprintf("%s: %s", file.path, err))
+					errsMutex.Unlock()
+				}
+			}
+		}()
+	}
+	go func() {
+		for i := range files {
+			filesCh <- &files[i]
+		}
+		close(filesCh)
+		wg.Wait()
+		close(matches)
+	}()
+
+	bufWriter := bufio.NewWriter(writer)
+	var writeErr error
+	for match := range matches {
+		if writeErr != nil {
+			// Drain the channel to let the workers finish.
+			continue
+		}
+		_, writeErr = bufWriter.WriteString(match + "\n")
+		if writeErr == nil && len(matches) == 0 {
+			// Flush the found lines while the next ones are searched.
+			writeErr = bufWriter.Flush()
+		}
+	}
+	if writeErr == nil {
+		writeErr = bufWriter.Flush()
+	}
+	if writeErr != nil {
+		return writeErr
+	}
+
+	if len(errs) > 0 {
+		return fmt.Errorf("failed to search in the logs:\n%s", strings.Join(errs, "\n"))
+	}
+	return nil
+}
@@ -0,0 +1,107 @@
+package tail
+
+import (
+	"bytes"
+	"compress/gzip"
+	"os"
+	"path/filepath"
+	"regexp"
+	"sort"
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+// rotatedLogName returns the name of the log rotated at the time.
+func rotatedLogName(path string, rotationTime time.Time) string {
+	ext := filepath.Ext(path)
+	return strings.TrimSuffix(path, ext) + "-" + rotationTime.Format("2006-01-02T15-04-05.000") +
+		ext
+}
+
+// writeGzipLog writes the compressed log file.
+func writeGzipLog(t *testing.T, path string, data string) {
+	file, err := os.Create(path)
+	require.NoError(t, err)
+	defer file.Close()
+	writer := gzip.NewWriter(file)
+	_, err = writer.Write([]byte(data))
+	require.NoError(t, err)
+	require.NoError(t, writer.Close())
+}
+
+func TestParseTimeBound(t *testing.T) {
+	now := time.Date(2023, 3, 27, 12, 0, 0, 0, time.Local)
+
+	bound, err := ParseTimeBound("", now)
+	require.NoError(t, err)
+	assert.True(t, bound.IsZero())
+
+	bound, err = ParseTimeBound("1h30m", now)
+	require.NoError(t, err)
+	assert.Equal(t, time.Date(2023, 3, 27, 10, 30, 0, 0, time.Local), bound)
+
+	bound, err = ParseTimeBound("2023-03-26 10:00:00", now)
+	require.NoError(t, err)
+	assert.Equal(t, time.Date(2023, 3, 26, 10, 0, 0, 0, time.Local), bound)
+
+	_, err = ParseTimeBound("yesterday", now)
+	assert.Error(t, err)
+}
+
+func TestGrepFiles(t *testing.T) {
+	dir := t.TempDir()
+	path := filepath.Join(dir, "inst.log")
+	day := func(d int) time.Time { return time.Date(2023, 3, d, 0, 0, 0, 0, time.Local) }
+
+	// The oldest rotated log is out of the time range and is not read.
+	require.NoError(t, os.WriteFile(rotatedLogName(path, day(2)), []byte("garbage"), 0644))
+	writeGzipLog(t, rotatedLogName(path, day(3))+".gz",
+		"2023-03-02 10:00:00.000 error: too old\n"+
+			"2023-03-02 12:00:00.000 error: compressed\n"+
+			"stack traceback: error\n")
+	require.NoError(t, os.WriteFile(path, []byte(
+		"2023-03-03 10:00:00.000 error: current\n"+
+			"2023-03-03 11:00:00.000 info: current\n"+
+			"2023-03-04 10:00:00.000 error: too new\n"), 0644))
+
+	files, err := getGrepFiles("app:inst", path)
+	require.NoError(t, err)
+	require.Len(t, files, 3)
+	assert.Equal(t, path, files[0].path)
+	assert.Equal(t, day(3), files[0].from)
+	assert.True(t, files[1].compressed)
+	assert.Equal(t, day(2), files[1].from)
+	assert.Equal(t, day(3), files[1].to)
+	assert.True(t, files[2].from.IsZero())
+
+	opts := GrepOpts{
+		Pattern: regexp.MustCompile("error"),
+		Since:   time.Date(2023, 3, 2, 11, 0, 0, 0, time.Local),
+		Until:   time.Date(2023, 3, 3, 12, 0, 0, 0, time.Local),
+		Jobs:    2,
+	}
+	assert.False(t, files[2].isInRange(&opts))
+
+	var out bytes.Buffer
+	for i := range files {
+		if files[i].isInRange(&opts) {
+			matches := make(chan string, 10)
+			require.NoError(t, files[i].grep(&opts, matches))
+			close(matches)
+			for match := range matches {
+				out.WriteString(match + "\n")
+			}
+		}
+	}
+	lines := strings.Split(strings.TrimSpace(out.String()), "\n")
+	sort.Strings(lines)
+	assert.Equal(t, []string{
+		"app:inst: 2023-03-02 12:00:00.000 error: compressed",
+		"app:inst: 2023-03-03 10:00:00.000 error: current",
+		"app:inst: stack traceback: error",
+	}, lines)
+}
@@ -0,0 +1,316 @@
+package tail
+
+import (
+	"bytes"
+	"fmt"
+	"io"
+	"os"
+	"os/signal"
+	"sort"
+	"syscall"
+	"time"
+
+	"github.com/tarantool/tt/cli/running"
+	"github.com/tarantool/tt/cli/util"
+)
+
+// Time formats of the log lines: tarantool and the watchdog ones.
+var logTimeFormats = []string{
+	"2006-01-02 15:04:05.000",
+	"2006/01/02 15:04:05",
+}
+
+const (
+	// readBufSize is the size of the buffer used to read the new data of logs.
+	readBufSize = 64 * 1024
+	// watchTimeout is the maximum time of waiting for the logs changes, the
+	// command interruption is checked with this period.
+	watchTimeout = 200 * time.Millisecond
+)
+
+// TailOpts describes the options of the log command.
+type TailOpts struct {
+	// Lines is the number of the last lines of each log to print.
+	Lines int
+	// Follow enables printing of the data appended to the logs.
+	Follow bool
+}
+
+// LogLine is a line of an instance log.
+type LogLine struct {
+	// Instance is the full name of the instance.
+	Instance string
+	// Text is the line without the trailing new line.
+	Text string
+	// Time is the time of the line. The lines without a timestamp get
+	// the time of the previous line.
+	Time time.Time
+}
+
+// logFile is a followed log file of an instance.
+type logFile struct {
+	// instance is the full name of the instance.
+	instance string
+	// path is the path to the log file.
+	path string
+	// file is the opened log file, it is nil if the file does not exist.
+	file *os.File
+	// partial is the last line that has not been terminated yet.
+	partial []byte
+	// buf is the buffer of the file reads, it is allocated on the first read.
+	buf []byte
+	// lastTime is the time of the last read line.
+	lastTime time.Time
+}
+
+// parseLogTime returns the timestamp the log line starts with.
+func parseLogTime(line string) (time.Time, bool) {
+	for _, format := range logTimeFormats {
+		if len(line) < len(format) {
+			continue
+		}
+		if lineTime, err := time.ParseInLocation(format, line[:len(format)],
+			time.Local); err == nil {
+			return lineTime, true
+		}
+	}
+	return time.Time{}, false
+}
+
+// newLogFile opens the log file at the beginning of the last lines.
+func newLogFile(instance string, path string, lines int) (*logFile, error) {
+	lf := &logFile{instance: instance, path: path}
+	file, err := os.Open(path)
+	if err != nil {
+		if os.IsNotExist(err) {
+			// The file could be created later.
+			return lf, nil
+		}
+		return nil, err
+	}
+
+	if lines <= 0 {
+		_, err = file.Seek(0, io.SeekEnd)
+	} else {
+		var pos int64
+		if pos, err = util.GetLastNLinesBegin(path, lines); err == nil {
+			_, err = file.Seek(pos, io.SeekStart)
+		}
+	}
+	if err != nil {
+		file.Close()
+		return nil, fmt.Errorf("failed to read the log of %s: %s", instance, err)
+	}
+	lf.file = file
+	return lf, nil
+}
+
+// readLines reads the complete lines appended to the file since the last read.
+func (lf *logFile) readLines() ([]LogLine, error) {
+	lines := []LogLine{}
+	if lf.file == nil {
+		return lines, nil
+	}
+
+	if lf.buf == nil {
+		lf.buf = make([]byte, readBufSize)
+	}
+	for {
+		n, err := lf.file.Read(lf.buf)
+		data := lf.buf[:n]
+		for len(data) > 0 {
+			newLinePos := bytes.IndexByte(data, '\n')
+			if newLinePos < 0 {
+				lf.partial = append(lf.partial, data...)
+				break
+			}
+			text := string(append(lf.partial, data[:newLinePos]...))
+			lf.partial = lf.partial[:0]
+			data = data[newLinePos+1:]
+
+			if lineTime, ok := parseLogTime(text); ok {
+				lf.lastTime = lineTime
+			}
+			lines = append(lines, LogLine{Instance: lf.instance, Text: text, Time: lf.lastTime})
+		}
+		if err == io.EOF {
+			return lines, nil
+		} else if err != nil {
+			return lines, err
+		}
+	}
+}
+
+// reopenIfRotated reopens the log file if it has been renamed, removed
+// or truncated. The rest of the old file should be read before the call.
+func (lf *logFile) reopenIfRotated() error {
+	pathInfo, err := os.Stat(lf.path)
+	if err != nil {
+		if os.IsNotExist(err) {
+			return nil
+		}
+		return err
+	}
+
+	if lf.file != nil {
+		fileInfo, err := lf.file.Stat()
+		if err != nil {
+			return err
+		}
+		offset, err := lf.file.Seek(0, io.SeekCurrent)
+		if err != nil {
+			return err
+		}
+		if os.SameFile(fileInfo, pathInfo) {
+			if pathInfo.Size() >= offset {
+				return nil
+			}
+			// The file has been truncated.
+			_, err = lf.file.Seek(0, io.SeekStart)
+			return err
+		}
+		lf.file.Close()
+		lf.file = nil
+	}
+
+	lf.file, err = os.Open(lf.path)
+	if os.IsNotExist(err) {
+		return nil
+	}
+	lf.partial = lf.partial[:0]
+	return err
+}
+
+// read reads the new lines of the log file following the rotations.
+func (lf *logFile) read() ([]LogLine, error) {
+	lines, err := lf.readLines()
+	if err != nil {
+		return lines, err
+	}
+	if err = lf.reopenIfRotated(); err != nil {
+		return lines, err
+	}
+	newLines, err := lf.readLines()
+	return append(lines, newLines...), err
+}
+
+// close closes the log file.
+func (lf *logFile) close() {
+	if lf.file != nil {
+		lf.file.Close()
+	}
+}
+
+// sortLines sorts the lines of different logs by time. The order of the
+// lines with the same time is preserved.
+func sortLines(lines []LogLine) {
+	sort.SliceStable(lines, func(i, j int) bool {
+		return lines[i].Time.Before(lines[j].Time)
+	})
+}
+
+// printLines prints the lines prefixed with the instance names.
+func printLines(writer io.Writer, lines []LogLine) error {
+	for _, line := range lines {
+		if _, err := fmt.Fprintf(writer, "%s: %s\n", line.Instance, line.Text); err != nil {
+			return err
+		}
+	}
+	return nil
+}
+
+// readAll reads the new lines of all the logs and prints them in the
+// timestamp order.
+func readAll(writer io.Writer, logFiles []*logFile) error {
+	lines := []LogLine{}
+	for _, lf := range logFiles {
+		newLines, err := lf.read()
+		if err != nil {
+			return fmt.Errorf("failed to read the log of %s: %s", lf.instance, err)
+		}
+		lines = append(lines, newLines...)
+	}
+	sortLines(lines)
+	return printLines(writer, lines)
+}
+
+// Run prints the last lines of the instances logs merged by timestamp.
+// If the follow option is set, the data appended to the logs is printed
+// until the command is interrupted.
+func Run(instances []running.InstanceCtx, opts TailOpts, writer io.Writer) error {
+	logFiles := make([]*logFile, 0, len(instances))
+	defer func() {
+		for _, lf := range logFiles {
+			lf.close()
+		}
+	}()
+	for _, run := range instances {
+		lf, err := newLogFile(running.GetAppInstanceName(run), run.Log, opts.Lines)
+		if err != nil {
+			return err
+		}
+		logFiles = append(logFiles, lf)
+	}
+
+	if err := readAll(writer, logFiles); err != nil || !opts.Follow {
+		return err
+	}
+
+	paths := make([]string, 0, len(logFiles))
+	for _, lf := range logFiles {
+		paths = append(paths, lf.path)
+	}
+	watcher, err := newWatcher(paths)
+	if err != nil {
+		return err
+	}
+	defer watcher.close()
+
+	sigChan := make(chan os.Signal, 1)
+	signal.Notify(sigChan, syscall.SIGINT, syscall.SIGTERM)
+	defer signal.Stop(sigChan)
+	return follow(writer, logFiles, watcher, sigChan)
+}
+
+// follow prints the lines appended to the logs until stop is signalled.
+func follow(writer io.Writer, logFiles []*logFile, watcher watcher,
+	stop <-chan os.Signal) error {
+	for {
+		select {
+		case <-stop:
+			return nil
+		default:
+		}
+
+		changed, err := watcher.wait()
+		if err != nil {
+			return err
+		}
+		if changed {
+			if err = readAll(writer, logFiles); err != nil {
+				return err
+			}
+		}
+	}
+}
+
+// watcher waits for changes of the log files.
+type watcher interface {
+	// wait waits for changes of the log files. It returns false if
+	// there are no changes during watchTimeout.
+	wait() (bool, error)
+	// close releases the watcher resources.
+	close()
+}
+
+// pollWatcher reports possible changes of the logs every watchTimeout.
+type pollWatcher struct{}
+
+// wait sleeps for watchTimeout, the logs are checked after each sleep.
+func (pollWatcher) wait() (bool, error) {
+	time.Sleep(watchTimeout)
+	return true, nil
+}
+
+// close does nothing.
+func (pollWatcher) close() {}
@@ -0,0 +1,142 @@
+package tail
+
+import (
+	"bytes"
+	"os"
+	"path/filepath"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+// appendLog appends the data to the log file.
+func appendLog(t *testing.T, path string, data string) {
+	file, err := os.OpenFile(path, os.O_WRONLY|os.O_CREATE|os.O_APPEND, 0644)
+	require.NoError(t, err)
+	defer file.Close()
+	_, err = file.WriteString(data)
+	require.NoError(t, err)
+}
+
+// syncBuffer is a buffer safe for concurrent writes and reads.
+type syncBuffer struct {
+	mutex sync.Mutex
+	buf   bytes.Buffer
+}
+
+// Write appends the data to the buffer.
+func (sb *syncBuffer) Write(data []byte) (int, error) {
+	sb.mutex.Lock()
+	defer sb.mutex.Unlock()
+	return sb.buf.Write(data)
+}
+
+// String returns the buffer content.
+func (sb *syncBuffer) String() string {
+	sb.mutex.Lock()
+	defer sb.mutex.Unlock()
+	return sb.buf.String()
+}
+
+func TestParseLogTime(t *testing.T) {
+	lineTime, ok := parseLogTime("2023-03-27 12:34:56.789 [1] main/103/interactive I> ready")
+	require.True(t, ok)
+	assert.Equal(t, time.Date(2023, 3, 27, 12, 34, 56, 789000000, time.Local), lineTime)
+
+	lineTime, ok = parseLogTime("2023/03/27 12:34:57 (INFO): started")
+	require.True(t, ok)
+	assert.Equal(t, time.Date(2023, 3, 27, 12, 34, 57, 0, time.Local), lineTime)
+
+	_, ok = parseLogTime("stack traceback:")
+	assert.False(t, ok)
+}
+
+func TestReadAllMerge(t *testing.T) {
+	dir := t.TempDir()
+	firstPath := filepath.Join(dir, "first.log")
+	secondPath := filepath.Join(dir, "second.log")
+	appendLog(t, firstPath, "2023-03-27 12:00:00.000 skipped\n"+
+		"2023-03-27 12:00:01.000 first 1\n"+
+		"continuation\n"+
+		"2023-03-27 12:00:04.000 first 2\n")
+	appendLog(t, secondPath, "2023-03-27 12:00:02.000 second 1\n"+
+		"2023-03-27 12:00:03.000 second 2\n")
+
+	first, err := newLogFile("app:first", firstPath, 3)
+	require.NoError(t, err)
+	defer first.close()
+	second, err := newLogFile("app:second", secondPath, 3)
+	require.NoError(t, err)
+	defer second.close()
+	missing, err := newLogFile("app:missing", filepath.Join(dir, "missing.log"), 3)
+	require.NoError(t, err)
+	defer missing.close()
+
+	logFiles := []*logFile{first, second, missing}
+	var out bytes.Buffer
+	require.NoError(t, readAll(&out, logFiles))
+	assert.Equal(t, "app:first: 2023-03-27 12:00:01.000 first 1\n"+
+		"app:first: continuation\n"+
+		"app:second: 2023-03-27 12:00:02.000 second 1\n"+
+		"app:second: 2023-03-27 12:00:03.000 second 2\n"+
+		"app:first: 2023-03-27 12:00:04.000 first 2\n", out.String())
+
+	// A partial line is printed once it is terminated.
+	out.Reset()
+	appendLog(t, secondPath, "2023-03-27 12:00:05.000 sec")
+	require.NoError(t, readAll(&out, logFiles))
+	assert.Equal(t, "", out.String())
+	appendLog(t, secondPath, "ond 3\n")
+	require.NoError(t, readAll(&out, logFiles))
+	assert.Equal(t, "app:second: 2023-03-27 12:00:05.000 second 3\n", out.String())
+
+	// The rest of the rotated file and the new file are read.
+	out.Reset()
+	appendLog(t, firstPath, "2023-03-27 12:00:06.000 first 3\n")
+	require.NoError(t, os.Rename(firstPath, firstPath+".1"))
+	appendLog(t, firstPath, "2023-03-27 12:00:07.000 first 4\n")
+	appendLog(t, filepath.Join(dir, "missing.log"), "2023-03-27 12:00:08.000 created\n")
+	require.NoError(t, readAll(&out, logFiles))
+	assert.Equal(t, "app:first: 2023-03-27 12:00:06.000 first 3\n"+
+		"app:first: 2023-03-27 12:00:07.000 first 4\n"+
+		"app:missing: 2023-03-27 12:00:08.000 created\n", out.String())
+
+	// A truncated file is read from the beginning.
+	out.Reset()
+	require.NoError(t, os.Truncate(secondPath, 0))
+	appendLog(t, secondPath, "truncated\n")
+	require.NoError(t, readAll(&out, logFiles))
+	assert.Equal(t, "app:second: truncated\n", out.String())
+}
+
+func TestFollow(t *testing.T) {
+	dir := t.TempDir()
+	path := filepath.Join(dir, "inst.log")
+	appendLog(t, path, "old\n")
+
+	inst, err := newLogFile("app:inst", path, 0)
+	require.NoError(t, err)
+	defer inst.close()
+
+	watcher, err := newWatcher([]string{path})
+	require.NoError(t, err)
+	defer watcher.close()
+
+	stop := make(chan os.Signal, 1)
+	var out syncBuffer
+	done := make(chan error, 1)
+	go func() {
+		done <- follow(&out, []*logFile{inst}, watcher, stop)
+	}()
+
+	appendLog(t, path, "new\n")
+	assert.Eventually(t, func() bool {
+		return out.String() == "app:inst: new\n"
+	}, 5*time.Second, 10*time.Millisecond)
+	stop <- os.Interrupt
+	require.NoError(t, <-done)
+	assert.Equal(t, "app:inst: new\n", out.String())
+}
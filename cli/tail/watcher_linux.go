@@ -0,0 +1,98 @@
+//go:build linux
+
+package tail
+
+import (
+	"path/filepath"
+	"unsafe"
+
+	"golang.org/x/sys/unix"
+)
+
+// inotifyMask is the mask of the directory events that could change the
+// logs: writes, truncation and rotation.
+const inotifyMask = unix.IN_MODIFY | unix.IN_CREATE | unix.IN_MOVED_TO | unix.IN_MOVED_FROM |
+	unix.IN_DELETE | unix.IN_ATTRIB
+
+// inotifyWatcher waits for the logs changes using inotify. The log
+// directories are watched, so the log rotations are noticed too.
+type inotifyWatcher struct {
+	// fd is the inotify file descriptor.
+	fd int
+	// names are the base names of the log files by the watch descriptors
+	// of their directories.
+	names map[int]map[string]bool
+}
+
+// newWatcher creates an inotify watcher for the log files. If inotify
+// could not be used, the logs are polled.
+func newWatcher(paths []string) (watcher, error) {
+	fd, err := unix.InotifyInit1(unix.IN_CLOEXEC | unix.IN_NONBLOCK)
+	if err != nil {
+		return pollWatcher{}, nil
+	}
+
+	watcher := &inotifyWatcher{fd: fd, names: map[int]map[string]bool{}}
+	for _, path := range paths {
+		wd, err := unix.InotifyAddWatch(fd, filepath.Dir(path), inotifyMask)
+		if err != nil {
+			// The log directory does not exist yet.
+			watcher.close()
+			return pollWatcher{}, nil
+		}
+		if watcher.names[wd] == nil {
+			watcher.names[wd] = map[string]bool{}
+		}
+		watcher.names[wd][filepath.Base(path)] = true
+	}
+	return watcher, nil
+}
+
+// wait waits for an event of a log file.
+func (watcher *inotifyWatcher) wait() (bool, error) {
+	fds := []unix.PollFd{{Fd: int32(watcher.fd), Events: unix.POLLIN}}
+	if _, err := unix.Poll(fds, int(watchTimeout.Milliseconds())); err != nil &&
+		err != unix.EINTR {
+		return false, err
+	}
+
+	changed := false
+	buf := make([]byte, 64*(unix.SizeofInotifyEvent+unix.NAME_MAX+1))
+	for {
+		n, err := unix.Read(watcher.fd, buf)
+		if err == unix.EAGAIN || err == unix.EINTR {
+			return changed, nil
+		} else if err != nil {
+			return changed, err
+		} else if n <= 0 {
+			return changed, nil
+		}
+
+		for offset := 0; offset+unix.SizeofInotifyEvent <= n; {
+			event := (*unix.InotifyEvent)(unsafe.Pointer(&buf[offset]))
+			nameStart := offset + unix.SizeofInotifyEvent
+			nameBytes := buf[nameStart : nameStart+int(event.Len)]
+			offset = nameStart + int(event.Len)
+
+			if event.Mask&unix.IN_Q_OVERFLOW != 0 {
+				changed = true
+				continue
+			}
+			name := string(nameBytes)
+			for i := 0; i < len(nameBytes); i++ {
+				if nameBytes[i] == 0 {
+					name = string(nameBytes[:i])
+					break
+				}
+			}
+			if watcher.names[int(event.Wd)][name] {
+				changed = true
+			}
+		}
+	}
+}
+
+// close closes the inotify file descriptor.
+func (watcher *inotifyWatcher) close() {
+	unix.Close(watcher.fd)
+}
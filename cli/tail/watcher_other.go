@@ -0,0 +1,8 @@
+//go:build !linux
+
+package tail
+
+// newWatcher creates a watcher for the log files. The logs are polled.
+func newWatcher(paths []string) (watcher, error) {
+	return pollWatcher{}, nil
+}
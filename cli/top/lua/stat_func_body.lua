@@ -0,0 +1,20 @@
+-- The instance is not configured yet.
+if type(box.cfg) == 'function' then
+    return nil
+end
+
+local stat = box.stat()
+local requests = 0
+for _, name in ipairs({'SELECT', 'INSERT', 'REPLACE', 'UPDATE', 'UPSERT',
+                       'DELETE', 'CALL', 'EVAL', 'EXECUTE'}) do
+    if stat[name] ~= nil then
+        requests = requests + stat[name].total
+    end
+end
+
+local slab = box.slab.info()
+return {
+    requests = requests,
+    arena_used = slab.arena_used,
+    arena_size = slab.arena_size,
+}
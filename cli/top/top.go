@@ -0,0 +1,292 @@
+package top
+
+import (
+	"fmt"
+	"io"
+	"os"
+	"os/signal"
+	"sort"
+	"sync"
+	"syscall"
+	"text/tabwriter"
+	"time"
+
+	"github.com/mattn/go-isatty"
+	"github.com/tarantool/tt/cli/connector"
+	"github.com/tarantool/tt/cli/running"
+)
+
+const (
+	// clearScreen is the escape sequence to clear a terminal screen.
+	clearScreen = "\033[H\033[2J"
+	// requestTimeout is the timeout of the statistics request.
+	requestTimeout = 3 * time.Second
+)
+
+// Sort orders of the instances.
+const (
+	SortByName = "name"
+	SortByCPU  = "cpu"
+	SortByRSS  = "rss"
+	SortByRPS  = "rps"
+)
+
+// TopOpts describes the options of the dashboard.
+type TopOpts struct {
+	// Interval is the refresh interval.
+	Interval time.Duration
+	// Iterations is the number of refreshes, zero means no limit.
+	Iterations int
+	// SortBy is the column to sort the instances by.
+	SortBy string
+}
+
+// InstanceStat is the resource usage of the instance for the last interval.
+type InstanceStat struct {
+	// Name is the full name of the instance.
+	Name string
+	// TarantoolPID is the PID of the tarantool process.
+	TarantoolPID int
+	// CPU is the CPU usage in percents of one core.
+	CPU float64
+	// RSS is the resident set size in bytes.
+	RSS int64
+	// RPS is the number of requests per second from box.stat().
+	RPS float64
+	// ArenaUsed is the used memtx arena memory in bytes.
+	ArenaUsed int64
+	// ArenaSize is the memtx arena size in bytes.
+	ArenaSize int64
+	// Ready is true if the statistics of the instance have been collected
+	// at least twice, so the rates are known.
+	Ready bool
+	// Err is the error of the statistics collection.
+	Err error
+}
+
+// boxStat is the result of the statistics request.
+type boxStat struct {
+	Requests  uint64 `msgpack:"requests"`
+	ArenaUsed int64  `msgpack:"arena_used"`
+	ArenaSize int64  `msgpack:"arena_size"`
+}
+
+// sample is the instance statistics at the moment.
+type sample struct {
+	time    time.Time
+	pid     int
+	cpuTime time.Duration
+	stat    *boxStat
+}
+
+// collector collects the statistics of the instance over a persistent
+// connection.
+type collector struct {
+	run  *running.InstanceCtx
+	conn connector.Connector
+	// prev is the previous sample to calculate rates.
+	prev *sample
+}
+
+// requestBoxStat requests the box statistics of the instance. The connection
+// is established on the first request and kept for the next ones.
+func (c *collector) requestBoxStat() (*boxStat, error) {
+	if c.conn == nil {
+		conn, err := connector.Connect(connector.ConnectOpts{
+			Network: connector.UnixNetwork,
+			Address: c.run.ConsoleSocket,
+		})
+		if err != nil {
+			return nil, err
+		}
+		c.conn = conn
+	}
+
+	var res []*boxStat
+	_, err := c.conn.Eval(statFuncBody, []interface{}{},
+		connector.RequestOpts{ReadTimeout: requestTimeout, ResData: &res})
+	if err != nil {
+		// Reconnect on the next request.
+		c.close()
+		return nil, err
+	}
+	if len(res) == 0 {
+		return nil, nil
+	}
+	return res[0], nil
+}
+
+// collect collects the statistics of the instance and calculates the rates
+// since the previous collection.
+func (c *collector) collect() InstanceStat {
+	stat := InstanceStat{Name: running.GetAppInstanceName(*c.run)}
+
+	status := running.GetInstanceStatus(c.run)
+	if status.TarantoolPID == 0 {
+		c.prev = nil
+		c.close()
+		stat.Err = fmt.Errorf("the instance is not running")
+		return stat
+	}
+	stat.TarantoolPID = status.TarantoolPID
+	stat.RSS = status.RSS
+
+	cur := sample{time: time.Now(), pid: status.TarantoolPID, cpuTime: status.CPUTime}
+	cur.stat, stat.Err = c.requestBoxStat()
+	if cur.stat != nil {
+		stat.ArenaUsed = cur.stat.ArenaUsed
+		stat.ArenaSize = cur.stat.ArenaSize
+	}
+
+	prev := c.prev
+	c.prev = &cur
+	// The rates are unknown for the first sample and after the restart.
+	if prev == nil || prev.pid != cur.pid {
+		return stat
+	}
+
+	elapsed := cur.time.Sub(prev.time).Seconds()
+	if elapsed <= 0 {
+		return stat
+	}
+	stat.Ready = true
+	stat.CPU = (cur.cpuTime - prev.cpuTime).Seconds() / elapsed * 100
+	if cur.stat != nil && prev.stat != nil && cur.stat.Requests >= prev.stat.Requests {
+		stat.RPS = float64(cur.stat.Requests-prev.stat.Requests) / elapsed
+	}
+
+	return stat
+}
+
+// close closes the connection to the instance.
+func (c *collector) close() {
+	if c.conn != nil {
+		c.conn.Close()
+		c.conn = nil
+	}
+}
+
+// collectAll collects the statistics of all the instances concurrently.
+func collectAll(collectors []*collector) []InstanceStat {
+	stats := make([]InstanceStat, len(collectors))
+
+	var wg sync.WaitGroup
+	for i := range collectors {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			stats[i] = collectors[i].collect()
+		}(i)
+	}
+	wg.Wait()
+
+	return stats
+}
+
+// sortStats sorts the instances statistics in the order.
+func sortStats(stats []InstanceStat, sortBy string) {
+	sort.SliceStable(stats, func(i, j int) bool {
+		switch sortBy {
+		case SortByCPU:
+			return stats[i].CPU > stats[j].CPU
+		case SortByRSS:
+			return stats[i].RSS > stats[j].RSS
+		case SortByRPS:
+			return stats[i].RPS > stats[j].RPS
+		default:
+			return stats[i].Name < stats[j].Name
+		}
+	})
+}
+
+// formatBytes formats the size in bytes in MiB.
+func formatBytes(size int64) string {
+	return fmt.Sprintf("%.1fMiB", float64(size)/(1024*1024))
+}
+
+// printStats prints the instances statistics as a table.
+func printStats(writer io.Writer, stats []InstanceStat) error {
+	table := tabwriter.NewWriter(writer, 0, 0, 2, ' ', 0)
+	fmt.Fprintln(table, "INSTANCE\tPID\tCPU%\tRSS\tRPS\tARENA USED\tARENA SIZE\tERROR")
+	for _, stat := range stats {
+		pid, cpu, rss, rps := "-", "-", "-", "-"
+		arenaUsed, arenaSize, errText := "-", "-", ""
+		if stat.TarantoolPID != 0 {
+			pid = fmt.Sprint(stat.TarantoolPID)
+			rss = formatBytes(stat.RSS)
+		}
+		if stat.Ready {
+			cpu = fmt.Sprintf("%.1f", stat.CPU)
+			if stat.Err == nil {
+				rps = fmt.Sprintf("%.1f", stat.RPS)
+			}
+		}
+		if stat.ArenaSize != 0 {
+			arenaUsed = formatBytes(stat.ArenaUsed)
+			arenaSize = formatBytes(stat.ArenaSize)
+		}
+		if stat.Err != nil {
+			errText = stat.Err.Error()
+		}
+		fmt.Fprintf(table, "%s\t%s\t%s\t%s\t%s\t%s\t%s\t%s\n", stat.Name, pid, cpu, rss,
+			rps, arenaUsed, arenaSize, errText)
+	}
+	return table.Flush()
+}
+
+// Run shows the resource usage of the instances refreshed with the interval
+// until the iterations are done or the process is interrupted.
+func Run(instances []running.InstanceCtx, opts TopOpts) error {
+	if opts.Interval <= 0 {
+		return fmt.Errorf("the refresh interval must be positive")
+	}
+	switch opts.SortBy {
+	case SortByName, SortByCPU, SortByRSS, SortByRPS:
+	default:
+		return fmt.Errorf("unknown sort order: %s", opts.SortBy)
+	}
+
+	collectors := make([]*collector, len(instances))
+	for i := range instances {
+		collectors[i] = &collector{run: &instances[i]}
+	}
+	defer func() {
+		for _, c := range collectors {
+			c.close()
+		}
+	}()
+
+	sigChan := make(chan os.Signal, 1)
+	signal.Notify(sigChan, syscall.SIGINT, syscall.SIGTERM)
+	defer signal.Stop(sigChan)
+
+	isTerminal := isatty.IsTerminal(os.Stdout.Fd())
+	ticker := time.NewTicker(opts.Interval)
+	defer ticker.Stop()
+
+	// The first collection is used as a base for the rates.
+	collectAll(collectors)
+	for iteration := 0; opts.Iterations == 0 || iteration < opts.Iterations; iteration++ {
+		select {
+		case <-sigChan:
+			return nil
+		case <-ticker.C:
+		}
+
+		stats := collectAll(collectors)
+		sortStats(stats, opts.SortBy)
+		if isTerminal {
+			fmt.Print(clearScreen)
+		}
+		fmt.Printf("tt top - %s, refresh interval %s\n\n",
+			time.Now().Format("15:04:05"), opts.Interval)
+		if err := printStats(os.Stdout, stats); err != nil {
+			return err
+		}
+		if !isTerminal {
+			fmt.Println()
+		}
+	}
+
+	return nil
+}
@@ -0,0 +1,52 @@
+package top
+
+import (
+	"bytes"
+	"fmt"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestSortStats(t *testing.T) {
+	stats := []InstanceStat{
+		{Name: "app:b", CPU: 10, RSS: 100, RPS: 3},
+		{Name: "app:a", CPU: 30, RSS: 50, RPS: 1},
+		{Name: "app:c", CPU: 20, RSS: 300, RPS: 2},
+	}
+
+	getNames := func() []string {
+		names := []string{}
+		for _, stat := range stats {
+			names = append(names, stat.Name)
+		}
+		return names
+	}
+
+	sortStats(stats, SortByName)
+	assert.Equal(t, []string{"app:a", "app:b", "app:c"}, getNames())
+	sortStats(stats, SortByCPU)
+	assert.Equal(t, []string{"app:a", "app:c", "app:b"}, getNames())
+	sortStats(stats, SortByRSS)
+	assert.Equal(t, []string{"app:c", "app:b", "app:a"}, getNames())
+	sortStats(stats, SortByRPS)
+	assert.Equal(t, []string{"app:b", "app:c", "app:a"}, getNames())
+}
+
+func TestPrintStats(t *testing.T) {
+	stats := []InstanceStat{
+		{Name: "app:master", TarantoolPID: 42, CPU: 12.34, RSS: 64 * 1024 * 1024, RPS: 100,
+			ArenaUsed: 1024 * 1024, ArenaSize: 256 * 1024 * 1024, Ready: true},
+		{Name: "app:replica", Err: fmt.Errorf("the instance is not running")},
+	}
+
+	buf := bytes.Buffer{}
+	require.NoError(t, printStats(&buf, stats))
+	assert.Equal(t,
+		"INSTANCE     PID  CPU%  RSS      RPS    ARENA USED  ARENA SIZE  ERROR\n"+
+			"app:master   42   12.3  64.0MiB  100.0  1.0MiB      256.0MiB    \n"+
+			"app:replica  -    -     -        -      -           -           "+
+			"the instance is not running\n",
+		buf.String())
+}
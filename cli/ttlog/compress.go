@@ -0,0 +1,234 @@
+package ttlog
+
+import (
+	"compress/gzip"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"runtime"
+	"sort"
+	"strings"
+	"sync"
+	"time"
+)
+
+const (
+	// CompressNone disables compression of the rotated log files.
+	CompressNone = ""
+	// CompressGzip enables gzip compression of the rotated log files.
+	CompressGzip = "gzip"
+	// compressedExt is the extension of the compressed log files.
+	// It is the same as lumberjack uses.
+	compressedExt = ".gz"
+)
+
+// CompressOpts describes the options of the rotated log files compression.
+type CompressOpts struct {
+	// Codec is the compression codec.
+	Codec string
+	// Level is the compression level, zero means the codec default.
+	Level int
+	// Jobs is the maximum number of files compressed in parallel.
+	Jobs int
+}
+
+// Backup describes a rotated log file.
+type Backup struct {
+	// Path is the path to the file.
+	Path string
+	// RotationTime is the time of the rotation encoded in the file name.
+	RotationTime time.Time
+	// Size is the size of the file in bytes.
+	Size int64
+	// Compressed is true if the file is compressed.
+	Compressed bool
+}
+
+// ValidateCompressOpts checks the compression options.
+func ValidateCompressOpts(opts CompressOpts) error {
+	switch opts.Codec {
+	case CompressNone:
+		return nil
+	case CompressGzip:
+		if opts.Level != 0 &&
+			(opts.Level < gzip.BestSpeed || opts.Level > gzip.BestCompression) {
+			return fmt.Errorf("invalid gzip compression level %d, it must be in range %d-%d",
+				opts.Level, gzip.BestSpeed, gzip.BestCompression)
+		}
+		return nil
+	}
+	return fmt.Errorf("unsupported log compression codec %q", opts.Codec)
+}
+
+// ListBackups returns the rotated log files of the log file sorted from
+// the newest to the oldest.
+func ListBackups(filename string) ([]Backup, error) {
+	ext := filepath.Ext(filename)
+	prefix := filepath.Base(strings.TrimSuffix(filename, ext)) + "-"
+	dir := filepath.Dir(filename)
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		return nil, err
+	}
+
+	backups := []Backup{}
+	for _, entry := range entries {
+		name := entry.Name()
+		compressed := strings.HasSuffix(name, compressedExt)
+		baseName := strings.TrimSuffix(name, compressedExt)
+		if entry.IsDir() || !strings.HasPrefix(baseName, prefix) ||
+			!strings.HasSuffix(baseName, ext) {
+			continue
+		}
+		timestamp := strings.TrimSuffix(strings.TrimPrefix(baseName, prefix), ext)
+		rotationTime, err := time.ParseInLocation(backupTimeFormat, timestamp, time.Local)
+		if err != nil {
+			continue
+		}
+		info, err := entry.Info()
+		if err != nil {
+			// The file has been removed.
+			continue
+		}
+		backups = append(backups, Backup{
+			Path:         filepath.Join(dir, name),
+			RotationTime: rotationTime,
+			Size:         info.Size(),
+			Compressed:   compressed,
+		})
+	}
+
+	sort.Slice(backups, func(i, j int) bool {
+		return backups[i].RotationTime.After(backups[j].RotationTime)
+	})
+	return backups, nil
+}
+
+// compressFile compresses the file with gzip and removes the original. The
+// compressed file is written to a temporary file first, so a partially
+// compressed file is never left under the final name.
+func compressFile(path string, level int) error {
+	if level == 0 {
+		level = gzip.DefaultCompression
+	}
+
+	src, err := os.Open(path)
+	if err != nil {
+		return err
+	}
+	defer src.Close()
+
+	info, err := src.Stat()
+	if err != nil {
+		return err
+	}
+	tmpPath := path + compressedExt + ".tmp"
+	dst, err := os.OpenFile(tmpPath, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, info.Mode())
+	if err != nil {
+		return err
+	}
+	defer os.Remove(tmpPath)
+
+	gzWriter, err := gzip.NewWriterLevel(dst, level)
+	if err != nil {
+		dst.Close()
+		return err
+	}
+	if _, err = io.Copy(gzWriter, src); err == nil {
+		err = gzWriter.Close()
+	}
+	if closeErr := dst.Close(); err == nil {
+		err = closeErr
+	}
+	if err != nil {
+		return err
+	}
+
+	if err = os.Rename(tmpPath, path+compressedExt); err != nil {
+		return err
+	}
+	return os.Remove(path)
+}
+
+// CompressFiles compresses the files in the background priority by
+// opts.Jobs workers. The errors of all the failed files are returned.
+// The priority of the whole process could be lowered on some platforms,
+// so it is called by the compression worker process of tt logrotate.
+func CompressFiles(paths []string, opts CompressOpts) []error {
+	if opts.Codec == CompressNone || len(paths) == 0 {
+		return nil
+	}
+	jobs := opts.Jobs
+	if jobs < 1 {
+		jobs = 1
+	}
+	if jobs > len(paths) {
+		jobs = len(paths)
+	}
+
+	pathsCh := make(chan string)
+	errs := []error{}
+	var errsMutex sync.Mutex
+	var wg sync.WaitGroup
+	for i := 0; i < jobs; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			// The priority is set for the thread. The thread is not unlocked,
+			// so it is terminated with the goroutine and the lowered priority
+			// does not affect other goroutines.
+			runtime.LockOSThread()
+			setBackgroundPriority()
+			for path := range pathsCh {
+				if err := compressFile(path, opts.Level); err != nil {
+					errsMutex.Lock()
+					errs = append(errs, fmt.Errorf("failed to compress %q: %s", path, err))
+					errsMutex.Unlock()
+				}
+			}
+		}()
+	}
+	for _, path := range paths {
+		pathsCh <- path
+	}
+	close(pathsCh)
+	wg.Wait()
+
+	return errs
+}
+
+// RemoveExceedingBackups removes the oldest backups until the total size
+// of the remaining ones does not exceed maxTotalSize bytes. The backups
+// could belong to different log files. Returns the removed files.
+func RemoveExceedingBackups(backups []Backup, maxTotalSize int64) ([]string, error) {
+	if maxTotalSize <= 0 {
+		return nil, nil
+	}
+
+	var totalSize int64
+	for _, backup := range backups {
+		totalSize += backup.Size
+	}
+	if totalSize <= maxTotalSize {
+		return nil, nil
+	}
+
+	sorted := make([]Backup, len(backups))
+	copy(sorted, backups)
+	sort.SliceStable(sorted, func(i, j int) bool {
+		return sorted[i].RotationTime.Before(sorted[j].RotationTime)
+	})
+	removed := []string{}
+	for _, backup := range sorted {
+		if totalSize <= maxTotalSize {
+			break
+		}
+		if err := os.Remove(backup.Path); err != nil && !os.IsNotExist(err) {
+			return removed, err
+		}
+		totalSize -= backup.Size
+		removed = append(removed, backup.Path)
+	}
+	return removed, nil
+}
@@ -0,0 +1,97 @@
+package ttlog
+
+import (
+	"compress/gzip"
+	"io"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+// writeBackup creates a rotated log file of the log file with the content.
+func writeBackup(t *testing.T, filename string, rotationTime time.Time, content string) string {
+	path := backupName(filename, rotationTime)
+	require.NoError(t, os.WriteFile(path, []byte(content), 0644))
+	return path
+}
+
+func TestValidateCompressOpts(t *testing.T) {
+	assert.NoError(t, ValidateCompressOpts(CompressOpts{}))
+	assert.NoError(t, ValidateCompressOpts(CompressOpts{Codec: CompressGzip}))
+	assert.NoError(t, ValidateCompressOpts(CompressOpts{Codec: CompressGzip, Level: 9}))
+	assert.Error(t, ValidateCompressOpts(CompressOpts{Codec: CompressGzip, Level: 10}))
+	assert.Error(t, ValidateCompressOpts(CompressOpts{Codec: "zip"}))
+}
+
+func TestCompressFiles(t *testing.T) {
+	dir := t.TempDir()
+	fileName := filepath.Join(dir, "test.log")
+	now := time.Now()
+
+	older := writeBackup(t, fileName, now.Add(-time.Hour), "older")
+	newer := writeBackup(t, fileName, now.Add(-time.Minute), "newer")
+	require.NoError(t, os.WriteFile(fileName, []byte("current"), 0644))
+	require.NoError(t, os.WriteFile(filepath.Join(dir, "other.log"), []byte("other"), 0644))
+
+	backups, err := ListBackups(fileName)
+	require.NoError(t, err)
+	require.Len(t, backups, 2)
+	assert.Equal(t, newer, backups[0].Path)
+	assert.Equal(t, older, backups[1].Path)
+	assert.False(t, backups[0].Compressed)
+
+	errs := CompressFiles([]string{older, newer},
+		CompressOpts{Codec: CompressGzip, Level: 1, Jobs: 2})
+	require.Empty(t, errs)
+
+	backups, err = ListBackups(fileName)
+	require.NoError(t, err)
+	require.Len(t, backups, 2)
+	assert.Equal(t, newer+compressedExt, backups[0].Path)
+	assert.True(t, backups[0].Compressed)
+	assert.NoFileExists(t, newer)
+
+	file, err := os.Open(older + compressedExt)
+	require.NoError(t, err)
+	defer file.Close()
+	reader, err := gzip.NewReader(file)
+	require.NoError(t, err)
+	content, err := io.ReadAll(reader)
+	require.NoError(t, err)
+	assert.Equal(t, "older", string(content))
+
+	errs = CompressFiles([]string{filepath.Join(dir, "missing.log")},
+		CompressOpts{Codec: CompressGzip})
+	assert.Len(t, errs, 1)
+}
+
+func TestRemoveExceedingBackups(t *testing.T) {
+	dir := t.TempDir()
+	now := time.Now()
+
+	first := writeBackup(t, filepath.Join(dir, "first.log"), now.Add(-3*time.Hour), "12345")
+	second := writeBackup(t, filepath.Join(dir, "second.log"), now.Add(-2*time.Hour), "12345")
+	third := writeBackup(t, filepath.Join(dir, "first.log"), now.Add(-time.Hour), "12345")
+
+	backups := []Backup{}
+	for _, name := range []string{"first.log", "second.log"} {
+		fileBackups, err := ListBackups(filepath.Join(dir, name))
+		require.NoError(t, err)
+		backups = append(backups, fileBackups...)
+	}
+
+	removed, err := RemoveExceedingBackups(backups, 0)
+	require.NoError(t, err)
+	assert.Empty(t, removed)
+
+	removed, err = RemoveExceedingBackups(backups, 10)
+	require.NoError(t, err)
+	assert.Equal(t, []string{first}, removed)
+	assert.NoFileExists(t, first)
+	assert.FileExists(t, second)
+	assert.FileExists(t, third)
+}
@@ -1,12 +1,22 @@
 package ttlog
 
 import (
+	"fmt"
 	"io"
 	"log"
+	"os"
+	"path/filepath"
+	"strings"
+	"sync"
+	"time"
 
 	"gopkg.in/natefinch/lumberjack.v2"
 )
 
+// backupTimeFormat is the time format used in the names of rotated log files.
+// It is the same as lumberjack uses.
+const backupTimeFormat = "2006-01-02T15-04-05.000"
+
 // LoggerOpts describes the logger options.
 type LoggerOpts struct {
 	// Filename is the name of log file.
@@ -19,6 +29,10 @@ type LoggerOpts struct {
 	// MaxAge is the maximum number of days to retain old log files
 	// based on the timestamp encoded in their filename.
 	MaxAge int
+	// Passthrough enables writing directly to the log file. The file
+	// could be passed to child processes as is. The file is rotated
+	// on Rotate call only, MaxSize is not used.
+	Passthrough bool
 }
 
 // Logger represents an active logging object.
@@ -31,12 +45,35 @@ type Logger struct {
 	// ljLogger is an io.WriteCloser that writes to the specified filename.
 	// Used to add logrotate functionality to log.Logger.
 	ljLogger *lumberjack.Logger
+	// passthrough is true if the logger writes directly to the log file.
+	// It is set on creation only, so it is read without the lock.
+	passthrough bool
+	// file is the log file opened in the passthrough mode.
+	file *os.File
+	// fileMutex protects file from a race condition on the file rotation.
+	fileMutex sync.Mutex
 	// opts describes the parameters that were used to create the logger.
 	opts *LoggerOpts
 }
 
+// openLogFile opens the log file for appending.
+func openLogFile(filename string) (*os.File, error) {
+	if err := os.MkdirAll(filepath.Dir(filename), 0755); err != nil {
+		return nil, err
+	}
+	return os.OpenFile(filename, os.O_WRONLY|os.O_CREATE|os.O_APPEND, 0644)
+}
+
 // NewLogger creates a new object of Logger.
 func NewLogger(opts *LoggerOpts) *Logger {
+	if opts.Passthrough {
+		if file, err := openLogFile(opts.Filename); err == nil {
+			return &Logger{Logger: log.New(file, "", log.Flags()), passthrough: true,
+				file: file, opts: opts}
+		}
+		// Fallback to the rotated logger, it reports the open error on write.
+	}
+
 	ljLogger := &lumberjack.Logger{
 		Filename:   opts.Filename,
 		MaxSize:    opts.MaxSize,
@@ -55,10 +92,18 @@ func NewCustomLogger(writer io.Writer, prefix string, flags int) *Logger {
 	return &Logger{Logger: log.New(writer, "", flags), ljLogger: nil}
 }
 
+// IsPassthrough returns true if the logger writes directly to the log file.
+func (logger *Logger) IsPassthrough() bool {
+	return logger.passthrough
+}
+
 // Rotate causes Logger to close the existing log file and immediately create a
 // new one. After rotating, this initiates compression and removal of old log
 // files according to the configuration.
 func (logger *Logger) Rotate() error {
+	if logger.passthrough {
+		return logger.rotateFile()
+	}
 	if logger.ljLogger == nil {
 		return nil
 	}
@@ -66,6 +111,59 @@ func (logger *Logger) Rotate() error {
 	return logger.ljLogger.Rotate()
 }
 
+// backupName returns the name of the rotated log file.
+func backupName(filename string, rotationTime time.Time) string {
+	ext := filepath.Ext(filename)
+	prefix := strings.TrimSuffix(filename, ext)
+	return fmt.Sprintf("%s-%s%s", prefix, rotationTime.Format(backupTimeFormat), ext)
+}
+
+// rotateFile renames the log file of the passthrough mode to the backup name
+// and opens a new one. The processes the old file is passed to continue to
+// write to the backup until they reopen the log file.
+func (logger *Logger) rotateFile() error {
+	logger.fileMutex.Lock()
+	defer logger.fileMutex.Unlock()
+
+	filename := logger.opts.Filename
+	err := os.Rename(filename, backupName(filename, time.Now()))
+	if err != nil && !os.IsNotExist(err) {
+		return err
+	}
+
+	file, err := openLogFile(filename)
+	if err != nil {
+		return err
+	}
+	logger.SetOutput(file)
+	logger.file.Close()
+	logger.file = file
+
+	return logger.removeOldBackups()
+}
+
+// removeOldBackups removes the rotated log files according to MaxBackups
+// and MaxAge options.
+func (logger *Logger) removeOldBackups() error {
+	if logger.opts.MaxBackups <= 0 && logger.opts.MaxAge <= 0 {
+		return nil
+	}
+
+	// The newest backups go first.
+	backups, err := ListBackups(logger.opts.Filename)
+	if err != nil {
+		return err
+	}
+	cutoff := time.Now().Add(-time.Duration(logger.opts.MaxAge) * 24 * time.Hour)
+	for i, backup := range backups {
+		if (logger.opts.MaxBackups > 0 && i >= logger.opts.MaxBackups) ||
+			(logger.opts.MaxAge > 0 && backup.RotationTime.Before(cutoff)) {
+			os.Remove(backup.Path)
+		}
+	}
+	return nil
+}
+
 // GetOpts returns the parameters that were used to create the logger.
 func (logger *Logger) GetOpts() *LoggerOpts {
 	return logger.opts
@@ -73,6 +171,11 @@ func (logger *Logger) GetOpts() *LoggerOpts {
 
 // Close implements io.Closer, and closes the current logfile.
 func (logger *Logger) Close() error {
+	if logger.passthrough {
+		logger.fileMutex.Lock()
+		defer logger.fileMutex.Unlock()
+		return logger.file.Close()
+	}
 	if logger.ljLogger == nil {
 		return nil
 	}
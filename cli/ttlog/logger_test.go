@@ -3,9 +3,12 @@ package ttlog
 import (
 	"os"
 	"path/filepath"
+	"sync"
 	"testing"
+	"time"
 
 	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
 )
 
 // cleanupLog clean all log files with the temporary directory.
@@ -50,3 +53,71 @@ func TestLoggerBase(t *testing.T) {
 	files, err = os.ReadDir(dir)
 	assert.Equal(len(files), 2)
 }
+
+func TestLoggerPassthrough(t *testing.T) {
+	dir := t.TempDir()
+	fileName := filepath.Join(dir, "test.log")
+
+	opts := LoggerOpts{
+		Filename:    fileName,
+		MaxBackups:  2,
+		Passthrough: true,
+	}
+	logger := NewLogger(&opts)
+	defer logger.Close()
+	require.True(t, logger.IsPassthrough())
+
+	// The log file could be passed to a child process as is.
+	file, ok := logger.Writer().(*os.File)
+	require.True(t, ok)
+	assert.Equal(t, fileName, file.Name())
+
+	logger.Printf("Test msg")
+	files, err := os.ReadDir(dir)
+	require.NoError(t, err)
+	assert.Len(t, files, 1)
+
+	// The old log files are removed according to MaxBackups.
+	for i := 0; i < 3; i++ {
+		require.NoError(t, logger.Rotate())
+		logger.Printf("Test msg %d", i)
+		// The backup names contain the rotation time with milliseconds.
+		time.Sleep(10 * time.Millisecond)
+	}
+	files, err = os.ReadDir(dir)
+	require.NoError(t, err)
+	assert.Len(t, files, 3)
+
+	content, err := os.ReadFile(fileName)
+	require.NoError(t, err)
+	assert.Contains(t, string(content), "Test msg 2")
+	assert.NotContains(t, string(content), "Test msg 1")
+}
+
+func TestLoggerPassthroughConcurrentRotate(t *testing.T) {
+	dir := t.TempDir()
+	opts := LoggerOpts{
+		Filename:    filepath.Join(dir, "test.log"),
+		Passthrough: true,
+	}
+	logger := NewLogger(&opts)
+
+	// The passthrough mode is checked while the file is rotated.
+	var wg sync.WaitGroup
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		for i := 0; i < 10; i++ {
+			assert.NoError(t, logger.Rotate())
+		}
+	}()
+	go func() {
+		defer wg.Done()
+		for i := 0; i < 10; i++ {
+			assert.True(t, logger.IsPassthrough())
+			logger.Printf("Test msg %d", i)
+		}
+	}()
+	wg.Wait()
+	require.NoError(t, logger.Close())
+}
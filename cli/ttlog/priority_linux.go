@@ -0,0 +1,26 @@
+//go:build linux
+
+package ttlog
+
+import (
+	"golang.org/x/sys/unix"
+)
+
+const (
+	// ioprioWhoProcess is IOPRIO_WHO_PROCESS, with zero ID it means the
+	// calling thread.
+	ioprioWhoProcess = 1
+	// ioprioIdle is IOPRIO_CLASS_IDLE shifted to the class bits. A thread
+	// of the idle class gets disk time only when no other thread needs it.
+	ioprioIdle = 3 << 13
+	// backgroundNice is the CPU niceness of the background work.
+	backgroundNice = 19
+)
+
+// setBackgroundPriority lowers the CPU and I/O priorities of the calling
+// thread, so the background work does not compete with instances.
+func setBackgroundPriority() {
+	// Errors are ignored, the work is done with the default priority.
+	unix.Setpriority(unix.PRIO_PROCESS, 0, backgroundNice)
+	unix.Syscall(unix.SYS_IOPRIO_SET, ioprioWhoProcess, 0, ioprioIdle)
+}
@@ -0,0 +1,19 @@
+//go:build !linux
+
+package ttlog
+
+import (
+	"syscall"
+)
+
+// backgroundNice is the CPU niceness of the background work.
+const backgroundNice = 19
+
+// setBackgroundPriority lowers the CPU priority of the calling process,
+// so the background work does not compete with instances. The priority of
+// a thread can't be set here, so the whole process is affected: it must be
+// called by a dedicated worker process only.
+func setBackgroundPriority() {
+	// Errors are ignored, the work is done with the default priority.
+	syscall.Setpriority(syscall.PRIO_PROCESS, 0, backgroundNice)
+}
@@ -0,0 +1,57 @@
+package util
+
+import (
+	"os"
+	"syscall"
+)
+
+// FileSignature identifies the state of a file. If a file is replaced or
+// modified, its signature changes.
+type FileSignature struct {
+	// Exists is true if the file exists.
+	Exists bool
+	// Inode is the file inode number.
+	Inode uint64
+	// ModTime is the modification time of the file in nanoseconds.
+	ModTime int64
+	// Size is the file size in bytes.
+	Size int64
+}
+
+// GetFileSignature returns the signature of the file. The signature of a
+// missing file is returned for the file that can't be accessed.
+func GetFileSignature(path string) FileSignature {
+	info, err := os.Stat(path)
+	if err != nil {
+		return FileSignature{}
+	}
+
+	signature := FileSignature{Exists: true, ModTime: info.ModTime().UnixNano(),
+		Size: info.Size()}
+	if stat, ok := info.Sys().(*syscall.Stat_t); ok {
+		signature.Inode = uint64(stat.Ino)
+	}
+	return signature
+}
+
+// GetFileSignatures returns the signatures of the files.
+func GetFileSignatures(paths []string) []FileSignature {
+	signatures := make([]FileSignature, len(paths))
+	for i, path := range paths {
+		signatures[i] = GetFileSignature(path)
+	}
+	return signatures
+}
+
+// FileSignaturesEqual checks if the files signatures are the same.
+func FileSignaturesEqual(first []FileSignature, second []FileSignature) bool {
+	if len(first) != len(second) {
+		return false
+	}
+	for i := range first {
+		if first[i] != second[i] {
+			return false
+		}
+	}
+	return true
+}
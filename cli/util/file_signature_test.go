@@ -0,0 +1,52 @@
+package util
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestGetFileSignature(t *testing.T) {
+	tempDir := t.TempDir()
+	filePath := filepath.Join(tempDir, "tt.yaml")
+
+	missing := GetFileSignature(filePath)
+	assert.False(t, missing.Exists)
+
+	require.NoError(t, os.WriteFile(filePath, []byte("tt:\n"), 0644))
+	created := GetFileSignature(filePath)
+	assert.True(t, created.Exists)
+	assert.Equal(t, int64(4), created.Size)
+	assert.Equal(t, created, GetFileSignature(filePath))
+
+	// Modification time change.
+	modTime := time.Now().Add(time.Hour)
+	require.NoError(t, os.Chtimes(filePath, modTime, modTime))
+	touched := GetFileSignature(filePath)
+	assert.NotEqual(t, created, touched)
+
+	// The file is replaced with a new one with the same attributes.
+	newFilePath := filepath.Join(tempDir, "tt.yaml.new")
+	require.NoError(t, os.WriteFile(newFilePath, []byte("tt:\n"), 0644))
+	require.NoError(t, os.Chtimes(newFilePath, modTime, modTime))
+	require.NoError(t, os.Rename(newFilePath, filePath))
+	replaced := GetFileSignature(filePath)
+	assert.NotEqual(t, touched.Inode, replaced.Inode)
+	assert.False(t, FileSignaturesEqual([]FileSignature{touched}, []FileSignature{replaced}))
+}
+
+func TestFileSignaturesEqual(t *testing.T) {
+	tempDir := t.TempDir()
+	paths := []string{tempDir, filepath.Join(tempDir, "instances.yml")}
+
+	signatures := GetFileSignatures(paths)
+	assert.True(t, FileSignaturesEqual(signatures, GetFileSignatures(paths)))
+	assert.False(t, FileSignaturesEqual(signatures, signatures[:1]))
+
+	require.NoError(t, os.WriteFile(paths[1], []byte("inst:\n"), 0644))
+	assert.False(t, FileSignaturesEqual(signatures, GetFileSignatures(paths)))
+}
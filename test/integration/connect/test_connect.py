@@ -477,6 +477,51 @@ def test_connect_to_multi_instances_app_credentials(tt_cmd, tmpdir_with_cfg):
     stop_app(tt_cmd, tmpdir, app_name)
 
 
+def test_connect_all_multi_instances_app(tt_cmd, tmpdir_with_cfg):
+    tmpdir = tmpdir_with_cfg
+    instances = ['master', 'replica', 'router']
+    app_name = "test_multi_app"
+    lua_file = "hello.lua"
+    # Copy the test application to the "run" directory.
+    test_app_path = os.path.join(os.path.dirname(__file__), app_name)
+    tmp_app_path = os.path.join(tmpdir, app_name)
+    shutil.copytree(test_app_path, tmp_app_path)
+    # The test file.
+    lua_file_path = os.path.join(os.path.dirname(__file__), "test_file", lua_file)
+    # Copy test data into temporary directory.
+    copy_data(tmpdir, [lua_file_path])
+
+    # Start instances.
+    start_app(tt_cmd, tmpdir, app_name)
+
+    # Check for start.
+    for instance in instances:
+        master_run_path = os.path.join(tmpdir, run_path, app_name, instance)
+        file = wait_file(master_run_path, instance + ".control", [])
+        assert file != ""
+
+    # Execute on all instances of the application.
+    ret, output = try_execute_on_instance(tt_cmd, tmpdir, "--all", lua_file,
+                                          args=[app_name])
+    assert ret
+    for instance in instances:
+        assert re.search(app_name + ":" + instance + r":\n---\n- Hello, world!\n...", output)
+
+    # An instance is specified twice.
+    ret, output = try_execute_on_instance(tt_cmd, tmpdir, "--all", lua_file,
+                                          args=[app_name, app_name + ":master"])
+    assert ret
+    assert output.count(app_name + ":master:") == 1
+
+    # The script is required.
+    ret, output = try_execute_on_instance(tt_cmd, tmpdir, "--all", args=[app_name])
+    assert not ret
+    assert re.search(r"   ⨯ --all requires a script to be specified with -f", output)
+
+    # Stop the Instance.
+    stop_app(tt_cmd, tmpdir, app_name)
+
+
 def test_connect_language_default_lua(tt_cmd, tmpdir_with_cfg):
     tmpdir = tmpdir_with_cfg
     test_app, lua_file, sql_file = prepare_test_app_languages(tt_cmd, tmpdir)
@@ -0,0 +1,7 @@
+local fiber = require('fiber')
+
+box.cfg{}
+
+while true do
+    fiber.sleep(5)
+end
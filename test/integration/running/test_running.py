@@ -1,3 +1,4 @@
+import json
 import os
 import re
 import shutil
@@ -621,3 +622,223 @@ def test_running_tarantoolctl_layout(tt_cmd, tmpdir):
     # Check that the process was terminated correctly.
     instance_process_rc = instance_process.wait(1)
     assert instance_process_rc == 0
+
+
+def test_running_start_wait(tt_cmd):
+    test_app_path_src = os.path.join(os.path.dirname(__file__), "multi_inst_app")
+
+    # Default temporary directory may have very long path. This can cause socket path buffer
+    # overflow. Create our own temporary directory.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        test_app_path = os.path.join(tmpdir, "app")
+        shutil.copytree(test_app_path_src, test_app_path)
+
+        # Start all instances concurrently and wait for them to become ready.
+        start_cmd = [tt_cmd, "start", "--jobs", "0", "--wait", "app"]
+        start_rc, start_out = run_command_and_get_output(start_cmd, cwd=test_app_path)
+        assert start_rc == 0
+        for inst in ["master", "replica", "router"]:
+            assert re.search(r"Starting an instance \[app:" + inst + r"\]", start_out)
+            assert re.search(r"The instance app:" + inst + r" is ready \(.+\)\.", start_out)
+            assert os.path.exists(os.path.join(test_app_path, run_path, "app", inst,
+                                               inst + ".control"))
+
+        status_cmd = [tt_cmd, "status", "app"]
+        status_rc, status_out = run_command_and_get_output(status_cmd, cwd=test_app_path)
+        assert status_rc == 0
+        assert len(re.findall(r"RUNNING. PID: \d+.", status_out)) == 3
+
+        # Stop the application.
+        stop_cmd = [tt_cmd, "stop", "app"]
+        stop_rc, stop_out = run_command_and_get_output(stop_cmd, cwd=test_app_path)
+        assert stop_rc == 0
+        assert len(re.findall(r"The Instance app:(router|master|replica) \(PID = \d+\) "
+                              r"has been terminated.", stop_out)) == 3
+
+
+def test_running_start_supervisor(tt_cmd):
+    test_app_path_src = os.path.join(os.path.dirname(__file__), "multi_inst_app")
+
+    # Default temporary directory may have very long path. This can cause socket path buffer
+    # overflow. Create our own temporary directory.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        test_app_path = os.path.join(tmpdir, "app")
+        shutil.copytree(test_app_path_src, test_app_path)
+
+        # Start all instances under a single supervisor process.
+        start_cmd = [tt_cmd, "start", "--supervisor", "--wait", "app"]
+        start_rc, start_out = run_command_and_get_output(start_cmd, cwd=test_app_path)
+        assert start_rc == 0
+        assert re.search(r"Starting a supervisor for 3 instance\(s\)", start_out)
+        for inst in ["master", "replica", "router"]:
+            assert re.search(r"The instance app:" + inst + r" is ready \(.+\)\.", start_out)
+
+        # All the instances share the supervisor PID.
+        status_cmd = [tt_cmd, "status", "app"]
+        status_rc, status_out = run_command_and_get_output(status_cmd, cwd=test_app_path)
+        assert status_rc == 0
+        pids = re.findall(r"RUNNING. PID: (\d+).", status_out)
+        assert len(pids) == 3
+        assert len(set(pids)) == 1
+
+        # Stop a single instance, the others keep running.
+        stop_cmd = [tt_cmd, "stop", "app:router"]
+        stop_rc, stop_out = run_command_and_get_output(stop_cmd, cwd=test_app_path)
+        assert stop_rc == 0
+        assert re.search(r"The Instance app:router \(PID = \d+\) has been terminated.", stop_out)
+
+        status_rc, status_out = run_command_and_get_output(status_cmd, cwd=test_app_path)
+        assert status_rc == 0
+        assert re.search(r"app:router: NOT RUNNING.", status_out)
+        assert len(re.findall(r"RUNNING. PID: \d+.", status_out)) == 2
+
+        # Stop the rest of the application.
+        stop_cmd = [tt_cmd, "stop", "app"]
+        stop_rc, stop_out = run_command_and_get_output(stop_cmd, cwd=test_app_path)
+        assert stop_rc == 0
+        assert len(re.findall(r"The Instance app:(master|replica) \(PID = \d+\) "
+                              r"has been terminated.", stop_out)) == 2
+
+
+def test_running_status_json(tt_cmd):
+    test_app_path_src = os.path.join(os.path.dirname(__file__), "multi_inst_app")
+
+    # Default temporary directory may have very long path. This can cause socket path buffer
+    # overflow. Create our own temporary directory.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        test_app_path = os.path.join(tmpdir, "app")
+        shutil.copytree(test_app_path_src, test_app_path)
+
+        start_cmd = [tt_cmd, "start", "--jobs", "0", "--wait", "app"]
+        start_rc, _ = run_command_and_get_output(start_cmd, cwd=test_app_path)
+        assert start_rc == 0
+
+        status_cmd = [tt_cmd, "status", "--json", "app"]
+        status_rc, status_out = run_command_and_get_output(status_cmd, cwd=test_app_path)
+        assert status_rc == 0
+        statuses = json.loads(status_out)
+        assert len(statuses) == 3
+        for status in statuses:
+            assert status["name"] in ["app:master", "app:replica", "app:router"]
+            assert status["status"] == "RUNNING"
+            assert status["watchdog_pid"] > 0
+            assert status["tarantool_pid"] > 0
+            assert status["tarantool_pid"] != status["watchdog_pid"]
+            assert status["rss"] > 0
+            assert status["threads"] > 0
+            assert status["restarts"] == 0
+
+        status_cmd = [tt_cmd, "status", "--details", "app"]
+        status_rc, status_out = run_command_and_get_output(status_cmd, cwd=test_app_path)
+        assert status_rc == 0
+        assert re.search(r"INSTANCE\s+STATUS\s+PID\s+TARANTOOL PID", status_out)
+        assert len(re.findall(r"app:(master|replica|router)\s+RUNNING\s+\d+\s+\d+",
+                              status_out)) == 3
+
+        stop_cmd = [tt_cmd, "stop", "app"]
+        stop_rc, _ = run_command_and_get_output(stop_cmd, cwd=test_app_path)
+        assert stop_rc == 0
+
+        status_cmd = [tt_cmd, "status", "--json", "app"]
+        status_rc, status_out = run_command_and_get_output(status_cmd, cwd=test_app_path)
+        assert status_rc == 0
+        for status in json.loads(status_out):
+            assert status["status"] == "NOT RUNNING"
+
+
+def test_running_log(tt_cmd, tmpdir_with_cfg):
+    tmpdir = tmpdir_with_cfg
+    test_app_path = os.path.join(os.path.dirname(__file__), "test_app", "test_app.lua")
+    shutil.copy(test_app_path, tmpdir)
+
+    # The log is not required to belong to a running instance.
+    logfile = os.path.join(tmpdir, log_path, "test_app", "test_app.log")
+    os.makedirs(os.path.dirname(logfile))
+    with open(logfile, "w") as f:
+        f.write("2023-03-27 12:00:00.000 first\n"
+                "2023-03-27 12:00:01.000 second\n"
+                "2023-03-27 12:00:02.000 third\n")
+
+    log_cmd = [tt_cmd, "log", "-n", "2", "test_app"]
+    log_rc, log_out = run_command_and_get_output(log_cmd, cwd=tmpdir)
+    assert log_rc == 0
+    assert log_out == ("test_app: 2023-03-27 12:00:01.000 second\n"
+                       "test_app: 2023-03-27 12:00:02.000 third\n")
+
+    rotated = os.path.join(tmpdir, log_path, "test_app", "test_app-2023-03-27T00-00-00.000.log")
+    with open(rotated, "w") as f:
+        f.write("2023-03-26 12:00:00.000 rotated\n")
+
+    grep_cmd = [tt_cmd, "log", "grep", "(rotated|second)", "test_app"]
+    grep_rc, grep_out = run_command_and_get_output(grep_cmd, cwd=tmpdir)
+    assert grep_rc == 0
+    assert sorted(grep_out.splitlines()) == ["test_app: 2023-03-26 12:00:00.000 rotated",
+                                             "test_app: 2023-03-27 12:00:01.000 second"]
+
+    grep_cmd = [tt_cmd, "log", "grep", "--since", "2023-03-27 00:00:00", ".", "test_app"]
+    grep_rc, grep_out = run_command_and_get_output(grep_cmd, cwd=tmpdir)
+    assert grep_rc == 0
+    assert "rotated" not in grep_out
+    assert len(grep_out.splitlines()) == 3
+
+
+def test_running_restart_rolling(tt_cmd):
+    test_app_path_src = os.path.join(os.path.dirname(__file__), "box_app", "box_app.lua")
+
+    # Default temporary directory may have very long path. This can cause socket path buffer
+    # overflow. Create our own temporary directory.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        shutil.copy(test_app_path_src, tmpdir)
+
+        start_cmd = [tt_cmd, "start", "--wait", "box_app"]
+        start_rc, _ = run_command_and_get_output(start_cmd, cwd=tmpdir)
+        assert start_rc == 0
+
+        status_cmd = [tt_cmd, "status", "box_app"]
+        status_rc, status_out = run_command_and_get_output(status_cmd, cwd=tmpdir)
+        assert status_rc == 0
+        old_pid = re.search(r"RUNNING. PID: (\d+).", status_out).group(1)
+
+        restart_cmd = [tt_cmd, "restart", "-y", "--rolling", "box_app"]
+        restart_rc, restart_out = run_command_and_get_output(restart_cmd, cwd=tmpdir)
+        assert restart_rc == 0
+        assert re.search(r"The Instance box_app \(PID = \d+\) has been terminated.", restart_out)
+        assert re.search(r"The instance box_app is running \(.+\)\.", restart_out)
+
+        status_rc, status_out = run_command_and_get_output(status_cmd, cwd=tmpdir)
+        assert status_rc == 0
+        new_pid = re.search(r"RUNNING. PID: (\d+).", status_out).group(1)
+        assert new_pid != old_pid
+
+        stop_cmd = [tt_cmd, "stop", "box_app"]
+        stop_rc, _ = run_command_and_get_output(stop_cmd, cwd=tmpdir)
+        assert stop_rc == 0
+
+
+def test_running_start_timings(tt_cmd):
+    test_app_path_src = os.path.join(os.path.dirname(__file__), "box_app", "box_app.lua")
+
+    # Default temporary directory may have very long path. This can cause socket path buffer
+    # overflow. Create our own temporary directory.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        shutil.copy(test_app_path_src, tmpdir)
+
+        start_cmd = [tt_cmd, "start", "--timings", "box_app"]
+        start_rc, start_out = run_command_and_get_output(start_cmd, cwd=tmpdir)
+        assert start_rc == 0
+        assert "Startup timings of the instance box_app:" in start_out
+        for phase in ["tt config", "watchdog start", "tarantool start", "box.cfg finish",
+                      "total"]:
+            assert re.search(phase + r"\s+\d", start_out)
+
+        # The timings are kept in the history to compare the startups.
+        history_path = os.path.join(tmpdir, log_path, "box_app", "box_app.timings.jsonl")
+        with open(history_path) as history_file:
+            history = [json.loads(line) for line in history_file]
+        assert len(history) == 1
+        assert history[0]["instance"] == "box_app"
+        assert history[0]["total"] > 0
+
+        stop_cmd = [tt_cmd, "stop", "box_app"]
+        stop_rc, _ = run_command_and_get_output(stop_cmd, cwd=tmpdir)
+        assert stop_rc == 0